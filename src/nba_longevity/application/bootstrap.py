@@ -1,17 +1,105 @@
+"""
+APPLICATION BOOTSTRAP
+=====================
+
+Responsibilities
+----------------
+- Single source of truth for the infrastructure configuration
+- Single global logger, configured from that configuration
+
+Rules
+-----
+- Importing this module has no side effect: no file read, no
+  validation, no directory creation, no logging sink
+- The configuration is loaded on first access (`get_config()` or the
+  `config` attribute); the logger is configured on its first call
+- Config path: `NBA_LONGEVITY_CONFIG` environment variable, otherwise
+  `<repository root>/config/infra.yaml`; the training and model configs
+  (train.yaml, model/<type>.yml) are read from the same directory
+"""
+
+from __future__ import annotations
+
+import os
+import threading
 from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from nba_longevity.infrastructure.config.settings import InfraConfig
+
+
+CONFIG_ENV_VAR = "NBA_LONGEVITY_CONFIG"
+
+_config: InfraConfig | None = None
+_logger: Any = None
+_lock = threading.RLock()
+
+
+def config_path() -> Path:
+    """
+    Chemin du fichier infra.yaml (variable d'environnement ou racine du dépôt).
+    """
+    path = os.getenv(CONFIG_ENV_VAR)
+    if path:
+        return Path(path)
+
+    from nba_longevity.infrastructure.system_utils.root_finder import get_repository_root
+
+    return get_repository_root() / "config" / "infra.yaml"
+
+
+def config_dir() -> Path:
+    """
+    Répertoire de configuration (train.yaml, model/<type>.yml), celui
+    de infra.yaml.
+    """
+    return config_path().parent
+
+
+def get_config() -> InfraConfig:
+    """
+    Configuration infra, chargée et validée au premier appel.
+    """
+    global _config
+    if _config is None:
+        with _lock:
+            if _config is None:
+                from nba_longevity.infrastructure.config.settings import load_infra_config
+
+                _config = load_infra_config(config_path())
+    return _config
+
+
+def get_logger():
+    """
+    Logger global, configuré (sinks console + fichier) au premier appel.
+    """
+    global _logger
+    if _logger is None:
+        with _lock:
+            if _logger is None:
+                from nba_longevity.infrastructure.logging.logger import setup_logger
+
+                _logger = setup_logger(get_config())
+    return _logger
+
+
+class _LazyLogger:
+    """
+    Proxy du logger global : `app_logger.info(...)` configure le logger
+    au premier message seulement.
+    """
 
-from nba_longevity.infrastructure.config.settings import load_infra_config
-from nba_longevity.infrastructure.logging.logger import setup_logger
-from nba_longevity.infrastructure.config.settings import InfraConfig
+    def __getattr__(self, name: str) -> Any:
+        return getattr(get_logger(), name)
 
-# Path infrastructure
-PATH = "/Users/surelmanda/Downloads/nba-career-longevity-mlops/config/infra.yaml"
 
-# Single source of truth
-CONFIG_PATH_INFRA = Path(PATH)
+app_logger = _LazyLogger()
 
-# Load infrastructure configuration
-config: InfraConfig = load_infra_config(CONFIG_PATH_INFRA)
 
-# Initialize global logger ONCE
-app_logger = setup_logger(config)
+def __getattr__(name: str) -> Any:
+    # `from ...bootstrap import config` reste supporté (chargement à l'accès)
+    if name == "config":
+        return get_config()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,146 @@
+import argparse
+import json
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+# 🔹 Logger
+from nba_longevity.application.bootstrap import app_logger, get_config
+
+from nba_longevity.domain.preprocessing.preprocessing_rules import ID_COLUMN
+
+# Artifacts
+from nba_longevity.infrastructure.artifacts.model_artifact_store import ModelArtifactStore
+
+# Streaming & sharding
+from nba_longevity.infrastructure.dataset.shard_reader import plan_shards, DEFAULT_SHARD_BYTES
+from nba_longevity.infrastructure.inference.sharded_batch_scorer import ShardedBatchScorer
+from nba_longevity.infrastructure.instrumentation.rss_sampler import max_rss_bytes
+
+
+def run_batch_scoring(
+    input_paths: list[str | Path],
+    output_dir: str | Path | None = None,
+    model_type: str = "xgboost",
+    model_hash: str | None = None,
+    output_format: str = "parquet",
+    chunk_rows: int = 100_000,
+    shard_bytes: int = DEFAULT_SHARD_BYTES,
+    n_workers: int | None = None,
+    threads_per_worker: int = 1,
+    keep_columns: list[str] | None = None,
+    backend: str = "native",
+):
+    """
+    Scoring batch en streaming de fichiers joueurs (csv / parquet bruts).
+
+    - entrées découpées en shards, scorées par un pool de processus
+    - lecture, features et écriture bloc par bloc : mémoire bornée
+    - sortie : output_dir/part-<shard>.<format> + summary.json
+      (lignes, débit en lignes/s, pic de RSS du processus principal)
+    - backend "compiled" : arbres NumPy exportés, sans librairie modèle
+
+    Retourne le chemin de summary.json.
+    """
+    config = get_config()
+
+    store = ModelArtifactStore(config.paths.artifacts_dir)
+    model_hash = model_hash or store.latest_hash(model_type)
+    manifest = store.load(model_hash=model_hash, backend=backend).manifest
+
+    if output_dir is None:
+        run_name = f"{model_hash[:12]}_{datetime.now(timezone.utc):%Y%m%dT%H%M%SZ}"
+        output_dir = config.paths.artifacts_dir / "scores" / run_name
+    output_dir = Path(output_dir)
+
+    app_logger.info(
+        f"🚀 Starting batch scoring | model={manifest.model_type} | "
+        f"hash={model_hash[:12]} | inputs={len(input_paths)}"
+    )
+
+    shards = plan_shards(input_paths, shard_bytes=shard_bytes)
+    if not shards:
+        raise ValueError("No input data to score")
+
+    scorer = ShardedBatchScorer(
+        artifacts_dir=config.paths.artifacts_dir,
+        model_hash=model_hash,
+        output_dir=output_dir,
+        output_format=output_format,
+        chunk_rows=chunk_rows,
+        keep_columns=keep_columns if keep_columns is not None else [ID_COLUMN],
+        n_workers=n_workers,
+        threads_per_worker=threads_per_worker,
+        backend=backend,
+    )
+
+    start = time.perf_counter()
+    results = scorer.run(shards)
+    wall_time_s = time.perf_counter() - start
+
+    rows_in = sum(r.rows_in for r in results)
+    rows_scored = sum(r.rows_scored for r in results)
+    failed = [r for r in results if r.error is not None]
+
+    summary = {
+        "model_type": manifest.model_type,
+        "model_hash": model_hash,
+        "inputs": [str(p) for p in input_paths],
+        "output_format": output_format,
+        "backend": backend,
+        "n_shards": len(shards),
+        "n_workers": min(scorer.n_workers, len(shards)),
+        "chunk_rows": chunk_rows,
+        "rows_in": rows_in,
+        "rows_scored": rows_scored,
+        "wall_time_s": round(wall_time_s, 3),
+        "rows_per_s": rows_in / wall_time_s if wall_time_s > 0 else 0.0,
+        "driver_max_rss_bytes": max_rss_bytes(),
+        "failed_shards": [r.shard_index for r in failed],
+        "shards": [r.to_dict() for r in results],
+    }
+    summary_path = output_dir / "summary.json"
+    summary_path.write_text(json.dumps(summary, indent=2))
+
+    if failed:
+        raise RuntimeError(f"{len(failed)} shard(s) failed, see {summary_path}")
+
+    app_logger.success(
+        f"✅ Batch scoring completed | rows={rows_in} | scored={rows_scored} | "
+        f"wall_time={wall_time_s:.2f}s | throughput={summary['rows_per_s']:.0f} rows/s | "
+        f"output={output_dir}"
+    )
+
+    return summary_path
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Streaming, sharded batch scoring")
+    parser.add_argument("inputs", nargs="+", help="CSV / Parquet files")
+    parser.add_argument("--output-dir", default=None)
+    parser.add_argument("--model-type", default="xgboost", choices=["xgboost", "catboost"])
+    parser.add_argument("--model-hash", default=None)
+    parser.add_argument("--format", default="parquet", choices=["csv", "parquet"])
+    parser.add_argument("--chunk-rows", type=int, default=100_000)
+    parser.add_argument("--shard-mb", type=float, default=DEFAULT_SHARD_BYTES / 1024 ** 2)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--threads-per-worker", type=int, default=1)
+    parser.add_argument("--backend", default="native", choices=["native", "compiled"])
+    args = parser.parse_args()
+
+    run_batch_scoring(
+        input_paths=args.inputs,
+        output_dir=args.output_dir,
+        model_type=args.model_type,
+        model_hash=args.model_hash,
+        output_format=args.format,
+        chunk_rows=args.chunk_rows,
+        shard_bytes=int(args.shard_mb * 1024 ** 2),
+        n_workers=args.workers,
+        threads_per_worker=args.threads_per_worker,
+        backend=args.backend,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,4 @@
-from domain.features.feature_contract import FEATURE_COLUMNS
+from nba_longevity.domain.dataset.dataset import ColumnarDataset
 from nba_longevity.domain.features.feature_spaces import (
     FEATURE_SPACE_MINIMAL,
     FEATURE_SPACE_EXTENDED,
@@ -9,14 +9,16 @@ def run_inference(
     feature_dataset,
     feature_space: str = "minimal"
 ):
-    
+
     # Choix de l'espace de features
     if feature_space == "extended":
         selected_features = FEATURE_SPACE_EXTENDED
     else:
         selected_features = FEATURE_SPACE_MINIMAL
 
-    rows = list(feature_dataset)
+    # Entrée matérialisée une seule fois (un générateur ne se relit pas) ;
+    # un dataset colonnaire est scoré par colonnes, sans liste de lignes
+    rows = feature_dataset if isinstance(feature_dataset, ColumnarDataset) else list(feature_dataset)
     proba = predictor.predict_proba(
         rows=rows,
         feature_columns=selected_features,
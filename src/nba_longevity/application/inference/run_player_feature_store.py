@@ -0,0 +1,115 @@
+import argparse
+from pathlib import Path
+
+# 🔹 Logger
+from nba_longevity.application.bootstrap import app_logger, get_config
+
+# Dataset loading
+from nba_longevity.infrastructure.dataset.csv_dataset_loader import CsvDatasetLoader
+from nba_longevity.infrastructure.dataset.dtype_plan import WIDE, DtypePlan
+from nba_longevity.infrastructure.dataset.arrow_dataset_loader import (
+    ArrowDatasetLoader,
+    COLUMNAR_FORMATS,
+)
+
+# Feature spaces
+from nba_longevity.domain.features.feature_graph import required_raw_columns
+
+# Artifacts & feature store
+from nba_longevity.infrastructure.artifacts.model_artifact_store import ModelArtifactStore
+from nba_longevity.infrastructure.cache.stage_cache import fingerprint_file
+from nba_longevity.infrastructure.feature_store.player_feature_store import (
+    DEFAULT_FEATURE_SPACES,
+    build_player_feature_store,
+)
+
+
+FEATURE_STORE_DIR_NAME = "feature_store"
+
+
+def run_player_feature_store(
+    input_path: str | Path | None = None,
+    store_dir: str | Path | None = None,
+    model_type: str | None = None,
+    model_hash: str | None = None,
+) -> Path:
+    """
+    Matérialise les features de tous les joueurs d'un fichier brut
+    (csv / parquet) dans un feature store mappé en mémoire.
+
+    - entrée par défaut : données brutes de la configuration
+    - sortie par défaut : artifacts_dir/feature_store
+    - modèle fourni (type ou hash) : imputation avec ses médianes
+      d'entraînement et calculs avec son plan de types, vecteurs
+      identiques à ceux du scoring ;
+      sinon médianes calculées sur le fichier ; seuls les feature spaces
+      dont les colonnes brutes sont couvertes par ces médianes sont
+      matérialisés
+
+    Retourne le répertoire du store.
+    """
+    config = get_config()
+    input_path = Path(input_path or config.paths.raw_data)
+    store_dir = Path(store_dir or config.paths.artifacts_dir / FEATURE_STORE_DIR_NAME)
+
+    medians = None
+    dtype_plan = None
+    feature_spaces = dict(DEFAULT_FEATURE_SPACES)
+    source = {"path": str(input_path), "sha256": fingerprint_file(input_path)}
+    if model_type is not None or model_hash is not None:
+        store = ModelArtifactStore(config.paths.artifacts_dir)
+        manifest = store.load(model_hash=model_hash, model_type=model_type).manifest
+        medians = manifest.preprocessing_stats
+        dtype_plan = DtypePlan.from_name(manifest.metadata.get("dtype_plan", WIDE))
+        source["medians_from_model"] = manifest.content_hash
+
+        # Médianes limitées aux colonnes brutes du feature space du modèle
+        for name, columns in list(feature_spaces.items()):
+            missing = set(required_raw_columns(columns)) - set(medians)
+            if missing:
+                app_logger.warning(
+                    f"⚠️ Feature space skipped (no model median) | space={name} | "
+                    f"missing={sorted(missing)}"
+                )
+                del feature_spaces[name]
+        if not feature_spaces:
+            raise ValueError("No feature space is covered by the model medians")
+
+    app_logger.info(f"📥 Loading raw dataset for the feature store | path={input_path}")
+    if input_path.suffix.lower() in COLUMNAR_FORMATS:
+        dataset = ArrowDatasetLoader(path=input_path).load()
+    else:
+        dataset = CsvDatasetLoader(str(input_path)).load()
+
+    store_dir = build_player_feature_store(
+        dataset,
+        store_dir,
+        feature_spaces=feature_spaces,
+        medians=medians,
+        source=source,
+        dtype_plan=dtype_plan,
+    )
+
+    app_logger.success(f"✅ Player feature store ready | path={store_dir}")
+
+    return store_dir
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Build the memory-mapped player feature store")
+    parser.add_argument("--input", default=None, help="CSV / Parquet raw file")
+    parser.add_argument("--store-dir", default=None)
+    parser.add_argument("--model-type", default=None, choices=["xgboost", "catboost"])
+    parser.add_argument("--model-hash", default=None)
+    args = parser.parse_args()
+
+    run_player_feature_store(
+        input_path=args.input,
+        store_dir=args.store_dir,
+        model_type=args.model_type,
+        model_hash=args.model_hash,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+import argparse
+from datetime import datetime, timezone
+from pathlib import Path
+
+# 🔹 Logger
+from nba_longevity.application.bootstrap import app_logger, get_config
+
+from nba_longevity.domain.preprocessing.preprocessing_rules import ID_COLUMN
+
+# Artifacts
+from nba_longevity.infrastructure.artifacts.model_artifact_store import ModelArtifactStore
+
+
+def run_spark_batch_scoring(
+    input_path: str | Path,
+    output_path: str | Path | None = None,
+    model_type: str = "xgboost",
+    model_hash: str | None = None,
+    threads_per_task: int = 1,
+    max_records_per_batch: int | None = None,
+    keep_columns: list[str] | None = None,
+    spark=None,
+):
+    """
+    Scoring distribué d'une archive de joueurs (backend Spark).
+
+    raw (csv / parquet) → preprocessing (médianes de l'artefact) →
+    feature engineering → scoring (modèle diffusé, mapInPandas) → parquet.
+
+    La sortie contient `keep_columns` (par défaut : l'identifiant joueur
+    s'il est présent) et la colonne `proba_5yrs`. Retourne output_path.
+    """
+    from nba_longevity.infrastructure.dataset.spark_dataset import SparkDataset
+    from nba_longevity.infrastructure.dataset.spark_dataset_loader import SparkDatasetLoader
+    from nba_longevity.infrastructure.preprocessing.spark_preprocessing_adapter import (
+        SparkPreprocessingAdapter,
+    )
+    from nba_longevity.infrastructure.feature_engineering.spark_feature_engineering_adapter import (
+        SparkFeatureEngineeringAdapter,
+    )
+    from nba_longevity.infrastructure.inference.spark_batch_scorer import (
+        SparkBatchScorer,
+        DEFAULT_OUTPUT_COLUMN,
+    )
+    from nba_longevity.application.training.run_spark_feature_preparation import build_spark_session
+
+    config = get_config()
+
+    artifact = ModelArtifactStore(config.paths.artifacts_dir).load(
+        model_hash=model_hash, model_type=model_type
+    )
+
+    input_path = Path(input_path)
+    if output_path is None:
+        run_name = f"{artifact.content_hash[:12]}_{datetime.now(timezone.utc):%Y%m%dT%H%M%SZ}"
+        output_path = config.paths.artifacts_dir / "scores" / run_name
+    output_path = Path(output_path)
+
+    app_logger.info(
+        f"🚀 Starting Spark batch scoring | model={artifact.manifest.model_type} | "
+        f"hash={artifact.content_hash[:12]} | input={input_path}"
+    )
+
+    own_session = spark is None
+    spark = spark or build_spark_session("nba-longevity-batch-scoring")
+
+    scorer = None
+    try:
+        # 1️⃣ Load + preprocessing (médianes d'entraînement, sans cible :
+        # fichier non labellisé accepté, aucune ligne écartée faute de label)
+        fmt = "csv" if input_path.suffix.lower() == ".csv" else "parquet"
+        dataset = SparkDatasetLoader(spark, str(input_path), fmt=fmt).load()
+        dataset = SparkPreprocessingAdapter(
+            medians=artifact.manifest.preprocessing_stats,
+            target_column=None,
+        ).preprocess(dataset)
+
+        # 2️⃣ Features
+        dataset = SparkFeatureEngineeringAdapter(
+            feature_space=artifact.manifest.feature_columns
+        ).add_features(dataset)
+
+        # 3️⃣ Scoring distribué
+        scorer = SparkBatchScorer(
+            spark,
+            artifact,
+            threads_per_task=threads_per_task,
+            max_records_per_batch=max_records_per_batch,
+        )
+        if keep_columns is None:
+            keep_columns = [ID_COLUMN] if ID_COLUMN in dataset.columns else []
+        scored = scorer.score(
+            SparkDataset(dataset._df.select(*keep_columns, *scorer.feature_columns))
+        )
+
+        # 4️⃣ Écriture
+        scored._df.select(*keep_columns, DEFAULT_OUTPUT_COLUMN) \
+            .write.mode("overwrite").parquet(str(output_path))
+
+        app_logger.success(f"✅ Spark batch scoring completed | output={output_path}")
+    finally:
+        if scorer is not None:
+            scorer.unpersist()
+        if own_session:
+            spark.stop()
+
+    return output_path
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Distributed batch scoring (Spark)")
+    parser.add_argument("--input", required=True, help="CSV file or parquet path")
+    parser.add_argument("--output", default=None)
+    parser.add_argument("--model-type", default="xgboost", choices=["xgboost", "catboost"])
+    parser.add_argument("--model-hash", default=None)
+    parser.add_argument("--threads-per-task", type=int, default=1)
+    parser.add_argument("--max-records-per-batch", type=int, default=None)
+    args = parser.parse_args()
+
+    run_spark_batch_scoring(
+        input_path=args.input,
+        output_path=args.output,
+        model_type=args.model_type,
+        model_hash=args.model_hash,
+        threads_per_task=args.threads_per_task,
+        max_records_per_batch=args.max_records_per_batch,
+    )
+
+
+if __name__ == "__main__":
+    main()
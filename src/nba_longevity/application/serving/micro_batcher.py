@@ -0,0 +1,134 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable
+
+import numpy as np
+
+
+class MicroBatcher:
+    """
+    Regroupe des requêtes unitaires concurrentes en micro-batchs.
+
+    - une requête = un vecteur de features (float32, ordre du modèle)
+    - un batch part dès que `max_batch_size` est atteint ou que la plus
+      ancienne requête a attendu `max_wait_ms`
+    - l'appel modèle s'exécute dans un thread dédié : la boucle asyncio
+      n'est jamais bloquée et continue d'accumuler le batch suivant
+    """
+
+    def __init__(
+        self,
+        predict_batch: Callable[[np.ndarray], np.ndarray],
+        max_batch_size: int = 64,
+        max_wait_ms: float = 2.0,
+        on_batch: Callable[[int], None] | None = None,
+    ):
+        if max_batch_size <= 0:
+            raise ValueError(f"max_batch_size doit être > 0 : {max_batch_size}")
+        if max_wait_ms < 0:
+            raise ValueError(f"max_wait_ms doit être >= 0 : {max_wait_ms}")
+
+        self._predict_batch = predict_batch
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000
+        self._on_batch = on_batch
+
+        # Un seul thread modèle : les prédicteurs réutilisent leurs buffers
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="scoring")
+        self._queue: asyncio.Queue | None = None
+        self._collector: asyncio.Task | None = None
+        self._inflight: set[asyncio.Task] = set()
+        # Batch en cours de constitution (hors file, pas encore parti)
+        self._pending: list = []
+
+    async def start(self) -> None:
+        self._queue = asyncio.Queue()
+        self._collector = asyncio.create_task(self._collect())
+
+    async def stop(self) -> None:
+        if self._collector is not None:
+            self._collector.cancel()
+            try:
+                await self._collector
+            except asyncio.CancelledError:
+                pass
+            self._collector = None
+
+        # Requêtes jamais parties (batch partiel + file) : échec explicite,
+        # sinon leurs appelants attendraient indéfiniment
+        shutdown = RuntimeError("MicroBatcher arrêté avant le scoring de la requête")
+        pending, self._pending = self._pending, []
+        if self._queue is not None:
+            while not self._queue.empty():
+                pending.append(self._queue.get_nowait())
+            self._queue = None
+        for _, future in pending:
+            if not future.done():
+                future.set_exception(shutdown)
+
+        if self._inflight:
+            await asyncio.gather(*self._inflight, return_exceptions=True)
+        self._executor.shutdown(wait=True)
+
+    async def submit(self, features: np.ndarray) -> float:
+        """
+        Soumet un vecteur de features et attend sa probabilité.
+        """
+        if self._queue is None:
+            raise RuntimeError("MicroBatcher non démarré (appeler start())")
+
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((features, future))
+        return await future
+
+    # ------------------------------------------------------------------
+    # Interne
+    # ------------------------------------------------------------------
+    async def _collect(self) -> None:
+        loop = asyncio.get_running_loop()
+
+        while True:
+            self._pending = batch = [await self._queue.get()]
+            deadline = loop.time() + self.max_wait
+
+            while len(batch) < self.max_batch_size:
+                # Vide d'abord ce qui est déjà en file, sans attendre
+                try:
+                    batch.append(self._queue.get_nowait())
+                    continue
+                except asyncio.QueueEmpty:
+                    pass
+
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), remaining))
+                except asyncio.TimeoutError:
+                    break
+
+            self._pending = []
+            task = asyncio.create_task(self._score(batch))
+            self._inflight.add(task)
+            task.add_done_callback(self._inflight.discard)
+
+    async def _score(self, batch: list) -> None:
+        loop = asyncio.get_running_loop()
+        futures = [future for _, future in batch]
+
+        try:
+            X = np.stack([features for features, _ in batch]).astype(np.float32, copy=False)
+            proba = await loop.run_in_executor(self._executor, self._predict_batch, X)
+        except Exception as exc:
+            for future in futures:
+                if not future.done():
+                    future.set_exception(exc)
+            return
+
+        if self._on_batch is not None:
+            self._on_batch(len(batch))
+
+        for future, p in zip(futures, proba):
+            # Le client a pu abandonner la requête entre-temps
+            if not future.done():
+                future.set_result(float(p))
@@ -0,0 +1,82 @@
+from typing import List, Tuple
+
+import numpy as np
+from sklearn.model_selection import StratifiedKFold, StratifiedShuffleSplit
+
+
+def split_train_valid_indices(
+    y: np.ndarray,
+    valid_size: float = 0.2,
+    seed: int = 42,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Split stratifié train / validation sous forme d'indices de lignes.
+
+    Aucune donnée n'est copiée : seuls deux tableaux d'indices (O(n))
+    sont produits. Les trainers consomment ensuite des sous-ensembles
+    d'une unique matrice de features contiguë.
+
+    Même tirage que `train_test_split(..., stratify=y)` pour un seed
+    donné : les lignes train / validation sont identiques à celles de
+    `split_train_valid_pandas`.
+    """
+    splitter = StratifiedShuffleSplit(
+        n_splits=1,
+        test_size=valid_size,
+        random_state=seed,
+    )
+    train_idx, valid_idx = next(splitter.split(np.zeros(len(y)), y))
+
+    return train_idx, valid_idx
+
+
+def kfold_indices(
+    y: np.ndarray,
+    n_splits: int = 5,
+    seed: int = 42,
+) -> List[Tuple[np.ndarray, np.ndarray]]:
+    """
+    K-fold stratifié sous forme d'indices de lignes (train, validation).
+
+    Chaque ligne apparaît exactement une fois en validation : les
+    prédictions out-of-fold couvrent tout le dataset.
+    """
+    splitter = StratifiedKFold(
+        n_splits=n_splits,
+        shuffle=True,
+        random_state=seed,
+    )
+
+    return list(splitter.split(np.zeros(len(y)), y))
+
+
+def segment_split_indices(
+    y: np.ndarray,
+    boundaries: List[int],
+    valid_size: float = 0.2,
+    seed: int = 42,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Split stable par segments de lignes ajoutées successivement
+    (boundaries = fins de segments croissantes, la dernière = len(y)).
+
+    Chaque segment est splitté indépendamment : l'ajout d'un segment ne
+    déplace aucune ligne déjà affectée. Un seul segment donne exactement
+    `split_train_valid_indices(y)`. Un segment trop petit pour être
+    stratifié est splitté aléatoirement.
+    """
+    train_parts, valid_parts = [], []
+    start = 0
+    for end in boundaries:
+        segment = y[start:end]
+        try:
+            train_idx, valid_idx = split_train_valid_indices(segment, valid_size, seed)
+        except ValueError:
+            order = np.random.default_rng(seed).permutation(len(segment))
+            n_valid = int(round(len(segment) * valid_size)) if len(segment) > 1 else 0
+            valid_idx, train_idx = np.sort(order[:n_valid]), np.sort(order[n_valid:])
+        train_parts.append(train_idx + start)
+        valid_parts.append(valid_idx + start)
+        start = end
+
+    return np.concatenate(train_parts), np.concatenate(valid_parts)
@@ -1,6 +1,6 @@
-from pandas import DataFrame
 from typing import Sequence, Mapping, Tuple
-from sklearn.model_selection import train_test_split
+from nba_longevity.application.splitting.index_split import split_train_valid_indices
+from nba_longevity.infrastructure.dataset.pandas_dataset import to_pandas
 
 def split_train_valid_pandas(
     rows: Sequence[Mapping[str, object]],
@@ -8,15 +8,21 @@ def split_train_valid_pandas(
     valid_size: float = 0.2,
     seed: int = 42,
 ) -> Tuple[list[dict], list[dict]]:
-    
-    df = DataFrame(list(rows))
+    """
+    Split stratifié retournant des lignes (API historique).
 
-    y = df[target_column]
-    train_df, valid_df = train_test_split(
-        df,
-        test_size=valid_size,
-        random_state=seed,
-        stratify=y,   # important en classification
+    Préférer `split_train_valid_indices` + `TrainerPort.train_matrix`,
+    qui évitent de matérialiser deux fois le dataset.
+    """
+    df = to_pandas(rows)
+
+    train_idx, valid_idx = split_train_valid_indices(
+        df[target_column].to_numpy(),
+        valid_size=valid_size,
+        seed=seed,   # stratifié : important en classification
     )
 
-    return train_df.to_dict("records"), valid_df.to_dict("records")
+    return (
+        df.iloc[train_idx].to_dict("records"),
+        df.iloc[valid_idx].to_dict("records"),
+    )
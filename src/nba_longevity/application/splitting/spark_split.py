@@ -1,10 +1,58 @@
 from typing import Tuple
 from pyspark.sql import DataFrame
+from pyspark.sql import functions as F
+
+from nba_longevity.domain.features.feature_spaces import TARGET_COLUMN
+
+_RAND_COLUMN = "__split_rand"
+
 
 def split_train_valid_spark(
     df: DataFrame,
     valid_size: float = 0.2,
     seed: int = 42,
+    stratify_column: str | None = TARGET_COLUMN,
+    relative_error: float = 1e-4,
 ) -> Tuple[DataFrame, DataFrame]:
-    train_df, valid_df = df.randomSplit([1.0 - valid_size, valid_size], seed=seed)
+    """
+    Split train / valid stratifié, entièrement distribué.
+
+    Chaque ligne reçoit un tirage uniforme `rand(seed)` ; le seuil de
+    validation est le quantile `valid_size` de ce tirage au sein de sa
+    classe (`percentile_approx`, une seule agrégation groupée, résultat
+    de quelques lignes collecté sur le driver). Les deux filtres sont
+    complémentaires : chaque ligne appartient à exactement une partie, et
+    la proportion de chaque classe est conservée à `relative_error` près.
+
+    `stratify_column=None` : split aléatoire simple sur le même tirage.
+    """
+    # Cache : le même tirage sert aux seuils et aux deux filtres
+    df = df.withColumn(_RAND_COLUMN, F.rand(seed)).cache()
+
+    if stratify_column is None:
+        in_valid = F.col(_RAND_COLUMN) < F.lit(valid_size)
+    else:
+        accuracy = max(1, int(round(1.0 / relative_error))) if relative_error > 0 else 1_000_000
+        thresholds = {
+            row[stratify_column]: row["threshold"]
+            for row in (
+                df.groupBy(stratify_column)
+                .agg(F.percentile_approx(_RAND_COLUMN, valid_size, accuracy).alias("threshold"))
+                .collect()
+            )
+        }
+
+        threshold = F.lit(None).cast("double")
+        for label, value in thresholds.items():
+            condition = (
+                F.col(stratify_column).isNull() if label is None
+                else F.col(stratify_column) == F.lit(label)
+            )
+            threshold = F.when(condition, F.lit(value)).otherwise(threshold)
+
+        in_valid = F.coalesce(F.col(_RAND_COLUMN) <= threshold, F.lit(False))
+
+    valid_df = df.filter(in_valid).drop(_RAND_COLUMN)
+    train_df = df.filter(~in_valid).drop(_RAND_COLUMN)
+
     return train_df, valid_df
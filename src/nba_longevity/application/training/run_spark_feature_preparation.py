@@ -0,0 +1,145 @@
+import argparse
+import json
+from datetime import datetime, timezone
+from pathlib import Path
+
+# 🔹 Logger
+from nba_longevity.application.bootstrap import app_logger, get_config
+
+# Feature spaces (Domain)
+from nba_longevity.domain.features.feature_spaces import (
+    FEATURE_SPACE_MINIMAL,
+    FEATURE_SPACE_EXTENDED,
+)
+
+# Config & utils
+
+
+def build_spark_session(app_name: str = "nba-longevity", master: str | None = None):
+    """
+    Session Spark (local[*] par défaut hors cluster) avec transferts Arrow.
+    """
+    from pyspark.sql import SparkSession
+
+    builder = (
+        SparkSession.builder
+        .appName(app_name)
+        .config("spark.sql.execution.arrow.pyspark.enabled", "true")
+    )
+    if master is not None:
+        builder = builder.master(master)
+
+    return builder.getOrCreate()
+
+
+def run_spark_feature_preparation(
+    input_path: str | Path | None = None,
+    output_dir: str | Path | None = None,
+    feature_space: str = "extended",
+    valid_size: float = 0.2,
+    seed: int = 42,
+    relative_error: float = 1e-4,
+    spark=None,
+):
+    """
+    Préparation des features à l'échelle du cluster (backend Spark).
+
+    load → preprocessing → feature engineering → sélection → split stratifié,
+    mêmes règles que le pipeline Pandas. Écrit dans output_dir :
+    - train/ et valid/ (parquet)
+    - medians.json : médianes d'imputation, réutilisables par le scoring
+
+    `input_path` : csv, ou répertoire / fichier parquet (par défaut :
+    données brutes de config/infra.yaml). Retourne output_dir.
+    """
+    from nba_longevity.infrastructure.dataset.spark_dataset_loader import SparkDatasetLoader
+    from nba_longevity.infrastructure.preprocessing.spark_preprocessing_adapter import (
+        SparkPreprocessingAdapter,
+    )
+    from nba_longevity.infrastructure.feature_engineering.spark_feature_engineering_adapter import (
+        SparkFeatureEngineeringAdapter,
+    )
+    from nba_longevity.infrastructure.feature_engineering.spark_feature_selection_adapter import (
+        SparkFeatureSelectionAdapter,
+    )
+    from nba_longevity.application.splitting.spark_split import split_train_valid_spark
+
+    app_logger.info(f"🚀 Starting Spark feature preparation | feature_space={feature_space}")
+
+    config = get_config()
+
+    input_path = Path(input_path or config.paths.raw_data)
+    if output_dir is None:
+        run_name = f"{feature_space}_{datetime.now(timezone.utc):%Y%m%dT%H%M%SZ}"
+        output_dir = config.paths.artifacts_dir / "spark_features" / run_name
+    output_dir = Path(output_dir)
+
+    selected_features = (
+        FEATURE_SPACE_EXTENDED if feature_space == "extended" else FEATURE_SPACE_MINIMAL
+    )
+
+    own_session = spark is None
+    spark = spark or build_spark_session("nba-longevity-feature-preparation")
+
+    try:
+        # 1️⃣ Load
+        fmt = "csv" if input_path.suffix.lower() == ".csv" else "parquet"
+        dataset = SparkDatasetLoader(spark, str(input_path), fmt=fmt).load()
+
+        # 2️⃣ Preprocessing (médianes approchées)
+        preprocessor = SparkPreprocessingAdapter(relative_error=relative_error)
+        dataset = preprocessor.preprocess(dataset)
+
+        # 3️⃣ Feature engineering + sélection
+        dataset = SparkFeatureEngineeringAdapter().add_features(dataset)
+        dataset = SparkFeatureSelectionAdapter(selected_features).select_features(dataset)
+
+        # 4️⃣ Split stratifié
+        train_df, valid_df = split_train_valid_spark(
+            dataset._df,
+            valid_size=valid_size,
+            seed=seed,
+            relative_error=relative_error,
+        )
+
+        # 5️⃣ Écriture
+        output_dir.mkdir(parents=True, exist_ok=True)
+        train_df.write.mode("overwrite").parquet(str(output_dir / "train"))
+        valid_df.write.mode("overwrite").parquet(str(output_dir / "valid"))
+        (output_dir / "medians.json").write_text(
+            json.dumps(preprocessor.medians, indent=2)
+        )
+
+        app_logger.success(
+            f"✅ Spark feature preparation completed | "
+            f"train={train_df.count()} | valid={valid_df.count()} | output={output_dir}"
+        )
+    finally:
+        if own_session:
+            spark.stop()
+
+    return output_dir
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Cluster-scale feature preparation (Spark)")
+    parser.add_argument("--input", default=None, help="CSV file or parquet path (default: infra raw data)")
+    parser.add_argument("--output-dir", default=None)
+    parser.add_argument("--feature-space", default="extended", choices=["minimal", "extended"])
+    parser.add_argument("--valid-size", type=float, default=0.2)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--relative-error", type=float, default=1e-4)
+    args = parser.parse_args()
+
+    run_spark_feature_preparation(
+        input_path=args.input,
+        output_dir=args.output_dir,
+        feature_space=args.feature_space,
+        valid_size=args.valid_size,
+        seed=args.seed,
+        relative_error=args.relative_error,
+    )
+
+
+if __name__ == "__main__":
+    main()
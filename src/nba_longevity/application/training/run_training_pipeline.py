@@ -1,10 +1,18 @@
+import uuid
+from dataclasses import replace
+from datetime import datetime, timezone
 from pathlib import Path
 
 # 🔹 Logger
-from nba_longevity.application.bootstrap import app_logger
+from nba_longevity.application.bootstrap import app_logger, config_dir, get_config
 
 # Dataset loading
 from nba_longevity.infrastructure.dataset.csv_dataset_loader import CsvDatasetLoader
+from nba_longevity.infrastructure.dataset.arrow_dataset_loader import (
+    ArrowDatasetLoader,
+    COLUMNAR_FORMATS,
+)
+from nba_longevity.infrastructure.dataset.dtype_plan import DtypePlan
 
 # Preprocessing
 from nba_longevity.infrastructure.preprocessing.pandas_preprocessing_adapter import (
@@ -18,6 +26,9 @@ from nba_longevity.infrastructure.feature_engineering.pandas_feature_engineering
 from nba_longevity.infrastructure.feature_engineering.pandas_feature_selection_adapter import (
     PandasFeatureSelectionAdapter
 )
+from nba_longevity.infrastructure.feature_engineering.fused_feature_plan import (
+    FusedFeaturePlan,
+)
 
 # Feature spaces (Domain)
 from nba_longevity.domain.features.feature_spaces import (
@@ -25,25 +36,98 @@ from nba_longevity.domain.features.feature_spaces import (
     FEATURE_SPACE_EXTENDED,
     TARGET_COLUMN
 )
+from nba_longevity.domain.features import feature_graph
+from nba_longevity.domain.features.feature_graph import DERIVED_FEATURES, resolve_feature_space
 
 # Split
-from nba_longevity.application.splitting.pandas_split import split_train_valid_pandas
+from nba_longevity.application.splitting.index_split import (
+    split_train_valid_indices,
+    segment_split_indices,
+    kfold_indices,
+)
+from nba_longevity.infrastructure.dataset.pandas_dataset import (
+    to_feature_matrix,
+    from_feature_matrix,
+)
 
 # Training
 from nba_longevity.infrastructure.training.xgboost_trainer import XGBoostTrainer
 from nba_longevity.infrastructure.training.catboost_trainer import CatBoostTrainer
+from nba_longevity.infrastructure.training.quantized_cross_validation import (
+    QuantizedCrossValidator,
+)
+from nba_longevity.application.training.warm_start import (
+    WarmStartPolicy,
+    FULL,
+    INCREMENTAL,
+    SKIP,
+    data_lineage,
+    incremental_params,
+    validation_auc,
+    validation_proba,
+)
+from nba_longevity.infrastructure.metrics.threshold_sweep import evaluate_predictions
+
+# Artifacts & cache
+from nba_longevity.infrastructure.artifacts.model_artifact_store import ModelArtifactStore
+from nba_longevity.infrastructure.cache.stage_cache import (
+    StageCache,
+    fingerprint_code,
+    fingerprint_file,
+)
+from nba_longevity.infrastructure.dataset import (
+    csv_dataset_loader,
+    arrow_dataset_loader,
+    dtype_plan,
+    pandas_dataset,
+)
+from nba_longevity.infrastructure.preprocessing import pandas_preprocessing_adapter
+from nba_longevity.infrastructure.feature_engineering import (
+    pandas_feature_engineering_adapter,
+    pandas_feature_selection_adapter,
+    fused_feature_plan,
+)
+from nba_longevity.domain.preprocessing.preprocessing_rules import INTEGER_COLUMNS, NUMERIC_COLUMNS
+
+# Instrumentation & tracking
+from nba_longevity.infrastructure.instrumentation.stage_instrumentation import StageInstrumentation
+from nba_longevity.infrastructure.tracking.tracker_factory import build_tracker
 
 # Config & utils
-from nba_longevity.infrastructure.config.settings import load_infra_config
-from nba_longevity.infrastructure.system_utils.root_finder import get_repository_root
+from nba_longevity.infrastructure.config.settings import load_model_config, load_train_config
 
 
 def run_training(
     model_type: str = "xgboost",
     feature_space: str = "minimal",
+    fused_features: bool = False,
+    use_stage_cache: bool = True,
+    params: dict | None = None,
+    warm_start: bool | None = None,
+    compact_dtypes: bool = False,
 ):
     """
     Pipeline complet d'entraînement ML (Pandas backend).
+
+    fused_features : si True, preprocessing + feature engineering +
+    sélection sont exécutés en une seule passe NumPy (FusedFeaturePlan),
+    avec une matrice de features identique à la chaîne d'adapters.
+
+    use_stage_cache : si True, la matrice de features est relue depuis
+    le cache de stages (artifacts_dir/stage_cache) lorsque les données
+    brutes, le code / les règles et les paramètres n'ont pas changé.
+
+    params : hyperparamètres du modèle (ex. meilleur essai du leaderboard
+    de la recherche d'hyperparamètres) ; sinon paramètres de base de
+    config/model/<model_type>.yml (mêmes que la recherche).
+
+    warm_start : poursuite du dernier modèle persisté sur les lignes
+    nouvellement ajoutées, si la politique de config/train.yaml
+    (section warm_start) l'autorise ; None = valeur de la config.
+
+    compact_dtypes : si True, données lues et conservées en float32 /
+    petits entiers de bout en bout (DtypePlan compact), identifiant
+    non chargé ; sinon types historiques (float64 / int64 / object).
     """
 
     app_logger.info(
@@ -51,13 +135,23 @@ def run_training(
     )
 
     # 0️⃣ Initialisation environnement & config
-    root_path = get_repository_root(add_to_sys_path=False)
-    config_path = Path(f"{root_path}/config/infra.yaml")
-    config = load_infra_config(config_path)
+    config = get_config()
+    train_config = load_train_config(config_dir() / "train.yaml")
 
-    app_logger.debug(f"Repository root: {root_path}")
+    app_logger.debug(f"Config directory: {config_dir()}")
     app_logger.debug(f"Raw data path: {config.paths.raw_data}")
 
+    # Instrumentation par stage (rapport dans artifacts_dir/runs/<run_id>/)
+    run_id = f"{model_type}_{datetime.now(timezone.utc):%Y%m%dT%H%M%SZ}_{uuid.uuid4().hex[:8]}"
+    instrumentation_config = train_config.instrumentation
+    stages = StageInstrumentation(
+        output_dir=config.paths.artifacts_dir / "runs" / run_id,
+        enabled=instrumentation_config.enabled,
+        cprofile=instrumentation_config.cprofile,
+        trace_memory=instrumentation_config.tracemalloc,
+        profile_top_n=instrumentation_config.profile_top_n,
+    )
+
     # Choix de l'espace de features
     if feature_space == "extended":
         selected_features = FEATURE_SPACE_EXTENDED
@@ -68,87 +162,448 @@ def run_training(
         f"Using feature space with {len(selected_features)} features"
     )
 
-    # 1️⃣ Chargement des données
-    app_logger.info("📥 Loading raw dataset")
-    loader = CsvDatasetLoader(path=config.paths.raw_data)
-    dataset = loader.load()
-
-    # 2️⃣ Preprocessing
-    app_logger.info("🧹 Preprocessing dataset")
-    preprocessor = PandasPreprocessingAdapter()
-    clean_dataset = preprocessor.preprocess(dataset)
-
-    # 3️⃣ Feature engineering (ajout uniquement)
-    app_logger.info("🧠 Feature engineering (add features)")
-    feature_engineer = PandasFeatureEngineeringAdapter()
-    enriched_dataset = feature_engineer.add_features(clean_dataset)
-
-    # 4️⃣ Feature selection (projection ML)
-    app_logger.info("🎯 Feature selection (ML projection)")
-    feature_selector = PandasFeatureSelectionAdapter(
-        feature_space=selected_features
+    # 1️⃣ → 4️⃣ Features (cache de stages si rien n'a changé)
+    X, y, feature_dataset, preprocessing_stats = load_feature_matrix(
+        raw_data_path=config.paths.raw_data,
+        artifacts_dir=config.paths.artifacts_dir,
+        selected_features=selected_features,
+        fused_features=fused_features,
+        use_stage_cache=use_stage_cache,
+        instrumentation=stages,
+        compact_dtypes=compact_dtypes,
     )
-    feature_dataset = feature_selector.select_features(enriched_dataset)
 
-    # 5️⃣ Split train / validation
-    app_logger.info("✂️ Splitting train / validation")
-    train_rows, valid_rows = split_train_valid_pandas(
-        rows=list(feature_dataset),
-        target_column=TARGET_COLUMN,
-        valid_size=0.2,
-        seed=42,
+    model_params = params or dict(
+        load_model_config(config_dir() / "model" / f"{model_type}.yml").params
     )
+    store = ModelArtifactStore(config.paths.artifacts_dir)
+
+    # 4️⃣ bis Warm start : mise à jour incrémentale ou ré-entraînement complet
+    warm_start_config = train_config.warm_start
+    if warm_start is not None:
+        warm_start_config = warm_start_config.model_copy(update={"enabled": warm_start})
+    policy = WarmStartPolicy(warm_start_config)
+
+    previous = _load_previous_artifact(store, model_type) if warm_start_config.enabled else None
+    previous_metadata = previous.manifest.metadata if previous is not None else {}
+
+    with stages.stage("warm_start_decision"):
+        decision = policy.decide(
+            previous_hash=previous.content_hash if previous is not None else None,
+            previous_metadata=previous_metadata if previous is not None else None,
+            previous_features=previous.manifest.feature_columns if previous is not None else None,
+            feature_columns=selected_features,
+            raw_data_path=config.paths.raw_data,
+            n_samples=len(y),
+            current_auc=lambda: validation_auc(
+                previous.model, model_type, X, y,
+                segment_split_indices(
+                    y, previous_metadata["segments"] + [len(y)], valid_size=0.2, seed=42
+                )[1],
+                selected_features,
+            ),
+            model_params=model_params,
+            dtype_plan=_dtype_plan(compact_dtypes).name,
+        )
+
+    app_logger.info(f"♻️ Training mode: {decision.mode} | {decision.reason}")
+
+    if decision.mode == SKIP:
+        app_logger.success(
+            f"✅ No new data: keeping model {decision.parent_hash[:12]}"
+        )
+        _, valid_idx = segment_split_indices(y, previous_metadata["segments"], valid_size=0.2, seed=42)
+        return previous.model, feature_dataset.take(valid_idx)
+
+    # 5️⃣ Split train / validation (indices sur une matrice unique)
+    # (incrémental : split par segments, les lignes déjà vues gardent leur affectation)
+    app_logger.info("✂️ Splitting train / validation")
+    segments = [len(y)]
+    if decision.mode == INCREMENTAL:
+        segments = previous_metadata["segments"] + [len(y)]
+        train_idx, valid_idx = stages.instrument(
+            "split", segment_split_indices, y, segments, valid_size=0.2, seed=42,
+        )
+    else:
+        train_idx, valid_idx = stages.instrument(
+            "split",
+            split_train_valid_indices,
+            y,
+            valid_size=0.2,
+            seed=42,
+        )
 
     app_logger.info(
-        f"Train size: {len(train_rows)} | Validation size: {len(valid_rows)}"
+        f"Train size: {len(train_idx)} | Validation size: {len(valid_idx)}"
     )
 
+    # 5️⃣ bis Validation croisée (config/train.yaml), matrice quantifiée une fois
+    cv_metadata = {}
+    if train_config.cross_validation.enabled:
+        validator = QuantizedCrossValidator(
+            model_type,
+            parallel_folds=train_config.cross_validation.parallel_folds,
+        )
+        cv_result = stages.instrument(
+            "cross_validation",
+            validator.run,
+            X,
+            y=y,
+            folds=kfold_indices(y, n_splits=train_config.cross_validation.n_splits, seed=42),
+            feature_columns=selected_features,
+            params=model_params,
+        )
+        cv_metadata = {
+            "cv_n_splits": len(cv_result.folds),
+            "cv_mean_auc": cv_result.mean_auc,
+            "cv_std_auc": cv_result.std_auc,
+            "cv_oof_auc": cv_result.oof_auc,
+        }
+
     # 6️⃣ Entraînement
     if model_type == "xgboost":
         app_logger.info("🏋️ Training XGBoost model")
-
         trainer = XGBoostTrainer()
-        model = trainer.train(
-            train_rows=train_rows,
-            valid_rows=valid_rows,
-            feature_columns=selected_features,
-            target_column=TARGET_COLUMN,
-            params={
-                "objective": "binary:logistic",
-                "eval_metric": "auc",
-                "max_depth": 4,
-                "eta": 0.05,
-                "subsample": 0.8,
-                "colsample_bytree": 0.8,
-                "num_boost_round": 1000,
-                "early_stopping_rounds": 50,
-            },
-        )
 
     elif model_type == "catboost":
         app_logger.info("🏋️ Training CatBoost model")
-
         trainer = CatBoostTrainer()
-        model = trainer.train(
-            train_rows=train_rows,
-            valid_rows=valid_rows,
-            feature_columns=selected_features,
-            target_column=TARGET_COLUMN,
+
+    else:
+        app_logger.error(f"Unknown model_type: {model_type}")
+        raise ValueError(f"Unknown model_type: {model_type}")
+
+    model = None
+    if decision.mode == INCREMENTAL:
+        # Nouveaux arbres appris sur les seules lignes ajoutées
+        new_train_idx = train_idx[train_idx >= previous_metadata["n_samples"]]
+        with stages.stage("train_incremental") as stage:
+            stage.inputs(rows=len(new_train_idx), nbytes=len(new_train_idx) * X.shape[1] * X.itemsize)
+            model = trainer.train_matrix(
+                X=X,
+                y=y,
+                train_idx=new_train_idx,
+                valid_idx=valid_idx,
+                feature_columns=selected_features,
+                params=incremental_params(
+                    model_type, model_params, warm_start_config.incremental_rounds
+                ),
+                init_model=previous.model,
+            )
+
+        incremental_auc = validation_auc(model, model_type, X, y, valid_idx, selected_features)
+        if not policy.accept_incremental(decision, incremental_auc):
+            decision = replace(
+                decision, mode=FULL,
+                reason=f"incremental model rejected (AUC {incremental_auc:.5f})",
+            )
+            segments = [len(y)]
+            train_idx, valid_idx = split_train_valid_indices(y, valid_size=0.2, seed=42)
+            model = None
+
+    if model is None:
+        with stages.stage("train") as stage:
+            stage.inputs(rows=len(train_idx), nbytes=len(train_idx) * X.shape[1] * X.itemsize)
+            model = trainer.train_matrix(
+                X=X,
+                y=y,
+                train_idx=train_idx,
+                valid_idx=valid_idx,
+                feature_columns=selected_features,
+                params=model_params,
+            )
+
+    # Évaluation sur la validation : AUC, balayage des seuils, IC bootstrap
+    evaluation = stages.instrument(
+        "evaluate",
+        evaluate_predictions,
+        y[valid_idx],
+        validation_proba(model, model_type, X, valid_idx, selected_features),
+        n_resamples=train_config.evaluation.bootstrap_resamples,
+        confidence=train_config.evaluation.confidence,
+    )
+    valid_auc = evaluation["auc"]
+    warm_start_metadata = {
+        **data_lineage(config.paths.raw_data, n_samples=len(y)),
+        "segments": segments,
+        "valid_auc": valid_auc,
+        "training_mode": decision.mode,
+        "training_mode_reason": decision.reason,
+        "incremental_updates": (
+            decision.incremental_updates + 1 if decision.mode == INCREMENTAL else 0
+        ),
+        "parent_hash": decision.parent_hash if decision.mode == INCREMENTAL else None,
+    }
+
+    auc_interval = evaluation.get("confidence_intervals", {}).get("auc")
+    app_logger.info(
+        f"Validation AUC: {valid_auc:.5f}"
+        + (f" [{auc_interval['lower']:.5f}, {auc_interval['upper']:.5f}]" if auc_interval else "")
+        + f" | F1@{evaluation['threshold']}: {evaluation['f1']:.5f}"
+        + f" | best F1 {evaluation['best_f1']:.5f} @ {evaluation['best_f1_threshold']:.3f}"
+        + f" | mode={decision.mode}"
+    )
+
+    # 7️⃣ Persistance de l'artefact (modèle + feature space + médianes)
+    app_logger.info("💾 Saving model artifact")
+    model_hash = stages.instrument(
+        "save_artifact",
+        store.save,
+        model=model,
+        model_type=model_type,
+        feature_columns=selected_features,
+        preprocessing_stats=preprocessing_stats,
+        metadata={
+            "feature_space": feature_space,
+            "dtype_plan": _dtype_plan(compact_dtypes).name,
+            "model_params": model_params,
+            "train_size": len(train_idx),
+            "valid_size": len(valid_idx),
+            **cv_metadata,
+            **warm_start_metadata,
+        },
+    )
+
+    # 8️⃣ Rapport de run + tracking d'expériences
+    report_path = stages.write_report({
+        "run_id": run_id,
+        "model_type": model_type,
+        "feature_space": feature_space,
+        "fused_features": fused_features,
+        "dtype_plan": _dtype_plan(compact_dtypes).name,
+        "model_hash": model_hash,
+        "params": model_params,
+        "train_size": len(train_idx),
+        "valid_size": len(valid_idx),
+        "cross_validation": cv_metadata,
+        "warm_start": decision.to_dict(),
+        "evaluation": evaluation,
+    })
+
+    if train_config.logging.log_to_mlflow:
+        _track_run(
+            config,
+            run_id=run_id,
             params={
-                "loss_function": "Logloss",
-                "eval_metric": "AUC",
-                "iterations": 2000,
-                "learning_rate": 0.03,
-                "depth": 6,
-                "early_stopping_rounds": 50,
-                "verbose": False,
+                "model_type": model_type,
+                "feature_space": feature_space,
+                "fused_features": fused_features,
+                "model_hash": model_hash,
+                **model_params,
             },
+            metrics={**stages.metrics(), **cv_metadata, "valid_auc": valid_auc, "valid_f1": evaluation["f1"]},
+            report_path=report_path,
         )
 
+    app_logger.success(
+        f"✅ Training pipeline completed successfully | model_hash={model_hash[:12]}"
+    )
+
+    # Lignes de validation (Dataset itérable) pour l'évaluation / inférence
+    valid_rows = feature_dataset.take(valid_idx)
+
+    return model, valid_rows
+
+
+def load_feature_matrix(
+    raw_data_path,
+    artifacts_dir,
+    selected_features,
+    fused_features: bool = False,
+    use_stage_cache: bool = True,
+    instrumentation: StageInstrumentation | None = None,
+    compact_dtypes: bool = False,
+):
+    """
+    Matrice de features prête pour l'entraînement (étapes 1 à 4).
+
+    Relue depuis le cache de stages (artifacts_dir/stage_cache) lorsque
+    les données brutes, le code / les règles et les paramètres n'ont pas
+    changé ; sinon calculée puis mise en cache.
+
+    Retourne (X, y, feature_dataset, preprocessing_stats).
+    """
+    stages = instrumentation or StageInstrumentation.disabled()
+
+    cache = None
+    cached = None
+    if use_stage_cache:
+        with stages.stage("stage_cache_lookup") as stage:
+            cache = StageCache(Path(artifacts_dir) / "stage_cache")
+            stage_key = cache.key(
+                stage="features",
+                inputs=[fingerprint_file(raw_data_path)],
+                version=_feature_stage_version(),
+                params={
+                    "feature_space": selected_features,
+                    "target_column": TARGET_COLUMN,
+                    "fused_features": fused_features,
+                    "dtype_plan": _dtype_plan(compact_dtypes).name,
+                },
+            )
+            cached = cache.get(stage_key)
+            if cached is not None:
+                stage.outputs((cached.arrays["X"], cached.arrays["y"]))
+
+    if cached is not None:
+        X, y = cached.arrays["X"], cached.arrays["y"]
+        preprocessing_stats = cached.meta["preprocessing_stats"]
+        feature_dataset = from_feature_matrix(X, selected_features, y, TARGET_COLUMN)
     else:
-        app_logger.error(f"Unknown model_type: {model_type}")
-        raise ValueError(f"Unknown model_type: {model_type}")
+        X, y, feature_dataset, preprocessing_stats = _prepare_features(
+            raw_data_path=raw_data_path,
+            selected_features=selected_features,
+            fused_features=fused_features,
+            stages=stages,
+            dtypes=_dtype_plan(compact_dtypes),
+        )
+        if cache is not None:
+            cache.put(
+                stage_key,
+                stage="features",
+                arrays={"X": X, "y": y},
+                extra={"preprocessing_stats": preprocessing_stats},
+            )
+
+    return X, y, feature_dataset, preprocessing_stats
+
+
+def _prepare_features(
+    raw_data_path,
+    selected_features,
+    fused_features: bool,
+    stages: StageInstrumentation,
+    dtypes: DtypePlan | None = None,
+):
+    """
+    Étapes 1 à 4 : chargement, preprocessing, feature engineering, sélection.
+    Chaque appel de port est un stage instrumenté.
 
-    app_logger.success("✅ Training pipeline completed successfully")
+    Retourne (X, y, feature_dataset, preprocessing_stats).
+    """
+    # Feature space résolu (graphe du Domain) : colonnes brutes minimales
+    # à lire et features dérivées à calculer
+    resolution = resolve_feature_space(selected_features)
+    columns = list(resolution.raw_columns) + [TARGET_COLUMN]
+    app_logger.debug(
+        f"Resolved feature space | raw columns={list(resolution.raw_columns)} | "
+        f"derived={[feature.name for feature in resolution.derived]}"
+    )
+
+    # 1️⃣ Chargement des données (seules les colonnes utiles sont lues)
+    app_logger.info("📥 Loading raw dataset")
+    if Path(raw_data_path).suffix.lower() in COLUMNAR_FORMATS:
+        loader = ArrowDatasetLoader(path=raw_data_path, columns=columns, dtype_plan=dtypes)
+    else:
+        loader = CsvDatasetLoader(path=raw_data_path, dtype_plan=dtypes, columns=columns)
+    with stages.stage("load") as stage:
+        stage.inputs(Path(raw_data_path))
+        dataset = loader.load()
+        stage.outputs(dataset)
 
-    return model, valid_rows
\ No newline at end of file
+    if fused_features:
+        # 2️⃣ → 4️⃣ Plan fusionné (une passe, matrice float32 directe)
+        app_logger.info("⚡ Fused preprocessing + feature engineering + selection")
+        plan = FusedFeaturePlan(feature_space=selected_features, dtype_plan=dtypes)
+        X, y = stages.instrument(
+            "fused_features", plan.execute, dataset, target_column=TARGET_COLUMN
+        )
+        preprocessing_stats = plan.medians
+        feature_dataset = from_feature_matrix(X, selected_features, y, TARGET_COLUMN)
+
+    else:
+        # 2️⃣ Preprocessing
+        app_logger.info("🧹 Preprocessing dataset")
+        preprocessor = PandasPreprocessingAdapter(
+            dtype_plan=dtypes, raw_columns=resolution.raw_columns
+        )
+        clean_dataset = stages.instrument("preprocess", preprocessor.preprocess, dataset)
+        preprocessing_stats = preprocessor.medians
+
+        # 3️⃣ Feature engineering (ajout uniquement)
+        app_logger.info("🧠 Feature engineering (add features)")
+        feature_engineer = PandasFeatureEngineeringAdapter(feature_space=selected_features)
+        enriched_dataset = stages.instrument(
+            "add_features", feature_engineer.add_features, clean_dataset
+        )
+
+        # 4️⃣ Feature selection (projection ML)
+        app_logger.info("🎯 Feature selection (ML projection)")
+        feature_selector = PandasFeatureSelectionAdapter(
+            feature_space=selected_features
+        )
+        feature_dataset = stages.instrument(
+            "select_features", feature_selector.select_features, enriched_dataset
+        )
+
+        X, y = stages.instrument(
+            "feature_matrix",
+            to_feature_matrix,
+            feature_dataset,
+            feature_columns=selected_features,
+            target_column=TARGET_COLUMN,
+        )
+
+    return X, y, feature_dataset, preprocessing_stats
+
+
+def _dtype_plan(compact_dtypes: bool) -> DtypePlan:
+    return DtypePlan.compact() if compact_dtypes else DtypePlan.wide()
+
+
+def _load_previous_artifact(store: ModelArtifactStore, model_type: str):
+    """
+    Dernier artefact persisté pour `model_type` (None si aucun ou illisible).
+    """
+    try:
+        return store.load(model_type=model_type)
+    except (FileNotFoundError, ValueError, OSError) as exc:
+        app_logger.info(f"No previous model for warm start | {type(exc).__name__}: {exc}")
+        return None
+
+
+def _track_run(config, run_id: str, params: dict, metrics: dict, report_path) -> None:
+    """
+    Paramètres, métriques par stage et rapport de run dans le tracking
+    d'expériences. Un échec du tracking n'invalide pas l'entraînement.
+    """
+    try:
+        tracker = build_tracker(config)
+        tracker.start_run(run_name=run_id)
+        tracker.log_params(params)
+        tracker.log_metrics(metrics)
+        if report_path is not None:
+            tracker.log_artifact(str(report_path))
+        tracker.end_run()
+    except Exception as exc:
+        app_logger.warning(f"Experiment tracking failed | {type(exc).__name__}: {exc}")
+
+
+def _feature_stage_version() -> dict:
+    """
+    Version du stage de features : règles du Domain + code des adapters.
+    """
+    return {
+        "numeric_columns": NUMERIC_COLUMNS,
+        "integer_columns": INTEGER_COLUMNS,
+        "derived_features": {
+            name: [feature.operation, *feature.inputs]
+            for name, feature in DERIVED_FEATURES.items()
+        },
+        "feature_spaces": {
+            "minimal": FEATURE_SPACE_MINIMAL,
+            "extended": FEATURE_SPACE_EXTENDED,
+        },
+        "target_column": TARGET_COLUMN,
+        "code": fingerprint_code(
+            feature_graph,
+            csv_dataset_loader,
+            arrow_dataset_loader,
+            dtype_plan,
+            pandas_dataset,
+            pandas_preprocessing_adapter,
+            pandas_feature_engineering_adapter,
+            pandas_feature_selection_adapter,
+            fused_feature_plan,
+        ),
+    }
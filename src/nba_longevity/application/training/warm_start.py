@@ -0,0 +1,206 @@
+import json
+from dataclasses import dataclass, asdict
+from pathlib import Path
+from typing import Any, Callable, Mapping, Sequence
+
+import numpy as np
+
+from nba_longevity.application.bootstrap import app_logger
+from nba_longevity.infrastructure.cache.stage_cache import fingerprint_file
+from nba_longevity.infrastructure.config.settings import WarmStartConfig
+from nba_longevity.infrastructure.metrics.threshold_sweep import ThresholdSweep
+
+
+FULL = "full"
+INCREMENTAL = "incremental"
+SKIP = "skip"
+
+# Clés de métadonnées d'artefact décrivant les données d'entraînement
+LINEAGE_KEYS = ("raw_data_bytes", "raw_data_sha256", "n_samples", "segments", "valid_auc")
+
+
+@dataclass(frozen=True)
+class WarmStartDecision:
+    """
+    Mode d'entraînement retenu et sa justification.
+    """
+
+    mode: str
+    reason: str
+    parent_hash: str | None = None
+    new_rows: int = 0
+    reference_auc: float | None = None
+    current_auc: float | None = None
+    incremental_updates: int = 0
+
+    def to_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+
+def data_lineage(raw_data_path: str | Path, n_samples: int) -> dict[str, Any]:
+    """
+    Métadonnées de lignée des données : taille et hash du fichier brut,
+    nombre de lignes de la matrice de features.
+    """
+    return {
+        "raw_data_bytes": Path(raw_data_path).stat().st_size,
+        "raw_data_sha256": fingerprint_file(raw_data_path),
+        "n_samples": int(n_samples),
+    }
+
+
+def validation_proba(
+    model: Any,
+    model_type: str,
+    X: np.ndarray,
+    valid_idx: np.ndarray,
+    feature_columns: Sequence[str],
+) -> np.ndarray:
+    """
+    Probabilités d'un modèle sur la validation (prédicteurs du scoring).
+    """
+    if model_type == "xgboost":
+        from nba_longevity.infrastructure.inference.xgboost_predictor import XGBoostPredictor
+
+        predictor = XGBoostPredictor(model, feature_columns=feature_columns)
+    else:
+        from nba_longevity.infrastructure.inference.catboost_predictor import CatBoostPredictor
+
+        predictor = CatBoostPredictor(model, feature_columns=feature_columns)
+
+    return predictor.predict_matrix(X[valid_idx])
+
+
+def validation_auc(
+    model: Any,
+    model_type: str,
+    X: np.ndarray,
+    y: np.ndarray,
+    valid_idx: np.ndarray,
+    feature_columns: Sequence[str],
+) -> float:
+    """
+    AUC de validation d'un modèle.
+    """
+    proba = validation_proba(model, model_type, X, valid_idx, feature_columns)
+    return ThresholdSweep.from_scores(y[valid_idx], proba).auc()
+
+
+class WarmStartPolicy:
+    """
+    Choix entre mise à jour incrémentale et ré-entraînement complet.
+
+    Incrémental uniquement si :
+    - un modèle précédent existe, sur le même feature space, avec sa lignée
+    - mêmes hyperparamètres et même plan de types que le modèle précédent
+    - les données brutes ont seulement été complétées par ajout
+      (préfixe identique au fichier d'entraînement du modèle précédent)
+    - la part de nouvelles lignes et le nombre de mises à jour chaînées
+      restent sous leurs seuils
+    - l'AUC du modèle précédent sur la validation courante n'a pas chuté
+      de plus de `max_auc_drop` par rapport à son AUC d'entraînement
+
+    Aucune nouvelle ligne : `skip` (le modèle précédent reste en place).
+    """
+
+    def __init__(self, config: WarmStartConfig):
+        self.config = config
+
+    def decide(
+        self,
+        previous_hash: str | None,
+        previous_metadata: Mapping[str, Any] | None,
+        previous_features: Sequence[str] | None,
+        feature_columns: Sequence[str],
+        raw_data_path: str | Path,
+        n_samples: int,
+        current_auc: Callable[[], float],
+        model_params: Mapping[str, Any] | None = None,
+        dtype_plan: str | None = None,
+    ) -> WarmStartDecision:
+        """
+        `current_auc` : AUC du modèle précédent sur la validation courante,
+        évaluée seulement si les autres conditions sont remplies.
+        """
+        if not self.config.enabled:
+            return WarmStartDecision(FULL, "warm start disabled")
+        if previous_hash is None or previous_metadata is None:
+            return WarmStartDecision(FULL, "no previous model")
+        if list(previous_features or []) != list(feature_columns):
+            return WarmStartDecision(FULL, "feature space changed", parent_hash=previous_hash)
+        if any(key not in previous_metadata for key in LINEAGE_KEYS):
+            return WarmStartDecision(FULL, "previous model has no data lineage", parent_hash=previous_hash)
+        if _normalized(previous_metadata.get("model_params")) != _normalized(model_params):
+            return WarmStartDecision(FULL, "model params changed", parent_hash=previous_hash)
+        if previous_metadata.get("dtype_plan") != dtype_plan:
+            return WarmStartDecision(FULL, "dtype plan changed", parent_hash=previous_hash)
+
+        previous_bytes = int(previous_metadata["raw_data_bytes"])
+        if (
+            Path(raw_data_path).stat().st_size < previous_bytes
+            or fingerprint_file(raw_data_path, n_bytes=previous_bytes)
+            != previous_metadata["raw_data_sha256"]
+        ):
+            return WarmStartDecision(FULL, "raw data rewritten (not append-only)", parent_hash=previous_hash)
+
+        new_rows = int(n_samples) - int(previous_metadata["n_samples"])
+        updates = int(previous_metadata.get("incremental_updates", 0))
+        common = {"parent_hash": previous_hash, "new_rows": max(new_rows, 0), "incremental_updates": updates}
+
+        if new_rows <= 0:
+            return WarmStartDecision(SKIP, "no new rows", **common)
+        if new_rows / n_samples > self.config.max_new_fraction:
+            return WarmStartDecision(FULL, f"new rows fraction {new_rows / n_samples:.2f} too large", **common)
+        if updates >= self.config.max_incremental_updates:
+            return WarmStartDecision(FULL, f"{updates} chained incremental updates", **common)
+
+        reference_auc = float(previous_metadata["valid_auc"])
+        auc = current_auc()
+        common.update(reference_auc=reference_auc, current_auc=auc)
+
+        if reference_auc - auc > self.config.max_auc_drop:
+            return WarmStartDecision(
+                FULL, f"validation AUC drop {reference_auc - auc:.4f} > {self.config.max_auc_drop}", **common
+            )
+
+        return WarmStartDecision(INCREMENTAL, "append-only data, AUC within tolerance", **common)
+
+    def accept_incremental(self, decision: WarmStartDecision, incremental_auc: float) -> bool:
+        """
+        Contrôle a posteriori : le modèle mis à jour ne doit pas perdre
+        plus de `max_auc_drop` d'AUC par rapport au modèle précédent,
+        évalué sur la même validation (`current_auc`).
+        """
+        accepted = decision.current_auc - incremental_auc <= self.config.max_auc_drop
+
+        if not accepted:
+            app_logger.warning(
+                f"Incremental model rejected | auc={incremental_auc:.5f} | "
+                f"previous model={decision.current_auc:.5f}"
+            )
+
+        return accepted
+
+
+def _normalized(params: Mapping[str, Any] | None) -> str | None:
+    """
+    Forme canonique des hyperparamètres (ceux d'un manifeste sont relus
+    depuis du JSON).
+    """
+    if params is None:
+        return None
+    return json.dumps(dict(params), sort_keys=True, default=str)
+
+
+def incremental_params(
+    model_type: str,
+    params: Mapping[str, Any],
+    rounds: int,
+) -> dict[str, Any]:
+    """
+    Paramètres d'une mise à jour : le budget d'arbres devient le nombre
+    d'arbres ajoutés au modèle précédent.
+    """
+    params = dict(params)
+    params["num_boost_round" if model_type == "xgboost" else "iterations"] = rounds
+    return params
@@ -0,0 +1,161 @@
+import argparse
+import time
+from datetime import datetime, timezone
+
+# 🔹 Logger
+from nba_longevity.application.bootstrap import app_logger, config_dir, get_config
+
+# Feature spaces (Domain)
+from nba_longevity.domain.features.feature_spaces import (
+    FEATURE_SPACE_MINIMAL,
+    FEATURE_SPACE_EXTENDED,
+)
+
+# Features & split (mêmes étapes que l'entraînement)
+from nba_longevity.application.training.run_training_pipeline import load_feature_matrix
+from nba_longevity.application.splitting.index_split import split_train_valid_indices
+
+# Search
+from nba_longevity.application.tuning.successive_halving import BudgetedSearch, rank_trials
+from nba_longevity.infrastructure.tuning.parallel_trial_runner import (
+    ParallelTrialRunner,
+    THREAD_PARAMS,
+)
+from nba_longevity.infrastructure.tuning.leaderboard import write_leaderboard
+
+# Config & utils
+from nba_longevity.infrastructure.config.settings import load_model_config
+
+
+def run_hyperparameter_search(
+    model_type: str = "xgboost",
+    feature_space: str = "minimal",
+    strategy: str | None = None,
+    n_workers: int | None = None,
+    threads_per_trial: int = 1,
+    seed: int = 42,
+):
+    """
+    Recherche d'hyperparamètres à budget (successive halving / Hyperband).
+
+    - espace de recherche et paramètres de base : config/model/<model_type>.yml
+    - même matrice de features et même split que le pipeline d'entraînement
+    - essais exécutés en parallèle (pool de processus, mémoire partagée)
+    - leaderboard écrit dans artifacts_dir/search/<model_type>_<horodatage>/
+
+    Retourne (best_params, leaderboard_path) ; best_params est utilisable
+    tel quel par run_training(params=...).
+    """
+
+    app_logger.info(
+        f"🚀 Starting hyperparameter search | model={model_type} | feature_space={feature_space}"
+    )
+
+    # 0️⃣ Config infra + modèle
+    config = get_config()
+    model_config = load_model_config(config_dir() / "model" / f"{model_type}.yml")
+
+    search_config = model_config.search
+    if search_config is None:
+        raise ValueError(f"No search section in config/model/{model_type}.yml")
+
+    selected_features = (
+        FEATURE_SPACE_EXTENDED if feature_space == "extended" else FEATURE_SPACE_MINIMAL
+    )
+
+    # 1️⃣ Features (cache de stages) + split
+    X, y, _, _ = load_feature_matrix(
+        raw_data_path=config.paths.raw_data,
+        artifacts_dir=config.paths.artifacts_dir,
+        selected_features=selected_features,
+    )
+    train_idx, valid_idx = split_train_valid_indices(y, valid_size=0.2, seed=42)
+
+    # 2️⃣ Recherche
+    search = BudgetedSearch(
+        space=search_config.space,
+        min_resource=search_config.min_resource,
+        max_resource=search_config.max_resource,
+        reduction_factor=search_config.reduction_factor,
+        strategy=strategy or search_config.strategy,
+        seed=seed,
+    )
+
+    start = time.perf_counter()
+    with ParallelTrialRunner(
+        model_type=model_type,
+        X=X,
+        y=y,
+        train_idx=train_idx,
+        valid_idx=valid_idx,
+        feature_columns=selected_features,
+        base_params=model_config.params,
+        resource_param=search_config.resource,
+        n_workers=n_workers,
+        threads_per_trial=threads_per_trial,
+    ) as runner:
+        results = search.run(runner.run)
+        wall_time_s = time.perf_counter() - start
+
+        successful = [r for r in results if r.ok]
+        if not successful:
+            raise RuntimeError("All search trials failed")
+
+        # Meilleur essai (même classement que le leaderboard)
+        best = rank_trials(successful)[0]
+        best_params = runner.trial_params(best.spec)
+
+    # Le nombre de threads dépend de la machine : laissé au ré-entraînement
+    best_params.pop(THREAD_PARAMS[model_type], None)
+
+    # 3️⃣ Leaderboard
+    run_name = f"{model_type}_{datetime.now(timezone.utc):%Y%m%dT%H%M%SZ}"
+    leaderboard_path = write_leaderboard(
+        results,
+        output_dir=config.paths.artifacts_dir / "search" / run_name,
+        summary={
+            "model_type": model_type,
+            "feature_space": feature_space,
+            "strategy": strategy or search_config.strategy,
+            "n_trials": len(results),
+            "n_failed": len(results) - len(successful),
+            "n_workers": runner.n_workers,
+            "threads_per_trial": threads_per_trial,
+            "wall_time_s": round(wall_time_s, 3),
+            "trial_time_s": round(sum(r.wall_time_s for r in results), 3),
+            "best_trial_id": best.spec.trial_id,
+            "best_score": best.score,
+            "best_params": best_params,
+        },
+    )
+
+    app_logger.success(
+        f"✅ Search completed | trials={len(results)} | best_score={best.score:.5f} | "
+        f"wall_time={wall_time_s:.1f}s"
+    )
+
+    return best_params, leaderboard_path
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Budget-aware hyperparameter search")
+    parser.add_argument("--model-type", default="xgboost", choices=["xgboost", "catboost"])
+    parser.add_argument("--feature-space", default="minimal", choices=["minimal", "extended"])
+    parser.add_argument("--strategy", default=None, choices=["hyperband", "successive_halving"])
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--threads-per-trial", type=int, default=1)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    run_hyperparameter_search(
+        model_type=args.model_type,
+        feature_space=args.feature_space,
+        strategy=args.strategy,
+        n_workers=args.workers,
+        threads_per_trial=args.threads_per_trial,
+        seed=args.seed,
+    )
+
+
+if __name__ == "__main__":
+    main()
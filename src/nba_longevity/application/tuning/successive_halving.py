@@ -0,0 +1,209 @@
+import math
+from dataclasses import dataclass, field
+from typing import Any, Callable, Mapping, Sequence
+
+import numpy as np
+
+from nba_longevity.application.bootstrap import app_logger
+
+
+@dataclass(frozen=True)
+class TrialSpec:
+    """
+    Un essai : une configuration évaluée avec un budget donné.
+    """
+
+    trial_id: int
+    config_id: int
+    bracket: int
+    rung: int
+    resource: int
+    params: dict[str, Any]
+
+
+@dataclass(frozen=True)
+class TrialResult:
+    spec: TrialSpec
+    score: float
+    best_iteration: int | None
+    wall_time_s: float
+    error: str | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None and not math.isnan(self.score)
+
+
+@dataclass
+class _Bracket:
+    index: int
+    resources: list[int]
+    keep: list[int]
+    configs: dict[int, dict[str, Any]]
+    rung: int = 0
+    survivors: list[int] = field(default_factory=list)
+
+
+def rank_trials(results: Sequence[TrialResult]) -> list[TrialResult]:
+    """
+    Classement des essais, meilleur en tête : score décroissant ; à score
+    égal, le plus petit budget puis l'essai le plus ancien. Essais en
+    échec en dernier (par trial_id).
+
+    Règle unique : choix du meilleur essai et leaderboard.
+    """
+    return sorted(
+        results,
+        key=lambda r: (0, -r.score, r.spec.resource, r.spec.trial_id) if r.ok
+        else (1, 0.0, 0, r.spec.trial_id),
+    )
+
+
+def sample_params(space: Mapping[str, Any], rng: np.random.Generator) -> dict[str, Any]:
+    """
+    Tire une configuration dans l'espace de recherche
+    (int / uniform / loguniform / choice).
+    """
+    params = {}
+    for name, dim in space.items():
+        if dim.type == "int":
+            params[name] = int(rng.integers(int(dim.low), int(dim.high) + 1))
+        elif dim.type == "uniform":
+            params[name] = float(rng.uniform(dim.low, dim.high))
+        elif dim.type == "loguniform":
+            params[name] = float(np.exp(rng.uniform(np.log(dim.low), np.log(dim.high))))
+        elif dim.type == "choice":
+            params[name] = dim.values[int(rng.integers(len(dim.values)))]
+        else:
+            raise ValueError(f"Unknown search dimension type: {dim.type}")
+    return params
+
+
+def hyperband_brackets(
+    min_resource: int,
+    max_resource: int,
+    reduction_factor: int = 3,
+) -> list[list[tuple[int, int]]]:
+    """
+    Brackets Hyperband : pour chaque bracket, la liste des rungs
+    (nombre de configurations, budget par configuration).
+
+    Le bracket 0 est le plus exploratoire (successive halving depuis
+    `min_resource`), le dernier évalue peu de configurations au budget max.
+    """
+    if min_resource <= 0 or max_resource < min_resource:
+        raise ValueError(f"Invalid resources: min={min_resource}, max={max_resource}")
+    if reduction_factor < 2:
+        raise ValueError(f"reduction_factor doit être >= 2 : {reduction_factor}")
+
+    eta = reduction_factor
+    s_max = int(math.floor(math.log(max_resource / min_resource, eta) + 1e-9))
+
+    brackets = []
+    for s in range(s_max, -1, -1):
+        n = int(math.ceil((s_max + 1) / (s + 1) * eta ** s))
+        rungs = []
+        for i in range(s + 1):
+            n_i = max(int(n // eta ** i), 1)
+            r_i = int(round(max_resource * eta ** (i - s)))
+            rungs.append((n_i, r_i))
+        brackets.append(rungs)
+
+    return brackets
+
+
+class BudgetedSearch:
+    """
+    Recherche d'hyperparamètres par successive halving / Hyperband.
+
+    - chaque rung évalue ses configurations avec un budget croissant,
+      seules les 1 / reduction_factor meilleures sont promues
+    - les brackets sont indépendants : le rung courant de chaque bracket
+      actif est soumis dans une même vague, pour occuper tous les workers
+    - `evaluate` reçoit une vague d'essais et retourne leurs résultats
+      (exécution parallèle déléguée à l'infrastructure)
+    """
+
+    def __init__(
+        self,
+        space: Mapping[str, Any],
+        min_resource: int,
+        max_resource: int,
+        reduction_factor: int = 3,
+        strategy: str = "hyperband",
+        seed: int = 42,
+    ):
+        if strategy not in ("hyperband", "successive_halving"):
+            raise ValueError(f"Unknown search strategy: {strategy}")
+
+        self.space = space
+        self.reduction_factor = reduction_factor
+        self.rng = np.random.default_rng(seed)
+
+        brackets = hyperband_brackets(min_resource, max_resource, reduction_factor)
+        # successive halving = le seul bracket le plus exploratoire
+        self.brackets_plan = brackets[:1] if strategy == "successive_halving" else brackets
+
+    def run(
+        self,
+        evaluate: Callable[[Sequence[TrialSpec]], Sequence[TrialResult]],
+    ) -> list[TrialResult]:
+        brackets = []
+        config_id = 0
+        for index, rungs in enumerate(self.brackets_plan):
+            configs = {}
+            for _ in range(rungs[0][0]):
+                configs[config_id] = sample_params(self.space, self.rng)
+                config_id += 1
+            brackets.append(_Bracket(
+                index=index,
+                resources=[r for _, r in rungs],
+                keep=[n for n, _ in rungs[1:]],
+                configs=configs,
+                survivors=list(configs),
+            ))
+
+        app_logger.info(
+            f"🔎 Budgeted search | brackets={len(brackets)} | configs={config_id} | "
+            f"trials={sum(n for rungs in self.brackets_plan for n, _ in rungs)}"
+        )
+
+        results: list[TrialResult] = []
+        wave = 0
+        while True:
+            active = [b for b in brackets if b.rung < len(b.resources)]
+            if not active:
+                break
+
+            specs = []
+            for bracket in active:
+                for cid in bracket.survivors:
+                    specs.append(TrialSpec(
+                        trial_id=len(results) + len(specs),
+                        config_id=cid,
+                        bracket=bracket.index,
+                        rung=bracket.rung,
+                        resource=bracket.resources[bracket.rung],
+                        params=bracket.configs[cid],
+                    ))
+
+            app_logger.info(f"Wave {wave} | trials={len(specs)}")
+            wave_results = list(evaluate(specs))
+            results.extend(wave_results)
+
+            for bracket in active:
+                self._promote(bracket, wave_results)
+            wave += 1
+
+        return results
+
+    def _promote(self, bracket: _Bracket, wave_results: Sequence[TrialResult]) -> None:
+        scored = [
+            r for r in wave_results
+            if r.spec.bracket == bracket.index and r.spec.rung == bracket.rung
+        ]
+        if bracket.rung < len(bracket.keep):
+            # Les essais en échec (score NaN) sont classés en dernier
+            scored.sort(key=lambda r: r.score if r.ok else -np.inf, reverse=True)
+            bracket.survivors = [r.spec.config_id for r in scored[:bracket.keep[bracket.rung]]]
+        bracket.rung += 1
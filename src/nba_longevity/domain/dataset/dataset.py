@@ -1,4 +1,4 @@
-from typing import Protocol, Iterable, Mapping, Any
+from typing import Protocol, Iterable, Mapping, Any, Sequence, runtime_checkable
 
 
 class Dataset(Protocol):
@@ -17,3 +17,33 @@ class Dataset(Protocol):
         Chaque ligne représente une observation métier.
         """
         ...
+
+
+@runtime_checkable
+class ColumnarDataset(Dataset, Protocol):
+    """
+    Dataset capable d'exposer ses données par colonnes.
+
+    Accès optionnel : un adapter vérifie `isinstance(dataset, ColumnarDataset)`
+    et retombe sur l'itération ligne par ligne sinon.
+
+    Le Domain ne connaît pas le type concret des colonnes retournées
+    (tableau NumPy, colonne Arrow...) : seul l'infrastructure les manipule.
+    """
+
+    @property
+    def columns(self) -> Sequence[str]:
+        """
+        Noms des colonnes du dataset, dans l'ordre physique.
+        """
+        ...
+
+    def to_columns(
+        self,
+        columns: Sequence[str] | None = None,
+    ) -> Mapping[str, Any]:
+        """
+        Retourne les colonnes demandées (toutes si None) sous forme
+        de tableaux, sans copie lorsque le backend le permet.
+        """
+        ...
@@ -0,0 +1,130 @@
+"""
+Graphe de dépendances des features dérivées.
+
+Chaque feature dérivée est déclarée une seule fois, avec son opération
+et ses entrées (colonnes brutes ou autres features dérivées). Un feature
+space est résolu en :
+- colonnes brutes minimales à charger (+ colonne du filtre de sécurité)
+- features dérivées à calculer, dans l'ordre des dépendances
+
+Une feature ajoutée ici est calculée par tous les backends et bénéficie
+automatiquement de l'élagage des colonnes.
+
+Aucune logique technique ici (Pandas, Spark, NumPy...) : les opérations
+sont nommées, chaque backend les implémente.
+"""
+
+from dataclasses import dataclass
+from typing import Sequence
+
+from nba_longevity.domain.preprocessing.preprocessing_rules import (
+    FILTER_COLUMN,
+    NUMERIC_COLUMNS,
+)
+
+
+# Opérations
+RATIO = "ratio"     # numérateur / (dénominateur + eps)
+SUM = "sum"         # somme des entrées
+
+_ARITY = {RATIO: 2, SUM: None}
+
+
+@dataclass(frozen=True)
+class DerivedFeature:
+    """
+    Feature métier calculée à partir d'autres colonnes.
+    """
+
+    name: str
+    operation: str
+    inputs: tuple[str, ...]
+
+    def __post_init__(self):
+        if self.operation not in _ARITY:
+            raise ValueError(f"Opération inconnue pour {self.name} : {self.operation}")
+        arity = _ARITY[self.operation]
+        if (arity is not None and len(self.inputs) != arity) or not self.inputs:
+            raise ValueError(f"{self.name} : {len(self.inputs)} entrées pour '{self.operation}'")
+
+
+DERIVED_FEATURES: dict[str, DerivedFeature] = {
+    feature.name: feature
+    for feature in (
+        # Usage & efficacité
+        DerivedFeature("PointsPerMinute", RATIO, ("PointsPerGame", "MinutesPerGame")),
+        DerivedFeature("FieldGoalEfficiency", RATIO, ("FieldGoalsMade", "FieldGoalsAttempted")),
+        DerivedFeature("ThreePointRate", RATIO, ("ThreePointersAttempted", "FieldGoalsAttempted")),
+        DerivedFeature("FreeThrowRate", RATIO, ("FreeThrowsAttempted", "MinutesPerGame")),
+
+        # Impact collectif
+        DerivedFeature("AssistToTurnoverRatio", RATIO, ("Assists", "Turnovers")),
+        DerivedFeature("ReboundRate", RATIO, ("TotalRebounds", "MinutesPerGame")),
+        DerivedFeature("DefensiveImpact", SUM, ("Steals", "Blocks")),
+    )
+}
+
+
+@dataclass(frozen=True)
+class FeatureResolution:
+    """
+    Ce qu'il faut charger et calculer pour produire un feature space.
+    """
+
+    feature_space: tuple[str, ...]
+    raw_columns: tuple[str, ...]
+    derived: tuple[DerivedFeature, ...]
+
+
+def resolve_feature_space(feature_space: Sequence[str]) -> FeatureResolution:
+    """
+    Résout un feature space : colonnes brutes nécessaires (ordre stable,
+    colonne du filtre en tête) et features dérivées dans l'ordre de calcul
+    (entrées avant la feature).
+
+    Lève ValueError pour une feature inconnue ou une dépendance circulaire.
+    """
+    raw_columns = [FILTER_COLUMN]
+    derived: list[DerivedFeature] = []
+    resolved: set[str] = set()
+    visiting: set[str] = set()
+
+    def visit(name: str) -> None:
+        if name in resolved:
+            return
+        feature = DERIVED_FEATURES.get(name)
+        if feature is None:
+            if name not in NUMERIC_COLUMNS:
+                raise ValueError(f"Feature inconnue : {name}")
+            if name not in raw_columns:
+                raw_columns.append(name)
+            resolved.add(name)
+            return
+
+        if name in visiting:
+            raise ValueError(f"Dépendance circulaire sur la feature : {name}")
+        visiting.add(name)
+        for dependency in feature.inputs:
+            visit(dependency)
+        visiting.discard(name)
+
+        derived.append(feature)
+        resolved.add(name)
+
+    for name in feature_space:
+        visit(name)
+
+    return FeatureResolution(
+        feature_space=tuple(feature_space),
+        raw_columns=tuple(raw_columns),
+        derived=tuple(derived),
+    )
+
+
+def required_raw_columns(feature_space: Sequence[str]) -> list[str]:
+    """
+    Colonnes brutes nécessaires pour produire un feature space
+    (entrées des features dérivées + colonne du filtre de sécurité).
+    Sert aussi à la projection des colonnes au chargement.
+    """
+    return list(resolve_feature_space(feature_space).raw_columns)
@@ -0,0 +1,26 @@
+from typing import Protocol, Any, Mapping
+
+
+class ExperimentTrackerPort(Protocol):
+    """
+    Contrat de suivi d'expériences (paramètres, métriques, artefacts d'un run).
+    Le Domain ne sait pas si c'est MLflow ou un stockage local.
+    """
+
+    def start_run(self, run_name: str) -> str:
+        """
+        Ouvre un run et retourne son identifiant.
+        """
+        ...
+
+    def log_params(self, params: Mapping[str, Any]) -> None:
+        ...
+
+    def log_metrics(self, metrics: Mapping[str, float], step: int | None = None) -> None:
+        ...
+
+    def log_artifact(self, path: str) -> None:
+        ...
+
+    def end_run(self, status: str = "FINISHED") -> None:
+        ...
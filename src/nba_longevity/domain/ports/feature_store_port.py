@@ -0,0 +1,30 @@
+from typing import Protocol, Sequence
+
+
+class PlayerFeatureStorePort(Protocol):
+    """
+    Contrat d'accès aux features déjà calculées d'un joueur, par identifiant.
+    Le Domain ne sait pas si les vecteurs viennent d'un fichier mappé
+    en mémoire ou d'un service distant.
+    """
+
+    @property
+    def feature_columns(self) -> Sequence[str]:
+        """
+        Colonnes matérialisées, dans l'ordre de stockage.
+        """
+        ...
+
+    def __contains__(self, player_id: object) -> bool:
+        ...
+
+    def get_many(
+        self,
+        player_ids: Sequence[str],
+        feature_columns: Sequence[str],
+    ):
+        """
+        Vecteurs de features (lignes × feature_columns) des joueurs demandés
+        et masque des identifiants trouvés (ligne non définie sinon).
+        """
+        ...
@@ -0,0 +1,30 @@
+from typing import Protocol, Any, Mapping, Sequence
+
+
+class ModelStorePort(Protocol):
+    """
+    Contrat de persistance des modèles entraînés.
+
+    Un artefact = modèle + espace de features + statistiques de
+    preprocessing, identifié par un hash de contenu.
+    Le Domain ne connaît ni le format binaire ni l'emplacement physique.
+    """
+
+    def save(
+        self,
+        model: Any,
+        model_type: str,
+        feature_columns: Sequence[str],
+        preprocessing_stats: Mapping[str, float],
+        metadata: Mapping[str, Any] | None = None,
+    ) -> str:
+        """
+        Persiste un modèle et retourne son hash de contenu.
+        """
+        ...
+
+    def load(self, model_hash: str | None = None, model_type: str | None = None) -> Any:
+        """
+        Charge un artefact par hash (ou le dernier enregistré).
+        """
+        ...
@@ -0,0 +1,36 @@
+import time
+from dataclasses import dataclass, field
+from typing import Protocol, Sequence
+
+
+@dataclass(frozen=True, slots=True)
+class PredictionRecord:
+    """
+    Trace d'une prédiction servie.
+
+    `feature_hash` : empreinte du vecteur de features (ordre du modèle),
+    pour retrouver / dédoublonner les entrées sans les stocker.
+    """
+
+    player_id: str | None
+    feature_hash: str
+    model_hash: str
+    probability: float
+    latency_ms: float
+    logged_at: float = field(default_factory=time.time)
+
+
+class PredictionLogPort(Protocol):
+    """
+    Contrat de stockage des traces de prédiction.
+    Le Domain ne sait pas si c'est Postgres ou un fichier SQLite local.
+    """
+
+    def write_batch(self, records: Sequence[PredictionRecord]) -> None:
+        """
+        Écrit un lot de traces en une seule transaction (tout ou rien).
+        """
+        ...
+
+    def close(self) -> None:
+        ...
@@ -5,6 +5,12 @@ class PredictorPort(Protocol):
     def predict_proba(
         self,
         rows: Sequence[Mapping[str, object]],
-        feature_columns: Sequence[str],
+        feature_columns: Sequence[str] | None = None,
     ) -> Sequence[float]:
+        """
+        Probabilité de la classe positive pour chaque ligne.
+
+        `feature_columns` : espace de features attendu, dans l'ordre
+        d'entraînement (None = celui du modèle).
+        """
         ...
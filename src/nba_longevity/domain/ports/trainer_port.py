@@ -16,3 +16,23 @@ class TrainerPort(Protocol):
         params: dict[str, object],
     ) -> Any:
         ...
+
+    def train_matrix(
+        self,
+        X: Any,
+        y: Any,
+        train_idx: Any,
+        valid_idx: Any,
+        feature_columns: Sequence[str],
+        params: dict[str, object],
+        init_model: Any = None,
+    ) -> Any:
+        """
+        Entraîne à partir d'une unique matrice de features partagée
+        et des indices de lignes train / validation (aucune recopie
+        ligne par ligne).
+
+        `init_model` : modèle déjà entraîné à poursuivre (warm start) ;
+        les nouveaux arbres sont ajoutés aux siens.
+        """
+        ...
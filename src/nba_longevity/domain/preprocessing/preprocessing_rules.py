@@ -20,5 +20,13 @@ NUMERIC_COLUMNS = [
     "Turnovers"
 ]
 
+# Colonnes de comptage : valeurs entières (sous-ensemble de NUMERIC_COLUMNS)
+INTEGER_COLUMNS = [
+    "GamesPlayed",
+]
+
+# Filtre de sécurité : lignes conservées si cette colonne est > 0
+FILTER_COLUMN = "MinutesPerGame"
+
 TARGET_COLUMN = "Target5Years"
 ID_COLUMN = "PlayerName"
\ No newline at end of file
@@ -0,0 +1,413 @@
+"""
+MODEL ARTIFACT STORE
+====================
+
+Responsibilities
+----------------
+- Persist a trained model in its native binary format
+  (XGBoost UBJSON `.ubj`, CatBoost `.cbm`)
+- Persist the feature-space manifest and preprocessing statistics
+- Identify every artifact by a content hash (SHA-256)
+- Export tree ensembles to NumPy arrays next to the native model, so
+  scoring processes can skip the model library (`backend="compiled"`)
+- Load artifacts with integrity verification and a warm in-process cache
+- Measure and report load latency (cold start of scoring processes)
+
+Layout
+------
+<artifacts_dir>/models/<hash>/model.<ext>
+<artifacts_dir>/models/<hash>/compiled_trees.npz
+<artifacts_dir>/models/<hash>/manifest.json
+<artifacts_dir>/models/latest_<model_type>   (pointer → hash)
+
+Rules
+-----
+- No ML training logic
+- Model libraries are imported lazily: a scoring process only imports
+  the library of the model it actually loads
+"""
+
+from __future__ import annotations
+
+import hashlib
+import io
+import json
+import os
+import shutil
+import tempfile
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Final, Mapping, Sequence
+
+from pydantic import BaseModel
+
+from nba_longevity.application.bootstrap import app_logger
+from nba_longevity.domain.ports.model_store_port import ModelStorePort
+
+
+MODELS_DIR_NAME: Final[str] = "models"
+MANIFEST_FILE_NAME: Final[str] = "manifest.json"
+COMPILED_FILE_NAME: Final[str] = "compiled_trees.npz"
+
+NATIVE_BACKEND: Final[str] = "native"
+COMPILED_BACKEND: Final[str] = "compiled"
+BACKENDS: Final[tuple[str, ...]] = (NATIVE_BACKEND, COMPILED_BACKEND)
+
+MODEL_FORMATS: Final[dict[str, str]] = {
+    "xgboost": "ubj",
+    "catboost": "cbm",
+}
+
+
+# -------------------------------------------------------------------------
+# Manifest & artifact
+# -------------------------------------------------------------------------
+class ModelManifest(BaseModel):
+    content_hash: str
+    model_type: str
+    model_format: str
+    feature_columns: list[str]
+    preprocessing_stats: dict[str, float]
+    metadata: dict[str, Any] = {}
+    created_at: str
+    # Export NumPy (dérivé du modèle, hors hash de contenu)
+    compiled_sha256: str | None = None
+
+    model_config = {
+        "frozen": True
+    }
+
+
+@dataclass(frozen=True)
+class ModelArtifact:
+    """
+    `model` : modèle natif, ou ensemble d'arbres compilé si
+    `backend == "compiled"`.
+    """
+
+    model: Any
+    manifest: ModelManifest
+    load_stats: dict[str, float | bool] = field(default_factory=dict)
+    backend: str = NATIVE_BACKEND
+
+    @property
+    def content_hash(self) -> str:
+        return self.manifest.content_hash
+
+
+class ArtifactIntegrityError(RuntimeError):
+    """
+    Le contenu d'un artefact ne correspond pas à son hash.
+    """
+
+
+# Warm cache partagé par toutes les instances du store (clé = hash, backend)
+_CACHE: dict[tuple[str, str], ModelArtifact] = {}
+_CACHE_LOCK = threading.Lock()
+
+
+def clear_model_cache() -> None:
+    with _CACHE_LOCK:
+        _CACHE.clear()
+
+
+# -------------------------------------------------------------------------
+# Store
+# -------------------------------------------------------------------------
+class ModelArtifactStore(ModelStorePort):
+    """
+    Store d'artefacts modèles sur le système de fichiers local.
+    """
+
+    def __init__(self, artifacts_dir: Path | str, verify: bool = True):
+        self.root = Path(artifacts_dir) / MODELS_DIR_NAME
+        self.verify = verify
+
+    # ------------------------------------------------------------------
+    # Save
+    # ------------------------------------------------------------------
+    def save(
+        self,
+        model: Any,
+        model_type: str,
+        feature_columns: Sequence[str],
+        preprocessing_stats: Mapping[str, float],
+        metadata: Mapping[str, Any] | None = None,
+    ) -> str:
+        model_format = self._model_format(model_type)
+        model_bytes = serialize_model(model, model_type)
+
+        core = {
+            "model_type": model_type,
+            "model_format": model_format,
+            "feature_columns": list(feature_columns),
+            "preprocessing_stats": {k: float(v) for k, v in preprocessing_stats.items()},
+            "metadata": dict(metadata or {}),
+        }
+        # Normalisation JSON : le hash recalculé au chargement porte
+        # exactement sur ce qui est écrit dans le manifest
+        core = json.loads(json.dumps(core, default=str))
+        content_hash = _content_hash(model_bytes, core)
+
+        target_dir = self.root / content_hash
+        if not target_dir.exists():
+            compiled_bytes = _compile_to_bytes(model, model_type)
+            manifest = ModelManifest(
+                content_hash=content_hash,
+                created_at=datetime.now(timezone.utc).isoformat(),
+                compiled_sha256=(
+                    hashlib.sha256(compiled_bytes).hexdigest() if compiled_bytes else None
+                ),
+                **core,
+            )
+
+            # Écriture atomique : répertoire temporaire puis rename
+            self.root.mkdir(parents=True, exist_ok=True)
+            tmp_dir = Path(tempfile.mkdtemp(dir=self.root, prefix=".tmp-"))
+            try:
+                (tmp_dir / f"model.{model_format}").write_bytes(model_bytes)
+                if compiled_bytes:
+                    (tmp_dir / COMPILED_FILE_NAME).write_bytes(compiled_bytes)
+                (tmp_dir / MANIFEST_FILE_NAME).write_text(manifest.model_dump_json(indent=2))
+                os.replace(tmp_dir, target_dir)
+            except OSError:
+                shutil.rmtree(tmp_dir, ignore_errors=True)
+                if not target_dir.exists():
+                    raise
+
+        self._write_pointer(model_type, content_hash)
+
+        app_logger.info(
+            f"💾 Model artifact saved | type={model_type} | "
+            f"hash={content_hash[:12]} | size={len(model_bytes)} bytes"
+        )
+
+        return content_hash
+
+    # ------------------------------------------------------------------
+    # Load
+    # ------------------------------------------------------------------
+    def load(
+        self,
+        model_hash: str | None = None,
+        model_type: str | None = None,
+        backend: str = NATIVE_BACKEND,
+    ) -> ModelArtifact:
+        """
+        Charge un artefact par hash, ou le dernier enregistré pour
+        `model_type` si aucun hash n'est fourni.
+
+        `backend="compiled"` : ensemble d'arbres NumPy, sans importer la
+        librairie du modèle (exporté à la volée pour un artefact
+        antérieur à l'export, ce qui importe alors la librairie).
+        """
+        start = time.perf_counter()
+
+        if backend not in BACKENDS:
+            raise ValueError(f"Unknown backend: {backend}")
+
+        if model_hash is None:
+            if model_type is None:
+                raise ValueError("model_hash ou model_type doit être fourni")
+            model_hash = self.latest_hash(model_type)
+
+        with _CACHE_LOCK:
+            cached = _CACHE.get((model_hash, backend))
+        if cached is not None:
+            total = time.perf_counter() - start
+            app_logger.debug(
+                f"Model artifact cache hit | hash={model_hash[:12]} | "
+                f"load_ms={total * 1000:.3f}"
+            )
+            return ModelArtifact(
+                model=cached.model,
+                manifest=cached.manifest,
+                load_stats={"cache_hit": True, "total_seconds": total},
+                backend=backend,
+            )
+
+        artifact_dir = self.root / model_hash
+        if not artifact_dir.is_dir():
+            raise FileNotFoundError(f"Model artifact not found: {artifact_dir}")
+
+        # 1. Lecture
+        manifest = ModelManifest.model_validate_json(
+            (artifact_dir / MANIFEST_FILE_NAME).read_text()
+        )
+        model_bytes = (artifact_dir / f"model.{manifest.model_format}").read_bytes()
+
+        compiled_bytes = None
+        if backend == COMPILED_BACKEND:
+            manifest, compiled_bytes = self._read_compiled(artifact_dir, manifest, model_bytes)
+        read_done = time.perf_counter()
+
+        # 2. Vérification d'intégrité
+        if self.verify:
+            core = manifest.model_dump(
+                mode="json",
+                include={"model_type", "model_format", "feature_columns",
+                         "preprocessing_stats", "metadata"}
+            )
+            actual_hash = _content_hash(model_bytes, core)
+            if actual_hash != model_hash or manifest.content_hash != model_hash:
+                raise ArtifactIntegrityError(
+                    f"Artifact {model_hash[:12]} corrupted "
+                    f"(computed hash {actual_hash[:12]})"
+                )
+            if (
+                compiled_bytes is not None
+                and hashlib.sha256(compiled_bytes).hexdigest() != manifest.compiled_sha256
+            ):
+                raise ArtifactIntegrityError(f"Compiled trees of {model_hash[:12]} corrupted")
+        verify_done = time.perf_counter()
+
+        # 3. Désérialisation (native, ou tableaux NumPy)
+        if compiled_bytes is not None:
+            from nba_longevity.infrastructure.inference.compiled_trees import load_compiled
+
+            model = load_compiled(io.BytesIO(compiled_bytes))
+        else:
+            model = deserialize_model(model_bytes, manifest.model_type)
+        load_done = time.perf_counter()
+
+        load_stats = {
+            "cache_hit": False,
+            "read_seconds": read_done - start,
+            "verify_seconds": verify_done - read_done,
+            "deserialize_seconds": load_done - verify_done,
+            "total_seconds": load_done - start,
+        }
+        artifact = ModelArtifact(
+            model=model, manifest=manifest, load_stats=load_stats, backend=backend
+        )
+
+        with _CACHE_LOCK:
+            _CACHE[(model_hash, backend)] = artifact
+
+        app_logger.info(
+            f"📦 Model artifact loaded | type={manifest.model_type} | backend={backend} | "
+            f"hash={model_hash[:12]} | "
+            f"read_ms={load_stats['read_seconds'] * 1000:.2f} | "
+            f"verify_ms={load_stats['verify_seconds'] * 1000:.2f} | "
+            f"deserialize_ms={load_stats['deserialize_seconds'] * 1000:.2f} | "
+            f"total_ms={load_stats['total_seconds'] * 1000:.2f}"
+        )
+
+        return artifact
+
+    def latest_hash(self, model_type: str) -> str:
+        pointer = self.root / f"latest_{model_type}"
+        if not pointer.exists():
+            raise FileNotFoundError(f"No saved model for type '{model_type}' in {self.root}")
+        return pointer.read_text().strip()
+
+    # ------------------------------------------------------------------
+    # Interne
+    # ------------------------------------------------------------------
+    def _read_compiled(
+        self,
+        artifact_dir: Path,
+        manifest: ModelManifest,
+        model_bytes: bytes,
+    ) -> tuple[ModelManifest, bytes]:
+        compiled_path = artifact_dir / COMPILED_FILE_NAME
+        if manifest.compiled_sha256 is not None and compiled_path.exists():
+            return manifest, compiled_path.read_bytes()
+
+        # Artefact antérieur à l'export : compilation à partir du modèle natif
+        app_logger.warning(
+            f"No compiled trees for {manifest.content_hash[:12]}: exporting from the native model"
+        )
+        compiled_bytes = _compile_to_bytes(
+            deserialize_model(model_bytes, manifest.model_type), manifest.model_type
+        )
+        if compiled_bytes is None:
+            raise ValueError(
+                f"Model {manifest.content_hash[:12]} cannot be compiled to NumPy trees"
+            )
+
+        manifest = manifest.model_copy(
+            update={"compiled_sha256": hashlib.sha256(compiled_bytes).hexdigest()}
+        )
+        _atomic_write(compiled_path, compiled_bytes)
+        _atomic_write(artifact_dir / MANIFEST_FILE_NAME, manifest.model_dump_json(indent=2).encode())
+        return manifest, compiled_bytes
+
+    def _write_pointer(self, model_type: str, content_hash: str) -> None:
+        pointer = self.root / f"latest_{model_type}"
+        tmp = pointer.with_suffix(".tmp")
+        tmp.write_text(content_hash)
+        os.replace(tmp, pointer)
+
+    @staticmethod
+    def _model_format(model_type: str) -> str:
+        if model_type not in MODEL_FORMATS:
+            raise ValueError(f"Unknown model_type: {model_type}")
+        return MODEL_FORMATS[model_type]
+
+
+# -------------------------------------------------------------------------
+# Sérialisation native (imports paresseux)
+# -------------------------------------------------------------------------
+def _content_hash(model_bytes: bytes, core: Mapping[str, Any]) -> str:
+    digest = hashlib.sha256(model_bytes)
+    digest.update(json.dumps(core, sort_keys=True, separators=(",", ":")).encode())
+    return digest.hexdigest()
+
+
+def _atomic_write(path: Path, data: bytes) -> None:
+    tmp = path.with_name(f".{path.name}.tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
+
+
+def _compile_to_bytes(model: Any, model_type: str) -> bytes | None:
+    """
+    Export NumPy sérialisé (`.npz`), None si le modèle n'est pas exportable.
+    """
+    from nba_longevity.infrastructure.inference.compiled_trees import compile_model, save_compiled
+
+    try:
+        ensemble = compile_model(model, model_type)
+    except ValueError as exc:
+        app_logger.warning(f"Model not compiled to NumPy trees | {exc}")
+        return None
+
+    buffer = io.BytesIO()
+    save_compiled(ensemble, buffer)
+    return buffer.getvalue()
+
+
+def serialize_model(model: Any, model_type: str) -> bytes:
+    if model_type == "xgboost":
+        return bytes(model.save_raw(raw_format="ubj"))
+
+    if model_type == "catboost":
+        # CatBoost ne sérialise que vers un fichier
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "model.cbm"
+            model.save_model(str(path), format="cbm")
+            return path.read_bytes()
+
+    raise ValueError(f"Unknown model_type: {model_type}")
+
+
+def deserialize_model(model_bytes: bytes, model_type: str) -> Any:
+    if model_type == "xgboost":
+        import xgboost as xgb
+
+        booster = xgb.Booster()
+        booster.load_model(bytearray(model_bytes))
+        return booster
+
+    if model_type == "catboost":
+        from catboost import CatBoostClassifier
+
+        model = CatBoostClassifier()
+        model.load_model(blob=model_bytes)
+        return model
+
+    raise ValueError(f"Unknown model_type: {model_type}")
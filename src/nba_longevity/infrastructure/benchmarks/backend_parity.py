@@ -0,0 +1,221 @@
+"""
+SPARK / PANDAS BACKEND PARITY
+=============================
+
+Runs the data stages (preprocessing → feature engineering → selection)
+on the same CSV with both backends, Spark in local mode, and compares
+the outputs.
+
+- Features: Spark is run with the pandas medians injected, so both
+  backends must produce the same rows and values (up to `atol`).
+- Medians: the Spark approximate medians (`approxQuantile`) are
+  reported against the exact pandas medians, relative to the column
+  range (the approximation guarantee of `approxQuantile`).
+- Split: the Spark stratified split must preserve the class ratio.
+
+Exits with status 1 when a check fails.
+
+Usage
+-----
+python -m nba_longevity.infrastructure.benchmarks.backend_parity
+python -m nba_longevity.infrastructure.benchmarks.backend_parity \\
+    --csv data/raw/nba_players.csv --relative-error 1e-3
+"""
+
+import argparse
+import json
+import sys
+from dataclasses import dataclass, asdict, field
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from nba_longevity.application.bootstrap import app_logger, get_config
+from nba_longevity.domain.features.feature_spaces import FEATURE_SPACE_EXTENDED, TARGET_COLUMN
+from nba_longevity.domain.preprocessing.preprocessing_rules import NUMERIC_COLUMNS, ID_COLUMN
+
+
+@dataclass
+class ParityReport:
+    rows_pandas: int
+    rows_spark: int
+    max_abs_feature_diff: dict[str, float]
+    target_mismatches: int
+    median_rel_error: dict[str, float]
+    valid_ratio_by_class: dict[str, float]
+    failures: list[str] = field(default_factory=list)
+
+    @property
+    def ok(self) -> bool:
+        return not self.failures
+
+    def to_dict(self) -> dict[str, Any]:
+        return {**asdict(self), "ok": self.ok}
+
+
+def check_backend_parity(
+    csv_path: str | Path,
+    feature_columns: list[str] | None = None,
+    relative_error: float = 1e-4,
+    valid_size: float = 0.2,
+    atol: float = 1e-9,
+    spark=None,
+) -> ParityReport:
+    """
+    Compare les backends Pandas et Spark (local) sur un même fichier CSV.
+    """
+    from nba_longevity.infrastructure.dataset.csv_dataset_loader import CsvDatasetLoader
+    from nba_longevity.infrastructure.dataset.pandas_dataset import to_pandas
+    from nba_longevity.infrastructure.dataset.spark_dataset_loader import SparkDatasetLoader
+    from nba_longevity.infrastructure.preprocessing.pandas_preprocessing_adapter import (
+        PandasPreprocessingAdapter,
+    )
+    from nba_longevity.infrastructure.preprocessing.spark_preprocessing_adapter import (
+        SparkPreprocessingAdapter,
+    )
+    from nba_longevity.infrastructure.feature_engineering.pandas_feature_engineering_adapter import (
+        PandasFeatureEngineeringAdapter,
+    )
+    from nba_longevity.infrastructure.feature_engineering.spark_feature_engineering_adapter import (
+        SparkFeatureEngineeringAdapter,
+    )
+    from nba_longevity.infrastructure.feature_engineering.pandas_feature_selection_adapter import (
+        PandasFeatureSelectionAdapter,
+    )
+    from nba_longevity.infrastructure.feature_engineering.spark_feature_selection_adapter import (
+        SparkFeatureSelectionAdapter,
+    )
+    from nba_longevity.application.splitting.spark_split import split_train_valid_spark
+    from nba_longevity.application.training.run_spark_feature_preparation import build_spark_session
+
+    features = list(feature_columns or FEATURE_SPACE_EXTENDED)
+    # L'identifiant est conservé pour aligner les lignes des deux backends
+    key_columns = [ID_COLUMN] + features
+
+    # 1️⃣ Pandas (référence)
+    pandas_preprocessor = PandasPreprocessingAdapter()
+    pandas_dataset = pandas_preprocessor.preprocess(CsvDatasetLoader(str(csv_path)).load())
+    pandas_dataset = PandasFeatureEngineeringAdapter().add_features(pandas_dataset)
+    pandas_dataset = PandasFeatureSelectionAdapter(key_columns).select_features(pandas_dataset)
+    expected = _sorted(to_pandas(pandas_dataset), key_columns)
+
+    own_session = spark is None
+    spark = spark or build_spark_session("nba-longevity-parity", master="local[*]")
+
+    try:
+        raw = SparkDatasetLoader(spark, str(csv_path)).load()
+
+        # 2️⃣ Spark, médianes injectées : parité exacte des features
+        spark_dataset = SparkPreprocessingAdapter(medians=pandas_preprocessor.medians).preprocess(raw)
+        spark_dataset = SparkFeatureEngineeringAdapter().add_features(spark_dataset)
+        spark_dataset = SparkFeatureSelectionAdapter(key_columns).select_features(spark_dataset)
+        actual = _sorted(spark_dataset._df.toPandas(), key_columns)
+
+        # 3️⃣ Spark, médianes approchées
+        spark_preprocessor = SparkPreprocessingAdapter(relative_error=relative_error)
+        approx_dataset = spark_preprocessor.preprocess(raw)
+
+        # 4️⃣ Split stratifié : proportion de validation par classe
+        train_df, valid_df = split_train_valid_spark(
+            approx_dataset._df, valid_size=valid_size, relative_error=relative_error
+        )
+        train_counts = _class_counts(train_df)
+        valid_counts = _class_counts(valid_df)
+    finally:
+        if own_session:
+            spark.stop()
+
+    failures = []
+
+    if len(expected) != len(actual):
+        failures.append(f"row count: pandas={len(expected)} spark={len(actual)}")
+        max_diff = {}
+        target_mismatches = -1
+    else:
+        max_diff = {
+            col: float(np.max(np.abs(
+                expected[col].to_numpy(dtype=float) - actual[col].to_numpy(dtype=float)
+            ), initial=0.0))
+            for col in features
+        }
+        target_mismatches = int(
+            (expected[TARGET_COLUMN].to_numpy() != actual[TARGET_COLUMN].to_numpy()).sum()
+        )
+        failures += [f"feature {c}: max_abs_diff={d:.3g}" for c, d in max_diff.items() if d > atol]
+        if target_mismatches:
+            failures.append(f"target mismatches: {target_mismatches}")
+
+    # Garantie approxQuantile : erreur de rang ≤ relative_error·n ; rapportée à l'étendue
+    raw_pdf = to_pandas(CsvDatasetLoader(str(csv_path)).load())
+    median_rel_error = {}
+    for col in NUMERIC_COLUMNS:
+        values = pd.to_numeric(raw_pdf[col], errors="coerce")
+        span = float(values.max() - values.min()) or 1.0
+        median_rel_error[col] = abs(
+            spark_preprocessor.medians[col] - pandas_preprocessor.medians[col]
+        ) / span
+    # Tolérance : erreur de rang + demi-écart entre valeurs centrales (effectif pair)
+    median_tolerance = max(10 * relative_error, 0.01)
+    failures += [
+        f"median {c}: relative_error={e:.3g}"
+        for c, e in median_rel_error.items() if e > median_tolerance
+    ]
+
+    valid_ratio = {
+        str(label): valid_counts.get(label, 0) / (train_counts.get(label, 0) + valid_counts.get(label, 0))
+        for label in set(train_counts) | set(valid_counts)
+    }
+    failures += [
+        f"split class {label}: valid_ratio={ratio:.4f}"
+        for label, ratio in valid_ratio.items()
+        if abs(ratio - valid_size) > max(0.02, 10 * relative_error)
+    ]
+
+    report = ParityReport(
+        rows_pandas=len(expected),
+        rows_spark=len(actual),
+        max_abs_feature_diff=max_diff,
+        target_mismatches=target_mismatches,
+        median_rel_error=median_rel_error,
+        valid_ratio_by_class=valid_ratio,
+        failures=failures,
+    )
+
+    if report.ok:
+        app_logger.success(f"✅ Backend parity OK | rows={report.rows_pandas}")
+    else:
+        app_logger.error(f"❌ Backend parity failed | {'; '.join(failures)}")
+
+    return report
+
+
+def _sorted(df: pd.DataFrame, key_columns: list[str]) -> pd.DataFrame:
+    return df.sort_values(key_columns, kind="mergesort").reset_index(drop=True)
+
+
+def _class_counts(df) -> dict:
+    return {row[TARGET_COLUMN]: row["count"] for row in df.groupBy(TARGET_COLUMN).count().collect()}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Spark / pandas backend parity check")
+    parser.add_argument("--csv", default=str(get_config().paths.raw_data))
+    parser.add_argument("--relative-error", type=float, default=1e-4)
+    parser.add_argument("--valid-size", type=float, default=0.2)
+    parser.add_argument("--output", default=None, help="Write the report as JSON")
+    args = parser.parse_args()
+
+    report = check_backend_parity(
+        args.csv, relative_error=args.relative_error, valid_size=args.valid_size
+    )
+
+    if args.output:
+        Path(args.output).write_text(json.dumps(report.to_dict(), indent=2))
+
+    sys.exit(0 if report.ok else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,413 @@
+"""
+PIPELINE BENCHMARK SUITE
+========================
+
+Per-stage wall time, throughput (rows/s) and peak RSS of the pipeline,
+on synthetic player tables shaped like `nba_players.csv`.
+
+- Sizes: 1k, 100k, 1m, 10m rows (configurable)
+- Backends: pandas (full chain: load → preprocessing → features →
+  selection → matrix → split → both trainers → both predictors →
+  validation evaluation with bootstrap CIs) and
+  local-mode Spark (data stages; models are trained on the pandas side)
+- Each (backend, size) runs in a fresh process: peak RSS is not
+  polluted by previous runs. For Spark, RSS covers the Python driver
+  only (the JVM is a separate process).
+- Results are saved as JSON, compared against a stored baseline; the
+  command exits with status 1 on regressions beyond the thresholds.
+
+Usage
+-----
+python -m nba_longevity.infrastructure.benchmarks.benchmark_suite \\
+    --sizes 1k,100k --backends pandas --save-baseline
+python -m nba_longevity.infrastructure.benchmarks.benchmark_suite \\
+    --sizes 1k,100k --backends pandas --time-threshold 0.2
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import platform
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Sequence
+
+from nba_longevity.application.bootstrap import app_logger, get_config
+from nba_longevity.domain.features.feature_spaces import FEATURE_SPACE_EXTENDED, TARGET_COLUMN
+from nba_longevity.infrastructure.benchmarks.stage_profiler import StageMeasurement, measure_stage
+from nba_longevity.infrastructure.benchmarks.synthetic_players import write_synthetic_csv
+
+
+DEFAULT_SIZES = "1k,100k,1m,10m"
+BACKENDS = ("pandas", "spark")
+
+# Budgets fixes (pas d'early stopping effectif) : temps comparables d'un run à l'autre
+BENCHMARK_PARAMS = {
+    "xgboost": {
+        "objective": "binary:logistic",
+        "eval_metric": "auc",
+        "max_depth": 4,
+        "eta": 0.05,
+        "num_boost_round": 100,
+        "early_stopping_rounds": 100,
+    },
+    "catboost": {
+        "loss_function": "Logloss",
+        "eval_metric": "AUC",
+        "iterations": 100,
+        "depth": 6,
+        "early_stopping_rounds": 100,
+        "verbose": False,
+    },
+}
+
+_SUFFIXES = {"k": 1_000, "m": 1_000_000}
+
+
+def parse_size(value: str) -> int:
+    value = value.strip().lower()
+    if value[-1:] in _SUFFIXES:
+        return int(float(value[:-1]) * _SUFFIXES[value[-1]])
+    return int(value)
+
+
+def run_pandas_benchmarks(csv_path: str, n_rows: int) -> list[StageMeasurement]:
+    from nba_longevity.infrastructure.dataset.csv_dataset_loader import CsvDatasetLoader
+    from nba_longevity.infrastructure.dataset.pandas_dataset import to_feature_matrix
+    from nba_longevity.infrastructure.preprocessing.pandas_preprocessing_adapter import (
+        PandasPreprocessingAdapter,
+    )
+    from nba_longevity.infrastructure.feature_engineering.pandas_feature_engineering_adapter import (
+        PandasFeatureEngineeringAdapter,
+    )
+    from nba_longevity.infrastructure.feature_engineering.pandas_feature_selection_adapter import (
+        PandasFeatureSelectionAdapter,
+    )
+    from nba_longevity.application.splitting.index_split import split_train_valid_indices
+    from nba_longevity.infrastructure.training.xgboost_trainer import XGBoostTrainer
+    from nba_longevity.infrastructure.training.catboost_trainer import CatBoostTrainer
+    from nba_longevity.infrastructure.inference.xgboost_predictor import XGBoostPredictor
+    from nba_longevity.infrastructure.inference.catboost_predictor import CatBoostPredictor
+    from nba_longevity.infrastructure.metrics.threshold_sweep import evaluate_predictions
+
+    features = FEATURE_SPACE_EXTENDED
+    measurements: list[StageMeasurement] = []
+    state: dict[str, Any] = {}
+
+    def stage(name: str, rows: int, fn) -> bool:
+        result, measurement = measure_stage("pandas", n_rows, name, rows, fn)
+        measurements.append(measurement)
+        state[name] = result
+        return measurement.error is None
+
+    ok = (
+        stage("load", n_rows, lambda: CsvDatasetLoader(csv_path).load())
+        and stage("preprocessing", n_rows,
+                  lambda: PandasPreprocessingAdapter().preprocess(state["load"]))
+    )
+    n_clean = len(state["preprocessing"]) if ok else 0
+    ok = ok and (
+        stage("feature_engineering", n_clean,
+              lambda: PandasFeatureEngineeringAdapter().add_features(state["preprocessing"]))
+        and stage("feature_selection", n_clean,
+                  lambda: PandasFeatureSelectionAdapter(feature_space=features)
+                  .select_features(state["feature_engineering"]))
+        and stage("feature_matrix", n_clean,
+                  lambda: to_feature_matrix(state["feature_selection"], features, TARGET_COLUMN))
+    )
+    if not ok:
+        return measurements
+
+    X, y = state["feature_matrix"]
+    if not stage("split", n_clean, lambda: split_train_valid_indices(y, valid_size=0.2, seed=42)):
+        return measurements
+    train_idx, valid_idx = state["split"]
+
+    trainers = {"xgboost": XGBoostTrainer, "catboost": CatBoostTrainer}
+    predictors = {"xgboost": XGBoostPredictor, "catboost": CatBoostPredictor}
+    for model_type, trainer_cls in trainers.items():
+        trained = stage(
+            f"train_{model_type}", len(train_idx),
+            lambda: trainer_cls().train_matrix(
+                X, y, train_idx, valid_idx, features, BENCHMARK_PARAMS[model_type]
+            ),
+        )
+        if trained:
+            model = state[f"train_{model_type}"]
+            X_valid = X[valid_idx]
+            predicted = stage(
+                f"predict_{model_type}", len(valid_idx),
+                lambda: predictors[model_type](model, feature_columns=features)
+                .predict_matrix(X_valid),
+            )
+            if predicted:
+                proba = state[f"predict_{model_type}"]
+                stage(
+                    f"evaluate_{model_type}", len(valid_idx),
+                    lambda: evaluate_predictions(y[valid_idx], proba, n_resamples=1000),
+                )
+
+    return measurements
+
+
+def run_spark_benchmarks(csv_path: str, n_rows: int) -> list[StageMeasurement]:
+    from pyspark.sql import SparkSession
+
+    from nba_longevity.infrastructure.dataset.spark_dataset import SparkDataset
+    from nba_longevity.infrastructure.dataset.spark_dataset_loader import SparkDatasetLoader
+    from nba_longevity.infrastructure.dataset.pandas_dataset import to_feature_matrix
+    from nba_longevity.infrastructure.preprocessing.spark_preprocessing_adapter import (
+        SparkPreprocessingAdapter,
+    )
+    from nba_longevity.infrastructure.feature_engineering.spark_feature_engineering_adapter import (
+        SparkFeatureEngineeringAdapter,
+    )
+    from nba_longevity.infrastructure.feature_engineering.spark_feature_selection_adapter import (
+        SparkFeatureSelectionAdapter,
+    )
+    from nba_longevity.application.splitting.spark_split import split_train_valid_spark
+
+    spark = (
+        SparkSession.builder
+        .master("local[*]")
+        .appName("nba-longevity-benchmarks")
+        .config("spark.sql.execution.arrow.pyspark.enabled", "true")
+        .config("spark.ui.enabled", "false")
+        .getOrCreate()
+    )
+
+    features = FEATURE_SPACE_EXTENDED
+    measurements: list[StageMeasurement] = []
+    state: dict[str, Any] = {}
+
+    def materialize(dataset: SparkDataset) -> SparkDataset:
+        # Spark est paresseux : cache + count pour mesurer le stage lui-même
+        dataset._df.cache().count()
+        return dataset
+
+    def stage(name: str, rows: int, fn) -> bool:
+        result, measurement = measure_stage("spark", n_rows, name, rows, fn)
+        measurements.append(measurement)
+        state[name] = result
+        return measurement.error is None
+
+    try:
+        ok = (
+            stage("load", n_rows,
+                  lambda: materialize(SparkDatasetLoader(spark, csv_path).load()))
+            and stage("preprocessing", n_rows,
+                      lambda: materialize(SparkPreprocessingAdapter().preprocess(state["load"])))
+        )
+        n_clean = state["preprocessing"]._df.count() if ok else 0
+        ok = ok and (
+            stage("feature_engineering", n_clean,
+                  lambda: materialize(
+                      SparkFeatureEngineeringAdapter().add_features(state["preprocessing"])
+                  ))
+            and stage("feature_selection", n_clean,
+                      lambda: materialize(
+                          SparkFeatureSelectionAdapter(features).select_features(
+                              state["feature_engineering"]
+                          )
+                      ))
+            and stage("split", n_clean,
+                      lambda: [
+                          materialize(SparkDataset(part))
+                          for part in split_train_valid_spark(
+                              state["feature_selection"]._df, valid_size=0.2, seed=42
+                          )
+                      ])
+            and stage("feature_matrix", n_clean,
+                      lambda: to_feature_matrix(state["feature_selection"], features, TARGET_COLUMN))
+        )
+    finally:
+        spark.stop()
+
+    return measurements
+
+
+def _run_backend(backend: str, csv_path: str, n_rows: int) -> list[dict[str, Any]]:
+    runner = run_pandas_benchmarks if backend == "pandas" else run_spark_benchmarks
+    return [m.to_dict() for m in runner(csv_path, n_rows)]
+
+
+def run_benchmarks(
+    sizes: Sequence[int],
+    backends: Sequence[str],
+    data_dir: Path,
+    seed: int = 42,
+) -> list[dict[str, Any]]:
+    results: list[dict[str, Any]] = []
+
+    for n_rows in sizes:
+        csv_path = write_synthetic_csv(data_dir / f"players_{n_rows}_seed{seed}.csv", n_rows, seed)
+
+        for backend in backends:
+            if backend == "spark" and not _spark_available():
+                app_logger.warning("pyspark is not installed: spark backend skipped")
+                results.append(StageMeasurement(
+                    backend=backend, n_rows=n_rows, stage="load", rows=0,
+                    wall_time_s=0.0, rows_per_s=0.0, peak_rss_bytes=0,
+                    error="skipped: pyspark not installed",
+                ).to_dict())
+                continue
+
+            app_logger.info(f"⏱️ Benchmark | backend={backend} | rows={n_rows}")
+
+            # Processus neuf par (backend, taille) : pic de RSS isolé
+            with ProcessPoolExecutor(
+                max_workers=1,
+                mp_context=multiprocessing.get_context("spawn"),
+            ) as pool:
+                measurements = pool.submit(_run_backend, backend, str(csv_path), n_rows).result()
+
+            for m in measurements:
+                status = m["error"] or "ok"
+                app_logger.info(
+                    f"{backend:<6} {n_rows:>9} {m['stage']:<20} "
+                    f"{m['wall_time_s']:>9.4f}s {m['rows_per_s']:>14.0f} rows/s "
+                    f"{m['peak_rss_bytes'] / 1024 ** 2:>9.1f} MiB | {status}"
+                )
+            results.extend(measurements)
+
+    return results
+
+
+def compare_to_baseline(
+    results: Sequence[dict[str, Any]],
+    baseline: Sequence[dict[str, Any]],
+    time_threshold: float = 0.2,
+    memory_threshold: float = 0.2,
+    min_time_s: float = 0.05,
+) -> list[str]:
+    """
+    Régressions par (backend, taille, stage) présents dans les deux runs.
+
+    - temps : wall_time > baseline × (1 + time_threshold) et écart
+      absolu > min_time_s (les stages très courts sont bruités)
+    - mémoire : peak_rss > baseline × (1 + memory_threshold)
+    - un stage qui réussissait dans la baseline et échoue est une régression
+    """
+    reference = {
+        (b["backend"], b["n_rows"], b["stage"]): b
+        for b in baseline
+    }
+
+    regressions = []
+    for current in results:
+        key = (current["backend"], current["n_rows"], current["stage"])
+        base = reference.get(key)
+        if base is None or base["error"] is not None:
+            continue
+
+        label = f"{key[0]}/{key[1]}/{key[2]}"
+        if current["error"] is not None:
+            regressions.append(f"{label}: failed ({current['error']})")
+            continue
+
+        time_limit = base["wall_time_s"] * (1 + time_threshold)
+        if (
+            current["wall_time_s"] > time_limit
+            and current["wall_time_s"] - base["wall_time_s"] > min_time_s
+        ):
+            regressions.append(
+                f"{label}: wall time {current['wall_time_s']:.4f}s > "
+                f"{base['wall_time_s']:.4f}s (+{time_threshold:.0%})"
+            )
+
+        memory_limit = base["peak_rss_bytes"] * (1 + memory_threshold)
+        if base["peak_rss_bytes"] and current["peak_rss_bytes"] > memory_limit:
+            regressions.append(
+                f"{label}: peak RSS {current['peak_rss_bytes']} > "
+                f"{base['peak_rss_bytes']} bytes (+{memory_threshold:.0%})"
+            )
+
+    return regressions
+
+
+def environment_info() -> dict[str, Any]:
+    import numpy
+    import pandas
+
+    return {
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "numpy": numpy.__version__,
+        "pandas": pandas.__version__,
+    }
+
+
+def _spark_available() -> bool:
+    try:
+        import pyspark  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def main() -> int:
+    benchmarks_dir = get_config().paths.artifacts_dir / "benchmarks"
+
+    parser = argparse.ArgumentParser(description="Pipeline benchmark suite")
+    parser.add_argument("--sizes", default=DEFAULT_SIZES, help="ex. 1k,100k,1m,10m")
+    parser.add_argument("--backends", default="pandas,spark")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", type=Path, default=None)
+    parser.add_argument("--baseline", type=Path, default=benchmarks_dir / "baseline.json")
+    parser.add_argument("--save-baseline", action="store_true")
+    parser.add_argument("--time-threshold", type=float, default=0.2)
+    parser.add_argument("--memory-threshold", type=float, default=0.2)
+    parser.add_argument("--min-time-s", type=float, default=0.05)
+    args = parser.parse_args()
+
+    sizes = [parse_size(s) for s in args.sizes.split(",") if s.strip()]
+    backends = [b.strip() for b in args.backends.split(",") if b.strip()]
+    unknown = set(backends) - set(BACKENDS)
+    if unknown:
+        parser.error(f"Unknown backends: {sorted(unknown)}")
+
+    results = run_benchmarks(sizes, backends, benchmarks_dir / "data", args.seed)
+    report = {"environment": environment_info(), "results": results}
+
+    output = args.output or benchmarks_dir / (
+        f"results_{datetime.now(timezone.utc):%Y%m%dT%H%M%SZ}.json"
+    )
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, indent=2))
+    app_logger.info(f"Benchmark results written | path={output}")
+
+    if args.save_baseline:
+        args.baseline.parent.mkdir(parents=True, exist_ok=True)
+        args.baseline.write_text(json.dumps(report, indent=2))
+        app_logger.info(f"Baseline saved | path={args.baseline}")
+        return 0
+
+    if not args.baseline.exists():
+        app_logger.warning(f"No baseline at {args.baseline}: comparison skipped")
+        return 0
+
+    baseline = json.loads(args.baseline.read_text())["results"]
+    regressions = compare_to_baseline(
+        results,
+        baseline,
+        time_threshold=args.time_threshold,
+        memory_threshold=args.memory_threshold,
+        min_time_s=args.min_time_s,
+    )
+
+    if regressions:
+        for regression in regressions:
+            app_logger.error(f"❌ Regression | {regression}")
+        return 1
+
+    app_logger.success("✅ No regression against baseline")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,177 @@
+"""
+COLD-START BUDGET
+=================
+
+Import time of the package and of the scoring entry points, each
+measured in a fresh interpreter (median of several runs), plus the
+heavy libraries each import pulls in.
+
+- Budget: maximum median import time per module (seconds)
+- Forbidden modules: libraries a scoring-only process must never
+  import (training stack, unused model libraries, Spark, MLflow)
+- Importing must not load the configuration nor configure the logger
+
+Exits with status 1 when a budget is exceeded or a forbidden module
+is imported.
+
+Usage
+-----
+python -m nba_longevity.infrastructure.benchmarks.cold_start
+python -m nba_longevity.infrastructure.benchmarks.cold_start --repeat 7 --scale 2
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from dataclasses import dataclass, asdict, field
+from pathlib import Path
+from typing import Any
+
+
+HEAVY_MODULES = (
+    "xgboost", "catboost", "sklearn", "scipy", "pandas", "pyarrow", "pyspark", "mlflow",
+)
+
+# Budgets (s) et modules interdits par point d'entrée
+COLD_START_BUDGETS: dict[str, dict[str, Any]] = {
+    "nba_longevity": {
+        "budget_s": 0.02,
+        "forbidden": HEAVY_MODULES,
+    },
+    "nba_longevity.application.bootstrap": {
+        "budget_s": 0.05,
+        "forbidden": HEAVY_MODULES,
+    },
+    "nba_longevity.infrastructure.inference.predictor_factory": {
+        "budget_s": 0.2,
+        "forbidden": HEAVY_MODULES,
+    },
+    "nba_longevity.infrastructure.serving.http_scoring_server": {
+        "budget_s": 0.5,
+        "forbidden": HEAVY_MODULES,
+    },
+}
+
+# Exécuté dans un interpréteur neuf : temps de l'import seul (démarrage exclu)
+_PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+bootstrap = sys.modules.get("nba_longevity.application.bootstrap")
+print(json.dumps({{
+    "seconds": elapsed,
+    "modules": sorted(m for m in {heavy!r} if m in sys.modules),
+    "config_loaded": bool(bootstrap and bootstrap._config is not None),
+    "logger_configured": bool(bootstrap and bootstrap._logger is not None),
+}}))
+"""
+
+
+@dataclass
+class ColdStartResult:
+    module: str
+    median_s: float
+    runs_s: list[float]
+    budget_s: float
+    heavy_modules: list[str]
+    forbidden_imported: list[str]
+    config_loaded: bool
+    logger_configured: bool
+    failures: list[str] = field(default_factory=list)
+
+    def to_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+
+def measure_import(module: str, repeat: int = 5) -> tuple[list[float], dict[str, Any]]:
+    """
+    Temps d'import de `module` dans `repeat` interpréteurs neufs.
+    """
+    code = _PROBE.format(module=module, heavy=HEAVY_MODULES)
+    env = {**os.environ, "PYTHONDONTWRITEBYTECODE": "1"}
+
+    runs, last = [], {}
+    for _ in range(repeat):
+        completed = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True, text=True, env=env, check=True,
+        )
+        last = json.loads(completed.stdout.strip().splitlines()[-1])
+        runs.append(last["seconds"])
+
+    return runs, last
+
+
+def check_cold_start(
+    budgets: dict[str, dict[str, Any]] | None = None,
+    repeat: int = 5,
+    scale: float = 1.0,
+) -> list[ColdStartResult]:
+    """
+    Mesure chaque point d'entrée et le compare à son budget
+    (`scale` : facteur appliqué aux budgets, ex. machine de CI lente).
+    """
+    results = []
+    for module, spec in (budgets or COLD_START_BUDGETS).items():
+        # Un import à blanc pour chauffer le cache de bytecode / disque
+        measure_import(module, repeat=1)
+        runs, probe = measure_import(module, repeat=repeat)
+
+        budget_s = spec["budget_s"] * scale
+        forbidden = sorted(set(probe["modules"]) & set(spec.get("forbidden", ())))
+        median_s = statistics.median(runs)
+
+        failures = []
+        if median_s > budget_s:
+            failures.append(f"import time {median_s * 1000:.1f} ms > budget {budget_s * 1000:.1f} ms")
+        if forbidden:
+            failures.append(f"forbidden modules imported: {forbidden}")
+        if probe["config_loaded"] or probe["logger_configured"]:
+            failures.append("configuration / logger initialized at import time")
+
+        results.append(ColdStartResult(
+            module=module,
+            median_s=median_s,
+            runs_s=runs,
+            budget_s=budget_s,
+            heavy_modules=probe["modules"],
+            forbidden_imported=forbidden,
+            config_loaded=probe["config_loaded"],
+            logger_configured=probe["logger_configured"],
+            failures=failures,
+        ))
+
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Import cold-start budget check")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--scale", type=float, default=1.0, help="Budget multiplier")
+    parser.add_argument("--output", default=None, help="Write the results as JSON")
+    args = parser.parse_args()
+
+    results = check_cold_start(repeat=args.repeat, scale=args.scale)
+
+    for result in results:
+        status = "OK  " if not result.failures else "FAIL"
+        print(
+            f"{status} {result.module:<60} {result.median_s * 1000:8.1f} ms "
+            f"(budget {result.budget_s * 1000:.0f} ms) "
+            f"heavy={result.heavy_modules or '-'}"
+        )
+        for failure in result.failures:
+            print(f"     ↳ {failure}")
+
+    if args.output:
+        Path(args.output).write_text(json.dumps([r.to_dict() for r in results], indent=2))
+
+    sys.exit(1 if any(r.failures for r in results) else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,245 @@
+"""
+DTYPE PLAN REPORT
+=================
+
+Memory footprint and model metrics of the pandas pipeline under the
+historical float64 dtypes and under the compact DtypePlan (float32,
+small integers, identifier not loaded).
+
+- Stages: load → preprocessing → feature engineering → selection →
+  feature matrix; for each stage, the deep memory of its output
+  (DataFrame.memory_usage(deep=True), or X + y bytes), its dtypes,
+  wall time and peak RSS
+- Models: both trainers on the same split with fixed budgets
+  (BENCHMARK_PARAMS); AUC / F1 with bootstrap CIs, and the largest
+  probability gap between the two plans
+- Each plan runs in a fresh process: peak RSS is not polluted by the
+  other plan
+- Data: the raw dataset of the config, or a synthetic table (--rows)
+
+Usage
+-----
+python -m nba_longevity.infrastructure.benchmarks.dtype_report
+python -m nba_longevity.infrastructure.benchmarks.dtype_report --rows 1m
+"""
+
+import argparse
+import json
+import multiprocessing
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+from nba_longevity.application.bootstrap import app_logger, get_config
+from nba_longevity.domain.features.feature_spaces import FEATURE_SPACE_EXTENDED, TARGET_COLUMN
+from nba_longevity.infrastructure.benchmarks.benchmark_suite import (
+    BENCHMARK_PARAMS,
+    environment_info,
+    parse_size,
+)
+from nba_longevity.infrastructure.benchmarks.stage_profiler import measure_stage
+from nba_longevity.infrastructure.benchmarks.synthetic_players import write_synthetic_csv
+from nba_longevity.infrastructure.dataset.dtype_plan import COMPACT, DTYPE_PLANS, WIDE
+
+
+def run_plan(csv_path: str, plan_name: str) -> dict[str, Any]:
+    """
+    Chaîne pandas complète sous un plan de types ; mesures par stage
+    et métriques des deux modèles.
+    """
+    import numpy as np
+
+    from nba_longevity.infrastructure.dataset.csv_dataset_loader import CsvDatasetLoader
+    from nba_longevity.infrastructure.dataset.dtype_plan import DtypePlan
+    from nba_longevity.infrastructure.dataset.pandas_dataset import to_feature_matrix, to_pandas
+    from nba_longevity.infrastructure.preprocessing.pandas_preprocessing_adapter import (
+        PandasPreprocessingAdapter,
+    )
+    from nba_longevity.infrastructure.feature_engineering.pandas_feature_engineering_adapter import (
+        PandasFeatureEngineeringAdapter,
+    )
+    from nba_longevity.infrastructure.feature_engineering.pandas_feature_selection_adapter import (
+        PandasFeatureSelectionAdapter,
+    )
+    from nba_longevity.application.splitting.index_split import split_train_valid_indices
+    from nba_longevity.infrastructure.training.xgboost_trainer import XGBoostTrainer
+    from nba_longevity.infrastructure.training.catboost_trainer import CatBoostTrainer
+    from nba_longevity.infrastructure.inference.xgboost_predictor import XGBoostPredictor
+    from nba_longevity.infrastructure.inference.catboost_predictor import CatBoostPredictor
+    from nba_longevity.infrastructure.metrics.threshold_sweep import evaluate_predictions
+
+    plan = DtypePlan.from_name(plan_name)
+    features = FEATURE_SPACE_EXTENDED
+    stages: list[dict[str, Any]] = []
+    state: dict[str, Any] = {}
+
+    def stage(name: str, fn) -> Any:
+        result, measurement = measure_stage(plan_name, 0, name, 0, fn)
+        if measurement.error is not None:
+            raise RuntimeError(f"{plan_name}/{name}: {measurement.error}")
+        state[name] = result
+
+        if isinstance(result, tuple):
+            X, y = result
+            nbytes = X.nbytes + y.nbytes
+            dtypes = {"X": X.dtype.name, "y": y.dtype.name}
+            n_rows = len(X)
+        else:
+            df = to_pandas(result)
+            nbytes = int(df.memory_usage(deep=True).sum())
+            dtypes = dict(Counter(str(t) for t in df.dtypes))
+            n_rows = len(df)
+
+        stages.append({
+            "stage": name,
+            "rows": n_rows,
+            "memory_bytes": nbytes,
+            "dtypes": dtypes,
+            "wall_time_s": measurement.wall_time_s,
+            "peak_rss_bytes": measurement.peak_rss_bytes,
+        })
+        return result
+
+    stage("load", lambda: CsvDatasetLoader(csv_path, dtype_plan=plan).load())
+    stage("preprocessing",
+          lambda: PandasPreprocessingAdapter(dtype_plan=plan).preprocess(state["load"]))
+    stage("feature_engineering",
+          lambda: PandasFeatureEngineeringAdapter().add_features(state["preprocessing"]))
+    stage("feature_selection",
+          lambda: PandasFeatureSelectionAdapter(feature_space=features)
+          .select_features(state["feature_engineering"]))
+    X, y = stage("feature_matrix",
+                 lambda: to_feature_matrix(state["feature_selection"], features, TARGET_COLUMN))
+
+    train_idx, valid_idx = split_train_valid_indices(y, valid_size=0.2, seed=42)
+
+    trainers = {"xgboost": XGBoostTrainer, "catboost": CatBoostTrainer}
+    predictors = {"xgboost": XGBoostPredictor, "catboost": CatBoostPredictor}
+    models: dict[str, Any] = {}
+    for model_type, trainer_cls in trainers.items():
+        model = trainer_cls().train_matrix(
+            X, y, train_idx, valid_idx, features, BENCHMARK_PARAMS[model_type]
+        )
+        proba = predictors[model_type](model, feature_columns=features).predict_matrix(X[valid_idx])
+        evaluation = evaluate_predictions(y[valid_idx], proba, n_resamples=1000)
+        models[model_type] = {
+            "auc": evaluation["auc"],
+            "f1": evaluation["f1"],
+            "confidence_intervals": evaluation["confidence_intervals"],
+            "proba": np.asarray(proba, dtype=np.float64).tolist(),
+        }
+
+    return {"plan": plan_name, "stages": stages, "models": models}
+
+
+def compare_plans(wide: dict[str, Any], compact: dict[str, Any]) -> dict[str, Any]:
+    """
+    Gains mémoire par stage et écarts de métriques (compact - float64).
+    """
+    import numpy as np
+
+    reference = {s["stage"]: s for s in wide["stages"]}
+    memory = []
+    for current in compact["stages"]:
+        base = reference[current["stage"]]
+        memory.append({
+            "stage": current["stage"],
+            "float64_bytes": base["memory_bytes"],
+            "compact_bytes": current["memory_bytes"],
+            "ratio": current["memory_bytes"] / base["memory_bytes"] if base["memory_bytes"] else None,
+            "float64_peak_rss_bytes": base["peak_rss_bytes"],
+            "compact_peak_rss_bytes": current["peak_rss_bytes"],
+        })
+
+    metrics = {}
+    for model_type, base in wide["models"].items():
+        current = compact["models"][model_type]
+        auc_ci = base["confidence_intervals"]["auc"]
+        metrics[model_type] = {
+            "float64_auc": base["auc"],
+            "compact_auc": current["auc"],
+            "auc_delta": current["auc"] - base["auc"],
+            "float64_auc_ci": [auc_ci["lower"], auc_ci["upper"]],
+            "auc_delta_within_ci": auc_ci["lower"] <= current["auc"] <= auc_ci["upper"],
+            "float64_f1": base["f1"],
+            "compact_f1": current["f1"],
+            "f1_delta": current["f1"] - base["f1"],
+            "max_abs_proba_delta": float(
+                np.max(np.abs(np.asarray(current["proba"]) - np.asarray(base["proba"])))
+            ),
+        }
+
+    return {"memory": memory, "metrics": metrics}
+
+
+def run_report(csv_path: Path) -> dict[str, Any]:
+    results = {}
+    for plan_name in DTYPE_PLANS:
+        app_logger.info(f"📐 Dtype plan run | plan={plan_name} | data={csv_path}")
+
+        # Processus neuf par plan : pic de RSS isolé
+        with ProcessPoolExecutor(
+            max_workers=1,
+            mp_context=multiprocessing.get_context("spawn"),
+        ) as pool:
+            results[plan_name] = pool.submit(run_plan, str(csv_path), plan_name).result()
+
+    comparison = compare_plans(results[WIDE], results[COMPACT])
+
+    for row in comparison["memory"]:
+        app_logger.info(
+            f"{row['stage']:<20} float64={row['float64_bytes'] / 1024 ** 2:>9.2f} MiB "
+            f"compact={row['compact_bytes'] / 1024 ** 2:>9.2f} MiB "
+            f"ratio={row['ratio']:.2f}"
+        )
+    for model_type, row in comparison["metrics"].items():
+        app_logger.info(
+            f"{model_type:<9} AUC float64={row['float64_auc']:.5f} compact={row['compact_auc']:.5f} "
+            f"(Δ={row['auc_delta']:+.5f}, within CI={row['auc_delta_within_ci']}) | "
+            f"F1 Δ={row['f1_delta']:+.5f} | max |Δp|={row['max_abs_proba_delta']:.2e}"
+        )
+
+    # Probabilités brutes inutiles dans le rapport (seul l'écart est conservé)
+    for result in results.values():
+        for model in result["models"].values():
+            model.pop("proba")
+
+    return {
+        "environment": environment_info(),
+        "data": str(csv_path),
+        "plans": results,
+        "comparison": comparison,
+    }
+
+
+def main() -> None:
+    config = get_config()
+    benchmarks_dir = config.paths.artifacts_dir / "benchmarks"
+
+    parser = argparse.ArgumentParser(description="float64 vs compact dtype plan report")
+    parser.add_argument("--rows", default=None, help="synthetic rows (ex. 1m); raw data if omitted")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", type=Path, default=None)
+    args = parser.parse_args()
+
+    csv_path = Path(config.paths.raw_data)
+    if args.rows is not None:
+        n_rows = parse_size(args.rows)
+        csv_path = write_synthetic_csv(
+            benchmarks_dir / "data" / f"players_{n_rows}_seed{args.seed}.csv", n_rows, args.seed
+        )
+
+    report = run_report(csv_path)
+
+    output = args.output or benchmarks_dir / (
+        f"dtype_report_{datetime.now(timezone.utc):%Y%m%dT%H%M%SZ}.json"
+    )
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, indent=2))
+    app_logger.info(f"Dtype report written | path={output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+import time
+from dataclasses import dataclass, asdict
+from typing import Any, Callable
+
+from nba_longevity.infrastructure.instrumentation.rss_sampler import RssSampler
+
+
+@dataclass(frozen=True)
+class StageMeasurement:
+    backend: str
+    n_rows: int
+    stage: str
+    rows: int
+    wall_time_s: float
+    rows_per_s: float
+    peak_rss_bytes: int
+    error: str | None = None
+
+    def to_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+
+def measure_stage(
+    backend: str,
+    n_rows: int,
+    stage: str,
+    rows: int,
+    fn: Callable[[], Any],
+) -> tuple[Any, StageMeasurement]:
+    """
+    Exécute un stage et mesure temps mural, débit (lignes/s) et pic de RSS.
+
+    Une exception est enregistrée dans la mesure (error) au lieu d'interrompre
+    la suite ; le résultat retourné vaut alors None.
+    """
+    result, error = None, None
+    with RssSampler() as sampler:
+        start = time.perf_counter()
+        try:
+            result = fn()
+        except Exception as exc:
+            error = f"{type(exc).__name__}: {exc}"
+        wall_time_s = time.perf_counter() - start
+
+    measurement = StageMeasurement(
+        backend=backend,
+        n_rows=n_rows,
+        stage=stage,
+        rows=rows,
+        wall_time_s=wall_time_s,
+        rows_per_s=rows / wall_time_s if wall_time_s > 0 else float("inf"),
+        peak_rss_bytes=sampler.peak,
+        error=error,
+    )
+
+    return result, measurement
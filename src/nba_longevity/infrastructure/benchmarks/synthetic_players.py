@@ -0,0 +1,120 @@
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from nba_longevity.application.bootstrap import app_logger
+from nba_longevity.domain.preprocessing.preprocessing_rules import (
+    NUMERIC_COLUMNS, TARGET_COLUMN, ID_COLUMN
+)
+
+
+# Colonnes dans l'ordre du fichier brut nba_players.csv
+RAW_COLUMNS = [ID_COLUMN] + list(NUMERIC_COLUMNS) + [TARGET_COLUMN]
+
+
+def generate_players(n_rows: int, seed: int = 42, offset: int = 0) -> pd.DataFrame:
+    """
+    Table synthétique au format de nba_players.csv.
+
+    Distributions calées sur le dataset réel (moyennes / bornes), avec
+    des colonnes cohérentes entre elles (réussis ≤ tentés, pourcentages
+    recalculés, rebonds totaux = offensifs + défensifs) et des NaN sur
+    ThreePointerPct quand aucun tir à 3 points n'est tenté.
+    """
+    rng = np.random.default_rng(seed)
+
+    games = rng.integers(11, 83, n_rows)
+    minutes = np.clip(rng.gamma(4.5, 3.9, n_rows), 3.0, 41.0)
+
+    fga = np.clip(minutes * rng.normal(0.33, 0.08, n_rows), 0.3, None)
+    fgm = fga * np.clip(rng.normal(0.44, 0.06, n_rows), 0.2, 0.75)
+    tpa = np.where(
+        rng.random(n_rows) < 0.7,
+        minutes * rng.exponential(0.045, n_rows),
+        0.0,
+    )
+    tpm = tpa * np.clip(rng.normal(0.3, 0.1, n_rows), 0.0, 1.0)
+    fta = np.clip(minutes * rng.normal(0.1, 0.05, n_rows), 0.0, None)
+    ftm = fta * np.clip(rng.normal(0.7, 0.1, n_rows), 0.0, 1.0)
+
+    oreb = np.clip(minutes * rng.normal(0.055, 0.03, n_rows), 0.0, None)
+    dreb = np.clip(minutes * rng.normal(0.11, 0.04, n_rows), 0.1, None)
+    assists = np.clip(minutes * rng.gamma(1.5, 0.055, n_rows), 0.0, None)
+    steals = np.clip(minutes * rng.normal(0.035, 0.012, n_rows), 0.0, None)
+    blocks = np.clip(minutes * rng.gamma(1.2, 0.018, n_rows), 0.0, None)
+    turnovers = np.clip(minutes * rng.normal(0.068, 0.02, n_rows), 0.1, None)
+
+    r1 = lambda values: np.round(values, 1)
+    fga, fgm, tpa, tpm, fta, ftm = map(r1, (fga, fgm, tpa, tpm, fta, ftm))
+    oreb, dreb = r1(oreb), r1(dreb)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        fg_pct = r1(np.where(fga > 0, 100 * fgm / fga, 0.0))
+        tp_pct = r1(np.where(tpa > 0, 100 * tpm / tpa, np.nan))
+        ft_pct = r1(np.where(fta > 0, 100 * ftm / fta, 0.0))
+
+    points = r1(2 * fgm + tpm + ftm)
+
+    # Cible : carrière > 5 ans plus probable avec temps de jeu et production
+    logit = -3.0 + 0.09 * minutes + 0.025 * games + 0.08 * points - 0.2 * turnovers
+    target = (rng.random(n_rows) < 1 / (1 + np.exp(-logit))).astype(np.float64)
+
+    columns = {
+        ID_COLUMN: [f"Player_{i:08d}" for i in range(offset, offset + n_rows)],
+        "GamesPlayed": games,
+        "MinutesPerGame": r1(minutes),
+        "PointsPerGame": points,
+        "FieldGoalsMade": fgm,
+        "FieldGoalsAttempted": fga,
+        "FieldGoalPct": fg_pct,
+        "ThreePointersMade": tpm,
+        "ThreePointersAttempted": tpa,
+        "ThreePointerPct": tp_pct,
+        "FreeThrowsMade": ftm,
+        "FreeThrowsAttempted": fta,
+        "FreeThrowPct": ft_pct,
+        "OffensiveRebounds": oreb,
+        "DefensiveRebounds": dreb,
+        "TotalRebounds": r1(oreb + dreb),
+        "Assists": r1(assists),
+        "Steals": r1(steals),
+        "Blocks": r1(blocks),
+        "Turnovers": r1(turnovers),
+        TARGET_COLUMN: target,
+    }
+
+    return pd.DataFrame(columns, columns=RAW_COLUMNS)
+
+
+def write_synthetic_csv(
+    path: str | Path,
+    n_rows: int,
+    seed: int = 42,
+    chunk_rows: int = 1_000_000,
+) -> Path:
+    """
+    Écrit un CSV synthétique de `n_rows` lignes, bloc par bloc
+    (mémoire bornée par `chunk_rows`). Réutilisé s'il existe déjà.
+    """
+    path = Path(path)
+    if path.exists():
+        return path
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(".tmp")
+
+    app_logger.info(f"Generating synthetic players | rows={n_rows} | path={path}")
+
+    written = 0
+    with open(tmp_path, "w", newline="") as f:
+        while written < n_rows:
+            size = min(chunk_rows, n_rows - written)
+            chunk = generate_players(size, seed=seed + written, offset=written)
+            chunk.to_csv(f, header=written == 0, index=False)
+            written += size
+
+    # Renommage atomique : jamais de fichier partiel réutilisé
+    tmp_path.replace(path)
+
+    return path
@@ -0,0 +1,255 @@
+"""
+PIPELINE STAGE CACHE
+====================
+
+Responsibilities
+----------------
+- Cache the outputs of pipeline stages (e.g. feature matrix) on disk
+- Key every entry by a content hash of:
+    * the input data (file content fingerprint)
+    * the stage code and domain rules version
+    * the stage parameters
+- Store each output array (e.g. the 2-D feature matrix X, the target
+  y) as one NumPy binary file (`.npy`), memory-mapped on read
+- Treat an unreadable entry (missing / truncated `.npy`, corrupt
+  `meta.json`) as a miss and delete it
+- Evict least-recently-used entries above a size budget
+- Track hit / miss / eviction statistics
+
+Layout
+------
+<cache_dir>/<key>/meta.json
+<cache_dir>/<key>/<array_name>.npy
+"""
+
+from __future__ import annotations
+
+import hashlib
+import inspect
+import json
+import os
+import shutil
+import tempfile
+import time
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Final, Iterable, Mapping, Sequence
+
+import numpy as np
+
+from nba_longevity.application.bootstrap import app_logger
+
+
+META_FILE_NAME: Final[str] = "meta.json"
+DEFAULT_MAX_BYTES: Final[int] = 2 * 1024 ** 3  # 2 GiB
+_READ_CHUNK: Final[int] = 8 * 1024 ** 2
+
+
+# Statistiques cumulées sur le process (ex. boucle de sweep)
+_STATS: dict[str, int] = {"hits": 0, "misses": 0, "evictions": 0}
+
+
+def stage_cache_stats() -> dict[str, int]:
+    return dict(_STATS)
+
+
+class CachedStage:
+    """
+    Sortie d'un stage relue depuis le cache.
+    """
+
+    def __init__(self, key: str, arrays: dict[str, np.ndarray], meta: dict[str, Any]):
+        self.key = key
+        self.arrays = arrays
+        self.meta = meta
+
+
+# -------------------------------------------------------------------------
+# Fingerprints
+# -------------------------------------------------------------------------
+def fingerprint_file(path: Path | str, n_bytes: int | None = None) -> str:
+    """
+    Hash SHA-256 du contenu d'un fichier (lecture par blocs).
+
+    `n_bytes` : hash des n premiers octets seulement (détection d'un
+    fichier complété par ajout, le préfixe étant inchangé).
+    """
+    digest = hashlib.sha256()
+    remaining = n_bytes
+    with open(path, "rb") as f:
+        while remaining is None or remaining > 0:
+            size = _READ_CHUNK if remaining is None else min(_READ_CHUNK, remaining)
+            chunk = f.read(size)
+            if not chunk:
+                break
+            digest.update(chunk)
+            if remaining is not None:
+                remaining -= len(chunk)
+    return digest.hexdigest()
+
+
+def fingerprint_code(*modules: ModuleType) -> str:
+    """
+    Hash du code source des modules implémentant un stage :
+    toute modification du code invalide le cache.
+    """
+    digest = hashlib.sha256()
+    for module in modules:
+        digest.update(module.__name__.encode())
+        digest.update(inspect.getsource(module).encode())
+    return digest.hexdigest()
+
+
+# -------------------------------------------------------------------------
+# Cache
+# -------------------------------------------------------------------------
+class StageCache:
+    """
+    Cache de sorties de stages, adressé par contenu.
+    """
+
+    def __init__(self, cache_dir: Path | str, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+
+    @staticmethod
+    def key(
+        stage: str,
+        inputs: Sequence[str],
+        version: Mapping[str, Any],
+        params: Mapping[str, Any],
+    ) -> str:
+        """
+        Clé d'un stage = hash(stage, empreintes des entrées, version, paramètres).
+        """
+        payload = {
+            "stage": stage,
+            "inputs": list(inputs),
+            "version": version,
+            "params": params,
+        }
+        encoded = json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str)
+        return hashlib.sha256(encoded.encode()).hexdigest()
+
+    def get(self, key: str) -> CachedStage | None:
+        entry_dir = self.cache_dir / key
+        meta_path = entry_dir / META_FILE_NAME
+
+        if not meta_path.exists():
+            _STATS["misses"] += 1
+            app_logger.info(f"🗃️ Stage cache miss | key={key[:12]} | {self._stats()}")
+            return None
+
+        start = time.perf_counter()
+        try:
+            meta = json.loads(meta_path.read_text())
+            arrays = {
+                name: np.load(entry_dir / f"{name}.npy", mmap_mode="r")
+                for name in meta["arrays"]
+            }
+        except (OSError, ValueError, KeyError, TypeError) as exc:
+            # JSONDecodeError est un ValueError ; .npy tronqué → ValueError / OSError
+            shutil.rmtree(entry_dir, ignore_errors=True)
+            _STATS["misses"] += 1
+            app_logger.warning(
+                f"🗃️ Stage cache entry unreadable, deleted | key={key[:12]} | "
+                f"error={exc!r} | {self._stats()}"
+            )
+            return None
+
+        # LRU : l'accès rafraîchit la date de l'entrée
+        os.utime(entry_dir)
+
+        _STATS["hits"] += 1
+        app_logger.info(
+            f"🗃️ Stage cache hit | stage={meta.get('stage')} | key={key[:12]} | "
+            f"load_ms={(time.perf_counter() - start) * 1000:.2f} | {self._stats()}"
+        )
+        return CachedStage(key, arrays, meta.get("extra", {}))
+
+    def put(
+        self,
+        key: str,
+        stage: str,
+        arrays: Mapping[str, np.ndarray],
+        extra: Mapping[str, Any] | None = None,
+    ) -> None:
+        entry_dir = self.cache_dir / key
+        if entry_dir.exists():
+            return
+
+        # Écriture atomique : répertoire temporaire puis rename
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        tmp_dir = Path(tempfile.mkdtemp(dir=self.cache_dir, prefix=".tmp-"))
+        try:
+            for name, array in arrays.items():
+                np.save(tmp_dir / f"{name}.npy", np.ascontiguousarray(array))
+            meta = {
+                "stage": stage,
+                "arrays": list(arrays),
+                "extra": dict(extra or {}),
+                "created_at": time.time(),
+            }
+            (tmp_dir / META_FILE_NAME).write_text(json.dumps(meta, default=str))
+            os.replace(tmp_dir, entry_dir)
+        except OSError:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+            if not entry_dir.exists():
+                raise
+
+        app_logger.info(
+            f"🗃️ Stage cache store | stage={stage} | key={key[:12]} | "
+            f"size={_dir_size(entry_dir)} bytes"
+        )
+
+        self.evict(keep=key)
+
+    def evict(self, keep: str | None = None) -> int:
+        """
+        Supprime les entrées les moins récemment utilisées tant que la
+        taille totale dépasse `max_bytes` (l'entrée `keep` est préservée).
+        Retourne le nombre d'entrées supprimées.
+        """
+        entries = [
+            (entry.stat().st_mtime, _dir_size(entry), entry)
+            for entry in self._entries()
+        ]
+        total = sum(size for _, size, _ in entries)
+
+        removed = 0
+        for _, size, entry in sorted(entries, key=lambda e: e[0]):
+            if total <= self.max_bytes:
+                break
+            if entry.name == keep:
+                continue
+            shutil.rmtree(entry, ignore_errors=True)
+            total -= size
+            removed += 1
+
+        if removed:
+            _STATS["evictions"] += removed
+            app_logger.info(
+                f"🗃️ Stage cache eviction | removed={removed} | "
+                f"size={total} bytes | max={self.max_bytes} bytes"
+            )
+        return removed
+
+    def _entries(self) -> Iterable[Path]:
+        if not self.cache_dir.exists():
+            return []
+        return [
+            p for p in self.cache_dir.iterdir()
+            if p.is_dir() and not p.name.startswith(".")
+        ]
+
+    def _stats(self) -> str:
+        total = _STATS["hits"] + _STATS["misses"]
+        hit_ratio = _STATS["hits"] / total if total else 0.0
+        return (
+            f"hits={_STATS['hits']} misses={_STATS['misses']} "
+            f"evictions={_STATS['evictions']} hit_ratio={hit_ratio:.2f}"
+        )
+
+
+def _dir_size(path: Path) -> int:
+    return sum(f.stat().st_size for f in path.iterdir() if f.is_file())
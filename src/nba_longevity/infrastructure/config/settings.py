@@ -4,11 +4,13 @@ INFRASTRUCTURE CONFIGURATION LOADER
 
 Responsibilities
 ----------------
-- Load YAML configuration files
+- Load YAML configuration files (infrastructure, models)
 - Load environment variables (.env)
 - Validate configuration with Pydantic
 - Resolve project-relative paths
-- Ensure required directories exist
+
+Directories are created by the components that write into them,
+never when the configuration is loaded.
 
 Rules
 -----
@@ -18,20 +20,14 @@ Rules
 """
 
 from pathlib import Path
-from typing import Literal
+from typing import Any, Literal
 
 import os
 import yaml
 from dotenv import load_dotenv
-from pydantic import BaseModel, field_validator
+from pydantic import BaseModel
 from nba_longevity.infrastructure.system_utils.root_finder import get_repository_root
 
-# -------------------------------------------------------------------------
-# Project root (structural, never configurable)
-# -------------------------------------------------------------------------
-PROJECT_ROOT = get_repository_root() #Path(__file__).resolve().parents[4]
-
-
 # -------------------------------------------------------------------------
 # Pydantic models
 # -------------------------------------------------------------------------
@@ -43,7 +39,7 @@ class ProjectConfig(BaseModel):
 class PathsConfig(BaseModel):
     """
     All paths are expected to be:
-    - relative to PROJECT_ROOT (recommended)
+    - relative to the project root (recommended)
     - or absolute (allowed, but discouraged in config)
     """
     data_dir: Path
@@ -53,14 +49,12 @@ class PathsConfig(BaseModel):
     artifacts_dir: Path
     logs_dir: Path
 
-    @field_validator("data_dir", "artifacts_dir", "logs_dir")
-    def create_directories(cls, v: Path) -> Path:
-        v.mkdir(parents=True, exist_ok=True)
-        return v
-
 
 class MLflowConfig(BaseModel):
-    tracking_uri: str
+    """
+    tracking_uri: MLFLOW_TRACKING_URI (None → local file tracking store)
+    """
+    tracking_uri: str | None = None
     experiment_name: str
 
 
@@ -69,19 +63,145 @@ class RuntimeConfig(BaseModel):
     log_level: Literal["DEBUG", "INFO", "WARNING", "ERROR"]
 
 
+class PredictionLoggingConfig(BaseModel):
+    """
+    Asynchronous, batched logging of served predictions.
+    - database_url: PREDICTION_LOG_DATABASE_URL (None → SQLite file
+      artifacts_dir/prediction_logs/predictions.sqlite)
+    - max_queue_size: in-memory records beyond which new records are dropped
+    - batch_size / flush_interval_ms: records per transaction / max wait
+    """
+    enabled: bool = True
+    database_url: str | None = None
+    max_queue_size: int = 10_000
+    batch_size: int = 500
+    flush_interval_ms: float = 200.0
+
+
 class InfraConfig(BaseModel):
     project: ProjectConfig
     paths: PathsConfig
     mlflow: MLflowConfig
     runtime: RuntimeConfig
+    prediction_logging: PredictionLoggingConfig = PredictionLoggingConfig()
 
     model_config = {
         "frozen": True  # Immutable config (important)
     }
 
 
+class ModelSettings(BaseModel):
+    type: Literal["xgboost", "catboost"]
+
+
+class SearchParamConfig(BaseModel):
+    """
+    One dimension of a hyperparameter search space.
+    - int / uniform / loguniform: sampled in [low, high]
+    - choice: sampled among values
+    """
+    type: Literal["int", "uniform", "loguniform", "choice"]
+    low: float | None = None
+    high: float | None = None
+    values: list[Any] | None = None
+
+
+class SearchConfig(BaseModel):
+    """
+    Budget-aware search: the resource is the number of boosting rounds
+    (`resource` param), allocated by successive halving / Hyperband.
+    """
+    strategy: Literal["successive_halving", "hyperband"] = "hyperband"
+    resource: str
+    min_resource: int
+    max_resource: int
+    reduction_factor: int = 3
+    space: dict[str, SearchParamConfig]
+
+
+class ModelConfig(BaseModel):
+    model: ModelSettings
+    params: dict[str, Any]
+    search: SearchConfig | None = None
+
+    model_config = {
+        "frozen": True
+    }
+
+
+class TrainingSettings(BaseModel):
+    batch_size: int
+    early_stopping_rounds: int
+    eval_metric: str
+    test_size: float
+    shuffle: bool
+
+
+class CrossValidationConfig(BaseModel):
+    """
+    parallel_folds: folds trained concurrently (None → one per core, capped by n_splits)
+    """
+    enabled: bool = False
+    n_splits: int = 5
+    parallel_folds: int | None = None
+
+
+class InstrumentationConfig(BaseModel):
+    """
+    Per-stage instrumentation of the training pipeline
+    (optional cProfile / tracemalloc capture per stage).
+    """
+    enabled: bool = True
+    cprofile: bool = False
+    tracemalloc: bool = False
+    profile_top_n: int = 25
+
+
+class WarmStartConfig(BaseModel):
+    """
+    Incremental training from the latest persisted model when new rows
+    were appended to the raw data (see application/training/warm_start.py).
+    - incremental_rounds: boosting rounds / iterations added to the model
+    - max_auc_drop: validation-AUC drop beyond which a full retrain is run
+    - max_new_fraction: share of new rows beyond which a full retrain is run
+    - max_incremental_updates: incremental updates chained before a full retrain
+    """
+    enabled: bool = False
+    incremental_rounds: int = 100
+    max_auc_drop: float = 0.01
+    max_new_fraction: float = 0.5
+    max_incremental_updates: int = 5
+
+
+class EvaluationConfig(BaseModel):
+    """
+    Validation metrics of the training run (threshold sweep, bootstrap CIs).
+    - bootstrap_resamples: 0 disables the confidence intervals
+    """
+    bootstrap_resamples: int = 1000
+    confidence: float = 0.95
+
+
+class LoggingSettings(BaseModel):
+    log_to_mlflow: bool
+    log_models: bool
+
+
+class TrainConfig(BaseModel):
+    training: TrainingSettings
+    cross_validation: CrossValidationConfig
+    instrumentation: InstrumentationConfig = InstrumentationConfig()
+    warm_start: WarmStartConfig = WarmStartConfig()
+    evaluation: EvaluationConfig = EvaluationConfig()
+    logging: LoggingSettings
+
+    model_config = {
+        "frozen": True
+    }
+
+
 # -------------------------------------------------------------------------
-# Loader
+# Loaders
 # -------------------------------------------------------------------------
 def load_infra_config(config_path: Path) -> InfraConfig:
     """
@@ -101,22 +221,63 @@ def load_infra_config(config_path: Path) -> InfraConfig:
         raw_config = yaml.safe_load(f)
 
     # --------------------------------------------------
-    # Resolve MLflow tracking URI from env
+    # Resolve MLflow tracking URI from env (optional:
+    # only experiment tracking needs it)
     # --------------------------------------------------
-    mlflow_uri = os.getenv("MLFLOW_TRACKING_URI")
-    if mlflow_uri is None:
-        raise RuntimeError("MLFLOW_TRACKING_URI is not defined in environment")
+    raw_config["mlflow"]["tracking_uri"] = os.getenv("MLFLOW_TRACKING_URI")
 
-    raw_config["mlflow"]["tracking_uri"] = mlflow_uri
+    # --------------------------------------------------
+    # Resolve prediction log database from env (optional:
+    # local SQLite file otherwise)
+    # --------------------------------------------------
+    raw_config.setdefault("prediction_logging", {})
+    raw_config["prediction_logging"]["database_url"] = os.getenv("PREDICTION_LOG_DATABASE_URL")
 
     # --------------------------------------------------
-    # Resolve paths (relative → PROJECT_ROOT, absolute → unchanged)
+    # Resolve paths (relative → project root, absolute → unchanged)
     # --------------------------------------------------
+    project_root = None
     resolved_paths = {}
     for key, value in raw_config["paths"].items():
         path = Path(value)
-        resolved_paths[key] = path if path.is_absolute() else PROJECT_ROOT / path
+        if not path.is_absolute():
+            project_root = project_root or _project_root(config_path)
+            path = project_root / path
+        resolved_paths[key] = path
 
     raw_config["paths"] = resolved_paths
 
-    return InfraConfig(**raw_config)
\ No newline at end of file
+    return InfraConfig(**raw_config)
+
+
+def _project_root(config_path: Path) -> Path:
+    """
+    Root for relative paths, resolved on demand: the repository checkout,
+    otherwise the parent of the config directory (<root>/config/infra.yaml),
+    e.g. an installed package run with NBA_LONGEVITY_CONFIG.
+    """
+    try:
+        return get_repository_root()
+    except FileNotFoundError:
+        return Path(config_path).resolve().parent.parent
+
+
+def load_model_config(config_path: Path) -> ModelConfig:
+    """
+    Load and validate a model configuration (config/model/<type>.yml):
+    base training params + optional hyperparameter search space.
+    """
+    with open(config_path, "r") as f:
+        raw_config = yaml.safe_load(f)
+
+    return ModelConfig(**raw_config)
+
+
+def load_train_config(config_path: Path) -> TrainConfig:
+    """
+    Load and validate the training configuration (config/train.yaml).
+    """
+    with open(config_path, "r") as f:
+        raw_config = yaml.safe_load(f)
+
+    return TrainConfig(**raw_config)
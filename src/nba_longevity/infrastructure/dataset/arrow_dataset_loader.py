@@ -0,0 +1,93 @@
+from pathlib import Path
+from typing import Any, Sequence, Tuple
+
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+from pyarrow import fs
+
+from nba_longevity.application.bootstrap import app_logger
+from nba_longevity.domain.ports.dataset_loader_port import DatasetLoaderPort
+from nba_longevity.infrastructure.dataset.dtype_plan import DtypePlan
+from nba_longevity.infrastructure.dataset.pandas_dataset import PandasDataset
+
+
+# Extension → format pyarrow.dataset
+COLUMNAR_FORMATS = {
+    ".parquet": "parquet",
+    ".pq": "parquet",
+    ".feather": "feather",
+    ".arrow": "ipc",
+    ".ipc": "ipc",
+}
+
+# Filtre simple : (colonne, opérateur, valeur), ex. ("MinutesPerGame", ">", 0)
+RowFilter = Tuple[str, str, Any]
+
+
+class ArrowDatasetLoader(DatasetLoaderPort):
+    """
+    Columnar dataset loader (Parquet / Feather / Arrow IPC).
+
+    Responsibility:
+    - Read only the requested columns (projection)
+    - Push simple row filters down to the reader (row groups / batches
+      that cannot match are skipped)
+    - Memory-map local files where the format allows it (Feather / IPC)
+    - Cast columns to the DtypePlan load types, if one is given
+    - Wrap the result into a PandasDataset abstraction
+    - Perform NO business logic
+
+    ⚠️ Pushing down `MinutesPerGame > 0` before preprocessing drops the rows
+    before median imputation: medians are then computed on the filtered rows
+    only, which differs from PandasPreprocessingAdapter on the full data.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        columns: Sequence[str] | None = None,
+        filters: Sequence[RowFilter] | None = None,
+        fmt: str | None = None,
+        memory_map: bool = True,
+        dtype_plan: DtypePlan | None = None,
+    ):
+        self.path = Path(path)
+        self.columns = list(columns) if columns is not None else None
+        self.filters = list(filters) if filters else None
+        self.fmt = fmt or COLUMNAR_FORMATS.get(self.path.suffix.lower())
+        self.memory_map = memory_map
+        self.dtype_plan = dtype_plan or DtypePlan.wide()
+        if self.columns is None and self.dtype_plan.usecols is not None:
+            self.columns = list(self.dtype_plan.usecols)
+
+        if self.fmt not in set(COLUMNAR_FORMATS.values()):
+            raise ValueError(f"Unsupported format: {self.fmt} ({self.path})")
+
+    def load(self) -> PandasDataset:
+        app_logger.info(
+            f"Loading {self.fmt} dataset from path: {self.path} | "
+            f"columns={self.columns or 'all'} | filters={self.filters or 'none'}"
+        )
+
+        dataset = ds.dataset(
+            self.path,
+            format=self.fmt,
+            filesystem=fs.LocalFileSystem(use_mmap=self.memory_map),
+        )
+
+        table = dataset.to_table(
+            columns=self.columns,
+            filter=pq.filters_to_expression(self.filters) if self.filters else None,
+        )
+
+        # split_blocks + self_destruct : libère les buffers Arrow au fil de
+        # la conversion (pic mémoire ≈ une seule copie des données)
+        df = table.to_pandas(split_blocks=True, self_destruct=True)
+        del table
+        df = self.dtype_plan.cast_loaded(df)
+
+        app_logger.info(
+            f"{self.fmt} loaded successfully | rows={df.shape[0]} | cols={df.shape[1]}"
+        )
+
+        return PandasDataset(df)
@@ -0,0 +1,157 @@
+"""
+CSV → COLUMNAR CONVERTER
+========================
+
+One-shot conversion of the raw CSV layout (`nba_players.csv`) into a
+columnar file readable by ArrowDatasetLoader.
+
+- Streaming: the CSV is read block by block, memory stays bounded
+- Explicit schema derived from the Domain (no type inference per block)
+- Numeric columns are parsed permissively: an invalid cell becomes null,
+  as `to_numeric(errors="coerce")` does in the Pandas pipeline
+
+Usage
+-----
+python -m nba_longevity.infrastructure.dataset.columnar_converter \\
+    data/raw/nba_players.csv data/raw/nba_players.parquet
+"""
+
+import argparse
+from pathlib import Path
+
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pacsv
+import pyarrow.ipc as ipc
+import pyarrow.parquet as pq
+
+from nba_longevity.application.bootstrap import app_logger
+from nba_longevity.domain.preprocessing.preprocessing_rules import (
+    NUMERIC_COLUMNS, TARGET_COLUMN, ID_COLUMN
+)
+from nba_longevity.infrastructure.dataset.arrow_dataset_loader import COLUMNAR_FORMATS
+
+# Codecs acceptés par le format Arrow IPC / Feather v2
+IPC_COMPRESSIONS = ("lz4", "zstd")
+
+
+def raw_schema() -> pa.Schema:
+    """
+    Schéma brut : identifiant texte, statistiques et cible en float64.
+    """
+    return pa.schema(
+        [(ID_COLUMN, pa.string())]
+        + [(col, pa.float64()) for col in NUMERIC_COLUMNS]
+        + [(TARGET_COLUMN, pa.float64())]
+    )
+
+
+def _read_schema(schema: pa.Schema) -> pa.Schema:
+    """
+    Schéma de lecture : colonnes numériques lues en texte, converties
+    ensuite sans échec (une cellule invalide ne fait pas échouer le bloc).
+    """
+    return pa.schema([
+        (field.name, pa.string() if pa.types.is_floating(field.type) else field.type)
+        for field in schema
+    ])
+
+
+def _coerce_numeric(column: pa.Array, target_type: pa.DataType) -> pa.Array:
+    """
+    Texte → numérique, valeur invalide → null (`to_numeric(errors="coerce")`).
+    """
+    try:
+        # Cas courant : bloc propre, conversion Arrow vectorisée
+        return pc.cast(column, target_type)
+    except pa.ArrowInvalid:
+        import pandas as pd
+
+        coerced = pd.to_numeric(column.to_pandas(), errors="coerce")
+        return pa.array(coerced, type=target_type, from_pandas=True)
+
+
+def _coerce_batch(batch: pa.RecordBatch, schema: pa.Schema) -> pa.RecordBatch:
+    columns = [
+        _coerce_numeric(column, field.type) if column.type != field.type else column
+        for column, field in zip(batch.columns, schema)
+    ]
+    return pa.RecordBatch.from_arrays(columns, schema=schema)
+
+
+def convert_csv_to_columnar(
+    csv_path: str | Path,
+    output_path: str | Path,
+    fmt: str | None = None,
+    compression: str | None = None,
+    block_size: int = 16 * 1024 ** 2,
+) -> int:
+    """
+    Convertit un CSV brut en Parquet / Feather / Arrow IPC.
+
+    compression : codec ; None = défaut du format (zstd en Parquet, aucune
+    en Feather / IPC pour le memory-mapping). Feather / IPC n'acceptent
+    que lz4 ou zstd.
+
+    Retourne le nombre de lignes écrites.
+    """
+    output_path = Path(output_path)
+    fmt = fmt or COLUMNAR_FORMATS.get(output_path.suffix.lower())
+    if fmt not in set(COLUMNAR_FORMATS.values()):
+        raise ValueError(f"Unsupported format: {fmt} ({output_path})")
+    if fmt != "parquet" and compression is not None and compression not in IPC_COMPRESSIONS:
+        raise ValueError(
+            f"Unsupported compression for {fmt}: {compression} (expected one of {IPC_COMPRESSIONS})"
+        )
+
+    schema = raw_schema()
+    reader = pacsv.open_csv(
+        csv_path,
+        read_options=pacsv.ReadOptions(block_size=block_size),
+        convert_options=pacsv.ConvertOptions(
+            column_types=_read_schema(schema),
+            include_columns=schema.names,
+            # Marqueurs usuels ("", "NA", "NaN", ...) → null, comme read_csv
+            strings_can_be_null=True,
+        ),
+    )
+
+    app_logger.info(f"Converting {csv_path} → {output_path} ({fmt})")
+
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    n_rows = 0
+
+    if fmt == "parquet":
+        writer = pq.ParquetWriter(output_path, schema, compression=compression or "zstd")
+    else:
+        # Feather v2 = fichier Arrow IPC ; non compressé par défaut (memory-mapping)
+        writer = ipc.new_file(
+            str(output_path), schema, options=ipc.IpcWriteOptions(compression=compression)
+        )
+
+    with writer:
+        for batch in reader:
+            writer.write_batch(_coerce_batch(batch, schema))
+            n_rows += batch.num_rows
+
+    app_logger.info(f"Conversion done | rows={n_rows} | size={output_path.stat().st_size} bytes")
+
+    return n_rows
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Convert raw CSV to a columnar format")
+    parser.add_argument("csv_path")
+    parser.add_argument("output_path")
+    parser.add_argument("--format", dest="fmt", default=None, choices=["parquet", "feather", "ipc"])
+    parser.add_argument(
+        "--compression", default=None,
+        help="Codec (default: zstd for parquet, none for feather/ipc)",
+    )
+    args = parser.parse_args()
+
+    convert_csv_to_columnar(args.csv_path, args.output_path, args.fmt, args.compression)
+
+
+if __name__ == "__main__":
+    main()
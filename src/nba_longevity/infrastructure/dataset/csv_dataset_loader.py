@@ -1,6 +1,8 @@
+from typing import Iterator, Sequence
 from pandas import read_csv
 from nba_longevity.application.bootstrap import app_logger
 from nba_longevity.domain.ports.dataset_loader_port import DatasetLoaderPort
+from nba_longevity.infrastructure.dataset.dtype_plan import DtypePlan
 from nba_longevity.infrastructure.dataset.pandas_dataset import PandasDataset
 
 
@@ -9,21 +11,67 @@ class CsvDatasetLoader(DatasetLoaderPort):
     CSV dataset loader.
 
     Responsibility:
-    - Load raw CSV data from disk
+    - Load raw CSV data from disk (whole file or fixed-size chunks)
     - Wrap it into a PandasDataset abstraction
     - Perform NO business logic
+
+    With a DtypePlan, columns are parsed straight into their compact
+    types (no float64 / object intermediate). If a cell is not numeric,
+    the file is parsed again without numeric dtypes and the preprocessing
+    coerces it to NaN, as with the historical dtypes. With `columns`,
+    only those columns are parsed (projection).
     """
 
-    def __init__(self, path: str):
+    def __init__(
+        self,
+        path: str,
+        dtype_plan: DtypePlan | None = None,
+        columns: Sequence[str] | None = None,
+    ):
         self.path = path
+        self.columns = list(columns) if columns is not None else None
+        self.dtype_plan = dtype_plan or DtypePlan.wide()
 
     def load(self) -> PandasDataset:
         app_logger.info(f"Loading CSV dataset from path: {self.path}")
 
-        df = read_csv(self.path)
+        try:
+            df = read_csv(self.path, **self.dtype_plan.read_csv_options(self.columns))
+        except ValueError as exc:
+            app_logger.warning(
+                f"Non-numeric values in CSV, numeric dtypes left to preprocessing | {exc}"
+            )
+            df = read_csv(
+                self.path, **self.dtype_plan.read_csv_options(self.columns, numeric=False)
+            )
 
         app_logger.info(
-            f"CSV loaded successfully | rows={df.shape[0]} | cols={df.shape[1]}"
+            f"CSV loaded successfully | rows={df.shape[0]} | cols={df.shape[1]} | "
+            f"dtypes={self.dtype_plan.name}"
         )
 
         return PandasDataset(df)
+
+    def iter_chunks(
+        self,
+        chunksize: int = 100_000,
+        columns: Sequence[str] | None = None,
+    ) -> Iterator[PandasDataset]:
+        """
+        Stream the CSV as PandasDataset chunks of at most `chunksize` rows.
+        Memory stays bounded by the chunk size, whatever the file size.
+        """
+        app_logger.info(
+            f"Streaming CSV dataset from path: {self.path} | chunksize={chunksize}"
+        )
+
+        n_rows = 0
+        # Un chunk ne peut pas être relu : conversion numérique laissée au preprocessing
+        options = self.dtype_plan.read_csv_options(
+            list(columns) if columns is not None else None, numeric=False
+        )
+        for chunk in read_csv(self.path, chunksize=chunksize, **options):
+            n_rows += len(chunk)
+            yield PandasDataset(chunk)
+
+        app_logger.info(f"CSV streamed successfully | rows={n_rows}")
@@ -0,0 +1,147 @@
+from dataclasses import dataclass, field
+from typing import Mapping
+
+import numpy as np
+import pandas as pd
+
+from nba_longevity.domain.preprocessing.preprocessing_rules import (
+    ID_COLUMN,
+    INTEGER_COLUMNS,
+    NUMERIC_COLUMNS,
+    TARGET_COLUMN,
+)
+
+
+WIDE = "float64"
+COMPACT = "compact"
+DTYPE_PLANS = (WIDE, COMPACT)
+
+# Largeurs retenues : GamesPlayed <= 82 par saison, cible binaire
+_INTEGER_WIDTHS = {col: 16 for col in INTEGER_COLUMNS}
+_TARGET_WIDTH = 8
+
+
+@dataclass(frozen=True)
+class DtypePlan:
+    """
+    Types physiques des colonnes, de la lecture à la matrice de features,
+    dérivés du schéma du Domain.
+
+    - `load_dtypes` : types imposés au lecteur ; float32 pour toutes les
+      colonnes numériques, comptages et cible compris (NaN encore
+      possibles, valeurs non entières tolérées)
+    - `clean_dtypes` : types après imputation et filtre (plus aucun NaN) ;
+      comptages et cible en petits entiers, arrondis au préalable
+    - `usecols` : colonnes lues (None = toutes) ; l'identifiant n'est lu
+      que s'il est conservé, en `category`
+    - `integer_columns` : colonnes de comptage, imputées par la médiane
+      arrondie (pour rester entières)
+
+    Le plan `float64` est vide : types inférés par le lecteur
+    (float64 / int64 / object), comportement historique.
+    """
+
+    name: str
+    load_dtypes: Mapping[str, str] = field(default_factory=dict)
+    clean_dtypes: Mapping[str, str] = field(default_factory=dict)
+    usecols: tuple[str, ...] | None = None
+    integer_columns: tuple[str, ...] = ()
+
+    @classmethod
+    def wide(cls) -> "DtypePlan":
+        return cls(name=WIDE)
+
+    @classmethod
+    def compact(cls, keep_id: bool = False) -> "DtypePlan":
+        """
+        float32 pour les statistiques, petits entiers pour les comptages
+        et la cible, identifiant en `category` ou non chargé.
+        """
+        load_dtypes = {col: "float32" for col in [*NUMERIC_COLUMNS, TARGET_COLUMN]}
+        clean_dtypes = dict(load_dtypes)
+        for col, bits in _INTEGER_WIDTHS.items():
+            clean_dtypes[col] = f"int{bits}"
+        clean_dtypes[TARGET_COLUMN] = f"int{_TARGET_WIDTH}"
+
+        usecols = [*NUMERIC_COLUMNS, TARGET_COLUMN]
+        if keep_id:
+            load_dtypes[ID_COLUMN] = clean_dtypes[ID_COLUMN] = "category"
+            usecols.insert(0, ID_COLUMN)
+
+        return cls(
+            name=COMPACT,
+            load_dtypes=load_dtypes,
+            clean_dtypes=clean_dtypes,
+            usecols=tuple(usecols),
+            integer_columns=tuple(_INTEGER_WIDTHS),
+        )
+
+    @classmethod
+    def from_name(cls, name: str, keep_id: bool = False) -> "DtypePlan":
+        if name == WIDE:
+            return cls.wide()
+        if name == COMPACT:
+            return cls.compact(keep_id=keep_id)
+        raise ValueError(f"Unknown dtype plan: {name} (expected one of {DTYPE_PLANS})")
+
+    # ------------------------------------------------------------------
+    # Application
+    # ------------------------------------------------------------------
+    def read_csv_options(self, columns: list[str] | None = None, numeric: bool = True) -> dict:
+        """
+        Options de `pandas.read_csv` (dtype, usecols) ; `columns` restreint
+        la lecture à une projection.
+
+        `numeric=False` : types numériques non imposés au lecteur (une
+        cellule non numérique le ferait échouer) ; la conversion avec
+        coercition est alors faite par le preprocessing.
+        """
+        if not self.load_dtypes:
+            return {"usecols": columns}
+
+        usecols = columns if columns is not None else self.usecols
+        selected = set(usecols) if usecols is not None else set(self.load_dtypes)
+        return {
+            "usecols": list(usecols) if usecols is not None else None,
+            "dtype": {
+                col: t for col, t in self.load_dtypes.items()
+                if col in selected and (numeric or col == ID_COLUMN)
+            },
+        }
+
+    def cast_loaded(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Types de lecture (colonnes présentes seulement), ex. après un
+        lecteur colonnaire ou une conversion numérique.
+        """
+        return _astype_present(df, self.load_dtypes)
+
+    def cast_clean(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Types définitifs, une fois les NaN imputés ; les colonnes entières
+        sont arrondies avant conversion (ex. 62.5 saisi pour GamesPlayed).
+        """
+        to_round = [
+            col for col in self.integer_columns
+            if col in df.columns and str(df[col].dtype) != self.clean_dtypes.get(col)
+        ]
+        if to_round:
+            df[to_round] = df[to_round].round()
+        return _astype_present(df, self.clean_dtypes)
+
+    def imputation_values(self, medians: Mapping[str, float]) -> dict[str, float]:
+        """
+        Valeurs d'imputation : médianes, arrondies pour les comptages.
+        """
+        return {
+            col: float(np.round(value)) if col in self.integer_columns and np.isfinite(value) else value
+            for col, value in medians.items()
+        }
+
+
+def _astype_present(df: pd.DataFrame, dtypes: Mapping[str, str]) -> pd.DataFrame:
+    changes = {
+        col: dtype for col, dtype in dtypes.items()
+        if col in df.columns and str(df[col].dtype) != dtype
+    }
+    return df.astype(changes, copy=False) if changes else df
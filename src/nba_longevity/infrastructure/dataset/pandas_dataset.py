@@ -1,9 +1,10 @@
+import numpy as np
 import pandas as pd
-from typing import Iterator, Mapping, Any
-from nba_longevity.domain.dataset.dataset import Dataset
+from typing import Iterable, Iterator, Mapping, Any, Sequence, Tuple
+from nba_longevity.domain.dataset.dataset import Dataset, ColumnarDataset
 
 
-class PandasDataset(Dataset):
+class PandasDataset(ColumnarDataset):
     """
     Implémentation Pandas du Dataset abstrait.
     """
@@ -14,3 +15,100 @@ class PandasDataset(Dataset):
     def __iter__(self) -> Iterator[Mapping[str, Any]]:
         for row in self._df.itertuples(index=False):
             yield row._asdict()
+
+    def __len__(self) -> int:
+        return len(self._df)
+
+    @property
+    def columns(self) -> Sequence[str]:
+        return list(self._df.columns)
+
+    def to_columns(
+        self,
+        columns: Sequence[str] | None = None,
+    ) -> Mapping[str, Any]:
+        # to_numpy(copy=False) = vue sur le bloc Pandas (pas de copie)
+        selected = self._df.columns if columns is None else columns
+        return {col: self._df[col].to_numpy(copy=False) for col in selected}
+
+    def take(self, indices: Sequence[int]) -> "PandasDataset":
+        """
+        Sous-ensemble de lignes par position (ex. indices de validation).
+        """
+        return PandasDataset(self._df.iloc[indices])
+
+
+def to_pandas(dataset: Dataset | Iterable[Mapping[str, Any]]) -> pd.DataFrame:
+    """
+    Convertit un Dataset (ou une séquence de lignes) en DataFrame Pandas.
+
+    Ordre de préférence :
+    1. PandasDataset → DataFrame sous-jacent (copie superficielle, sans copie
+       des données : l'appelant peut ajouter/remplacer des colonnes sans
+       modifier le dataset d'entrée)
+    2. ColumnarDataset → DataFrame construit colonne par colonne
+    3. Sinon → itération ligne par ligne (chemin historique)
+    """
+    if isinstance(dataset, PandasDataset):
+        return dataset._df.copy(deep=False)
+
+    if isinstance(dataset, ColumnarDataset):
+        return pd.DataFrame(dataset.to_columns(), copy=False)
+
+    return pd.DataFrame(list(dataset))
+
+
+def to_feature_matrix(
+    dataset: Dataset | Iterable[Mapping[str, Any]],
+    feature_columns: Sequence[str],
+    target_column: str | None = None,
+    dtype: Any = np.float32,
+) -> Tuple[np.ndarray, np.ndarray | None]:
+    """
+    Matérialise les features dans une unique matrice C-contiguë.
+
+    La matrice est allouée une seule fois puis remplie colonne par
+    colonne : splits, folds et trainers en consomment ensuite des
+    sous-ensembles d'indices au lieu de reconstruire des DataFrames.
+
+    Returns
+    -------
+    (X, y)
+        X de forme (n_rows, n_features), y = cible (None si target_column
+        n'est pas fourni).
+    """
+    if isinstance(dataset, ColumnarDataset):
+        wanted = list(feature_columns)
+        if target_column is not None:
+            wanted.append(target_column)
+        columns = dataset.to_columns(wanted)
+    else:
+        df = to_pandas(dataset)
+        columns = {col: df[col].to_numpy(copy=False) for col in df.columns}
+
+    n_rows = len(columns[feature_columns[0]]) if feature_columns else 0
+    X = np.empty((n_rows, len(feature_columns)), dtype=dtype)
+    for j, col in enumerate(feature_columns):
+        X[:, j] = columns[col]
+
+    y = None
+    if target_column is not None:
+        y = np.asarray(columns[target_column])
+
+    return X, y
+
+
+def from_feature_matrix(
+    X: np.ndarray,
+    feature_columns: Sequence[str],
+    y: np.ndarray | None = None,
+    target_column: str | None = None,
+) -> PandasDataset:
+    """
+    Enveloppe une matrice de features (et sa cible) dans un PandasDataset,
+    sans copie de X.
+    """
+    df = pd.DataFrame(X, columns=list(feature_columns), copy=False)
+    if y is not None and target_column is not None:
+        df[target_column] = y
+    return PandasDataset(df)
@@ -0,0 +1,55 @@
+import queue
+import threading
+from typing import Iterable, Iterator, TypeVar
+
+
+T = TypeVar("T")
+
+_DONE = object()
+
+
+def prefetch(items: Iterable[T], depth: int = 2) -> Iterator[T]:
+    """
+    Itère `items` en produisant les éléments suivants dans un thread de fond.
+
+    Typiquement : la lecture / le parsing du chunk N+1 (I/O, pandas libère
+    le GIL pendant le parsing C) chevauche le calcul sur le chunk N.
+    Au plus `depth` éléments sont en attente : la mémoire reste bornée.
+    Les exceptions du producteur sont relancées côté consommateur.
+    """
+    if depth <= 0:
+        yield from items
+        return
+
+    buffer: queue.Queue = queue.Queue(maxsize=depth)
+    stop = threading.Event()
+
+    def produce() -> None:
+        try:
+            for item in items:
+                while not stop.is_set():
+                    try:
+                        buffer.put(item, timeout=0.1)
+                        break
+                    except queue.Full:
+                        continue
+                if stop.is_set():
+                    return
+            buffer.put(_DONE)
+        except BaseException as exc:  # relancée dans le thread consommateur
+            buffer.put(exc)
+
+    producer = threading.Thread(target=produce, name="prefetch", daemon=True)
+    producer.start()
+
+    try:
+        while True:
+            item = buffer.get()
+            if item is _DONE:
+                return
+            if isinstance(item, BaseException):
+                raise item
+            yield item
+    finally:
+        stop.set()
+        producer.join(timeout=1.0)
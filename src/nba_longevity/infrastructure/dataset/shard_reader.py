@@ -0,0 +1,148 @@
+import io
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterator, Sequence
+
+import pandas as pd
+
+from nba_longevity.infrastructure.dataset.pandas_dataset import PandasDataset
+
+
+DEFAULT_SHARD_BYTES = 64 * 1024 ** 2
+
+# Échantillon lu en tête de fichier pour estimer la taille d'une ligne CSV
+_SAMPLE_BYTES = 64 * 1024
+
+
+@dataclass(frozen=True)
+class Shard:
+    """
+    Portion indépendante d'un fichier d'entrée.
+
+    - csv : plage d'octets [start, end) ; la shard possède les lignes qui
+      *commencent* dans la plage (une ligne à cheval est lue en entier
+      par la shard où elle commence)
+    - parquet : sous-ensemble de row groups
+    """
+
+    index: int
+    path: str
+    fmt: str
+    start: int = 0
+    end: int = 0
+    row_groups: tuple[int, ...] = ()
+    bytes_per_row: float = 0.0
+
+
+def plan_shards(
+    paths: Sequence[str | Path],
+    shard_bytes: int = DEFAULT_SHARD_BYTES,
+) -> list[Shard]:
+    """
+    Découpe les fichiers d'entrée (csv / parquet) en shards d'environ
+    `shard_bytes` octets. Aucune donnée n'est lue hors des métadonnées
+    et d'un court échantillon par fichier CSV.
+    """
+    shards: list[Shard] = []
+    for path in paths:
+        path = Path(path)
+        suffix = path.suffix.lower()
+
+        if suffix == ".csv":
+            size = path.stat().st_size
+            with open(path, "rb") as f:
+                header = f.readline()
+                sample = f.read(_SAMPLE_BYTES)
+            data_start = len(header)
+            bytes_per_row = len(sample) / max(sample.count(b"\n"), 1)
+
+            start = data_start
+            while start < size:
+                end = min(start + shard_bytes, size)
+                shards.append(Shard(
+                    index=len(shards), path=str(path), fmt="csv",
+                    start=start, end=end, bytes_per_row=bytes_per_row,
+                ))
+                start = end
+
+        elif suffix in (".parquet", ".pq"):
+            import pyarrow.parquet as pq
+
+            metadata = pq.ParquetFile(path).metadata
+            group, group_bytes = [], 0
+            for i in range(metadata.num_row_groups):
+                group.append(i)
+                group_bytes += metadata.row_group(i).total_byte_size
+                if group_bytes >= shard_bytes:
+                    shards.append(Shard(index=len(shards), path=str(path), fmt="parquet",
+                                        row_groups=tuple(group)))
+                    group, group_bytes = [], 0
+            if group:
+                shards.append(Shard(index=len(shards), path=str(path), fmt="parquet",
+                                    row_groups=tuple(group)))
+
+        else:
+            raise ValueError(f"Unsupported input format: {path}")
+
+    return shards
+
+
+def iter_shard_chunks(
+    shard: Shard,
+    chunk_rows: int = 100_000,
+    columns: Sequence[str] | None = None,
+) -> Iterator[PandasDataset]:
+    """
+    Lit une shard par blocs d'environ `chunk_rows` lignes (mémoire bornée
+    par la taille d'un bloc, quelle que soit la taille de la shard).
+    """
+    if shard.fmt == "parquet":
+        import pyarrow.parquet as pq
+
+        parquet_file = pq.ParquetFile(shard.path)
+        available = set(parquet_file.schema_arrow.names)
+        wanted = [c for c in columns if c in available] if columns is not None else None
+        for batch in parquet_file.iter_batches(
+            batch_size=chunk_rows, row_groups=list(shard.row_groups), columns=wanted
+        ):
+            yield PandasDataset(batch.to_pandas())
+        return
+
+    chunk_bytes = max(int(chunk_rows * shard.bytes_per_row), 1)
+    yield from _iter_csv_range(shard, chunk_bytes, columns)
+
+
+def _iter_csv_range(
+    shard: Shard,
+    chunk_bytes: int,
+    columns: Sequence[str] | None,
+) -> Iterator[PandasDataset]:
+    with open(shard.path, "rb") as f:
+        header = f.readline()
+        available = set(pd.read_csv(io.BytesIO(header), nrows=0).columns)
+        usecols = [c for c in columns if c in available] if columns is not None else None
+
+        # Alignement sur la première ligne commençant dans [start, end)
+        if shard.start > len(header):
+            f.seek(shard.start - 1)
+            f.readline()
+        position = f.tell()
+
+        carry = b""
+        while position < shard.end:
+            block = f.read(min(chunk_bytes, shard.end - position))
+            if not block:
+                break
+            position += len(block)
+            if position >= shard.end and not block.endswith(b"\n"):
+                # Dernière ligne commencée dans la plage : lue en entier
+                block += f.readline()
+
+            data = carry + block
+            cut = data.rfind(b"\n") + 1
+            carry = data[cut:]
+            if cut:
+                yield PandasDataset(pd.read_csv(io.BytesIO(header + data[:cut]), usecols=usecols))
+
+        if carry.strip():
+            yield PandasDataset(pd.read_csv(io.BytesIO(header + carry), usecols=usecols))
@@ -1,8 +1,8 @@
-from typing import Iterator, Mapping, Any
-from nba_longevity.domain.dataset.dataset import Dataset
+from typing import Iterator, Mapping, Any, Sequence
+from nba_longevity.domain.dataset.dataset import ColumnarDataset
 
 
-class SparkDataset(Dataset):
+class SparkDataset(ColumnarDataset):
     """
     Implémentation Spark du Dataset abstrait.
     """
@@ -14,3 +14,18 @@ class SparkDataset(Dataset):
         # toLocalIterator = streaming ligne par ligne
         for row in self._df.toLocalIterator():
             yield row.asDict()
+
+    @property
+    def columns(self) -> Sequence[str]:
+        return list(self._df.columns)
+
+    def to_columns(
+        self,
+        columns: Sequence[str] | None = None,
+    ) -> Mapping[str, Any]:
+        # Projection côté Spark puis collecte en un seul transfert
+        # (Arrow si spark.sql.execution.arrow.pyspark.enabled=true),
+        # au lieu d'un Row Python par observation.
+        selected = list(self._df.columns if columns is None else columns)
+        pdf = self._df.select(*selected).toPandas()
+        return {col: pdf[col].to_numpy(copy=False) for col in selected}
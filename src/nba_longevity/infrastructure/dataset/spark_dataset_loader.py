@@ -1,16 +1,46 @@
-from domain.ports.dataset_loader_port import DatasetLoaderPort
-from infrastructure.dataset.spark_dataset import SparkDataset
+import operator
+from typing import Any, Sequence, Tuple
+
+from nba_longevity.domain.ports.dataset_loader_port import DatasetLoaderPort
+from nba_longevity.infrastructure.dataset.spark_dataset import SparkDataset
+
+
+# Filtre simple : (colonne, opérateur, valeur), ex. ("MinutesPerGame", ">", 0)
+RowFilter = Tuple[str, str, Any]
+
+_OPERATORS = {
+    "==": operator.eq,
+    "=": operator.eq,
+    "!=": operator.ne,
+    "<": operator.lt,
+    "<=": operator.le,
+    ">": operator.gt,
+    ">=": operator.ge,
+}
 
 
 class SparkDatasetLoader(DatasetLoaderPort):
     """
     Charge un dataset depuis Spark.
+
+    - csv : lecture avec en-tête et inférence de schéma
+    - parquet / orc : projection des colonnes et filtres poussés
+      jusqu'au lecteur (pushdown Spark)
     """
 
-    def __init__(self, spark_session, path: str, fmt: str = "csv"):
+    def __init__(
+        self,
+        spark_session,
+        path: str,
+        fmt: str = "csv",
+        columns: Sequence[str] | None = None,
+        filters: Sequence[RowFilter] | None = None,
+    ):
         self.spark = spark_session
-        self.path = path
+        self.path = str(path)
         self.fmt = fmt
+        self.columns = list(columns) if columns is not None else None
+        self.filters = list(filters) if filters else []
 
     def load(self):
         if self.fmt == "csv":
@@ -20,7 +50,22 @@ class SparkDatasetLoader(DatasetLoaderPort):
                 .option("inferSchema", True)
                 .csv(self.path)
             )
+        elif self.fmt in ("parquet", "orc"):
+            df = self.spark.read.format(self.fmt).load(self.path)
         else:
             raise ValueError(f"Unsupported format: {self.fmt}")
 
-        return SparkDataset(df)
\ No newline at end of file
+        # Filtres avant projection : Spark les pousse dans le scan
+        for column, op, value in self.filters:
+            df = df.filter(_to_condition(df, column, op, value))
+
+        if self.columns is not None:
+            df = df.select(*self.columns)
+
+        return SparkDataset(df)
+
+
+def _to_condition(df, column: str, op: str, value: Any):
+    if op not in _OPERATORS:
+        raise ValueError(f"Unsupported filter operator: {op}")
+    return _OPERATORS[op](df[column], value)
@@ -0,0 +1,145 @@
+from typing import Any, Iterable, Mapping, Sequence, Tuple
+
+import numpy as np
+
+from nba_longevity.application.bootstrap import app_logger
+from nba_longevity.domain.dataset.dataset import ColumnarDataset, Dataset
+from nba_longevity.domain.features.feature_graph import resolve_feature_space
+from nba_longevity.domain.preprocessing.preprocessing_rules import FILTER_COLUMN, TARGET_COLUMN
+from nba_longevity.infrastructure.dataset.dtype_plan import DtypePlan
+from nba_longevity.infrastructure.dataset.pandas_dataset import to_pandas
+from nba_longevity.infrastructure.feature_engineering.pandas_feature_engineering_adapter import (
+    compute_derived,
+)
+
+
+class FusedFeaturePlan:
+    """
+    Plan compilé : preprocessing + feature engineering + sélection en une passe.
+
+    Pour un feature space donné (résolu par le graphe de features du
+    Domain), le plan :
+    - ne lit que les colonnes brutes nécessaires
+    - caste, impute (médiane), filtre (minutes > 0)
+    - calcule les seules features dérivées nécessaires et projette
+      directement dans une matrice float32 pré-allouée
+      (n_lignes_conservées, n_features)
+
+    Les calculs suivent le DtypePlan de la chaîne
+    PandasPreprocessingAdapter → PandasFeatureEngineeringAdapter →
+    PandasFeatureSelectionAdapter (float64 par défaut, float32 et comptages
+    arrondis pour le plan compact) : la matrice produite est identique bit
+    à bit à celle obtenue par `to_feature_matrix` sur la sortie de la
+    chaîne avec le même plan. Un modèle est donc scoré avec le plan de son
+    entraînement (métadonnée `dtype_plan` de l'artefact).
+    """
+
+    def __init__(
+        self,
+        feature_space: Sequence[str],
+        medians: Mapping[str, float] | None = None,
+        dtype_plan: DtypePlan | None = None,
+    ):
+        self.feature_space = list(feature_space)
+        self._fixed_medians = dict(medians) if medians is not None else None
+        self.medians: dict[str, float] | None = self._fixed_medians
+        self.dtype_plan = dtype_plan or DtypePlan.wide()
+        # Type de calcul des colonnes numériques (float64 sans plan de types)
+        self.float_dtype = np.dtype(self.dtype_plan.load_dtypes.get(FILTER_COLUMN, "float64"))
+
+        # Colonnes brutes réellement nécessaires (ordre stable) et features
+        # dérivées à calculer (lève ValueError pour une feature inconnue)
+        self.resolution = resolve_feature_space(self.feature_space)
+        self.raw_columns = list(self.resolution.raw_columns)
+
+        app_logger.debug(
+            f"FusedFeaturePlan compilé | {len(self.feature_space)} features | "
+            f"colonnes brutes : {self.raw_columns}"
+        )
+
+    def execute(
+        self,
+        dataset: Dataset | Iterable[Mapping[str, Any]],
+        target_column: str | None = TARGET_COLUMN,
+    ) -> Tuple[np.ndarray, np.ndarray | None]:
+        """
+        Exécute le plan et retourne (X float32, y).
+
+        y vaut None si le dataset ne contient pas la cible (scoring).
+        """
+        X, y, _ = self.execute_with_mask(dataset, target_column)
+        return X, y
+
+    def execute_with_mask(
+        self,
+        dataset: Dataset | Iterable[Mapping[str, Any]],
+        target_column: str | None = TARGET_COLUMN,
+    ) -> Tuple[np.ndarray, np.ndarray | None, np.ndarray]:
+        """
+        Comme `execute`, avec en plus le masque booléen des lignes
+        conservées par le filtre (alignement d'identifiants en scoring).
+        """
+        columns = self._read_columns(dataset, target_column)
+
+        # 1. Cast + imputation (médiane sur toutes les lignes, avant filtre)
+        raw = {col: _to_float(columns[col], self.float_dtype) for col in self.raw_columns}
+        if self._fixed_medians is None:
+            self.medians = self.dtype_plan.imputation_values({
+                col: float(np.nanmedian(values)) if not np.isnan(values).all() else float("nan")
+                for col, values in raw.items()
+            })
+        fill_values = self.dtype_plan.imputation_values(self.medians)
+        for col, values in raw.items():
+            nan_mask = np.isnan(values)
+            if nan_mask.any():
+                values[nan_mask] = fill_values[col]
+            if col in self.dtype_plan.integer_columns:
+                # Comptages : entiers dans la chaîne (cast_clean arrondit)
+                np.round(values, out=values)
+
+        # 2. Filtre de sécurité (+ cible obligatoire si présente)
+        keep = raw[FILTER_COLUMN] > 0
+        y = None
+        if target_column is not None and target_column in columns:
+            y = np.asarray(columns[target_column]).astype(
+                self.dtype_plan.clean_dtypes.get(target_column, int)
+            )[keep]
+
+        # 3. Features → matrice pré-allouée
+        n_rows = int(keep.sum())
+        X = np.empty((n_rows, len(self.feature_space)), dtype=np.float32)
+        kept = {col: values[keep] for col, values in raw.items()}
+        for feature in self.resolution.derived:
+            kept[feature.name] = compute_derived(feature, kept)
+
+        for j, name in enumerate(self.feature_space):
+            X[:, j] = kept[name]
+
+        return X, y, keep
+
+    def _read_columns(
+        self,
+        dataset: Dataset | Iterable[Mapping[str, Any]],
+        target_column: str | None,
+    ) -> Mapping[str, Any]:
+        if isinstance(dataset, ColumnarDataset):
+            wanted = list(self.raw_columns)
+            if target_column is not None and target_column in dataset.columns:
+                wanted.append(target_column)
+            return dataset.to_columns(wanted)
+
+        df = to_pandas(dataset)
+        return {col: df[col].to_numpy() for col in df.columns}
+
+
+def _to_float(values: Any, dtype: np.dtype) -> np.ndarray:
+    """
+    Équivalent de `to_numeric(errors="coerce")` puis `dtype` (copie).
+    """
+    array = np.asarray(values)
+    if array.dtype.kind in "biuf":
+        return array.astype(dtype)
+
+    from pandas import to_numeric
+
+    return to_numeric(array, errors="coerce").astype(dtype)
@@ -1,10 +1,39 @@
-from pandas import DataFrame
+from functools import reduce
+from operator import add
+from typing import Any, Mapping, Sequence
+
 from nba_longevity.application.bootstrap import app_logger
 from nba_longevity.domain.dataset.dataset import Dataset
-from nba_longevity.infrastructure.dataset.pandas_dataset import PandasDataset
+from nba_longevity.domain.features.feature_graph import (
+    DERIVED_FEATURES,
+    RATIO,
+    SUM,
+    DerivedFeature,
+    resolve_feature_space,
+)
+from nba_longevity.infrastructure.dataset.pandas_dataset import PandasDataset, to_pandas
 from nba_longevity.domain.ports.feature_engineering_port import FeatureEngineeringPort
 
 
+EPS = 1e-6  # Sécurité divisions par zéro
+
+
+def compute_derived(feature: DerivedFeature, columns: Mapping[str, Any]) -> Any:
+    """
+    Valeur d'une feature dérivée à partir de ses entrées.
+
+    Opérateurs arithmétiques uniquement : valable pour des Series Pandas,
+    des tableaux NumPy ou des colonnes Spark (mêmes valeurs en double).
+    """
+    inputs = [columns[name] for name in feature.inputs]
+    if feature.operation == RATIO:
+        numerator, denominator = inputs
+        return numerator / (denominator + EPS)
+    if feature.operation == SUM:
+        return reduce(add, inputs)
+    raise ValueError(f"Opération non supportée : {feature.operation}")
+
+
 class PandasFeatureEngineeringAdapter(FeatureEngineeringPort):
     """
     Feature engineering métier NBA (backend Pandas).
@@ -13,40 +42,30 @@ class PandasFeatureEngineeringAdapter(FeatureEngineeringPort):
     - Transformer un Dataset abstrait en DataFrame Pandas
     - Créer des features métier interprétables
     - Retourner un Dataset enrichi
+
+    `feature_space` : seules les features dérivées nécessaires à cet
+    espace sont calculées (graphe de dépendances du Domain) ; toutes
+    si None.
     """
 
+    def __init__(self, feature_space: Sequence[str] | None = None):
+        self.resolution = resolve_feature_space(
+            feature_space if feature_space is not None else list(DERIVED_FEATURES)
+        )
+
     def add_features(self, dataset: Dataset) -> Dataset:
         app_logger.info("Démarrage du feature engineering (Pandas)")
 
         # Conversion Dataset -> DataFrame
-        df = DataFrame(list(dataset))
+        df = to_pandas(dataset)
         app_logger.debug(f"Dataset chargé avec {df.shape[0]} lignes et {df.shape[1]} colonnes")
 
-        eps = 1e-6  # Sécurité divisions par zéro
-
-        # =========================
-        # 1. Usage & efficacité
-        # =========================
-        app_logger.info("Création des features d'usage et d'efficacité")
-
-        df["PointsPerMinute"] = df["PointsPerGame"] / (df["MinutesPerGame"] + eps)
-        df["FieldGoalEfficiency"] = df["FieldGoalsMade"] / (df["FieldGoalsAttempted"] + eps)
-        df["ThreePointRate"] = df["ThreePointersAttempted"] / (df["FieldGoalsAttempted"] + eps)
-        df["FreeThrowRate"] = df["FreeThrowsAttempted"] / (df["MinutesPerGame"] + eps)
-
-        # =========================
-        # 2. Impact collectif
-        # =========================
-        app_logger.info("Création des features d'impact collectif")
-
-        df["AssistToTurnoverRatio"] = df["Assists"] / (df["Turnovers"] + eps)
-        df["ReboundRate"] = df["TotalRebounds"] / (df["MinutesPerGame"] + eps)
-        df["DefensiveImpact"] = df["Steals"] + df["Blocks"]
+        # Features dérivées, dans l'ordre des dépendances
+        for feature in self.resolution.derived:
+            df[feature.name] = compute_derived(feature, df)
 
         app_logger.debug(
-            "Features créées : PointsPerMinute, FieldGoalEfficiency, "
-            "ThreePointRate, FreeThrowRate, AssistToTurnoverRatio, "
-            "ReboundRate, DefensiveImpact"
+            f"Features créées : {', '.join(f.name for f in self.resolution.derived)}"
         )
 
         app_logger.info("Feature engineering terminé avec succès")
@@ -1,8 +1,7 @@
-from pandas import DataFrame
 from nba_longevity.domain.dataset.dataset import Dataset
 from nba_longevity.application.bootstrap import app_logger
 from nba_longevity.domain.ports.feature_selection_port import FeatureSelectionPort
-from nba_longevity.infrastructure.dataset.pandas_dataset import PandasDataset
+from nba_longevity.infrastructure.dataset.pandas_dataset import PandasDataset, to_pandas
 from nba_longevity.domain.features.feature_spaces import (
     FEATURE_SPACE_MINIMAL,
     FEATURE_SPACE_EXTENDED,
@@ -57,7 +56,7 @@ class PandasFeatureSelectionAdapter(FeatureSelectionPort):
         app_logger.info("🎯 Démarrage de la sélection des features")
 
         # Conversion Dataset -> DataFrame
-        df = DataFrame(list(dataset))
+        df = to_pandas(dataset)
         app_logger.debug(
             f"Dataset d’entrée : {df.shape[0]} lignes, {df.shape[1]} colonnes"
         )
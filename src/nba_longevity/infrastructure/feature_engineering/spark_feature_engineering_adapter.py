@@ -1,27 +1,60 @@
-from pyspark.sql.functions import col
+from typing import Sequence
 
+from pyspark.sql import functions as F
+
+from nba_longevity.application.bootstrap import app_logger
+from nba_longevity.domain.dataset.dataset import Dataset
+from nba_longevity.domain.features.feature_graph import DERIVED_FEATURES, resolve_feature_space
 from nba_longevity.domain.ports.feature_engineering_port import FeatureEngineeringPort
-from nba_longevity.domain.features.feature_contract import FEATURE_COLUMNS
 from nba_longevity.infrastructure.dataset.spark_dataset import SparkDataset
+from nba_longevity.infrastructure.feature_engineering.pandas_feature_engineering_adapter import (
+    compute_derived,
+)
 
 
 class SparkFeatureEngineeringAdapter(FeatureEngineeringPort):
     """
     Feature engineering distribué avec Spark.
 
-    Dataset → Dataset → Dataset
+    Mêmes features que PandasFeatureEngineeringAdapter (graphe de
+    features du Domain), calculées en double avec le même EPS : valeurs
+    identiques à celles du backend Pandas. Toutes les colonnes sont
+    ajoutées en une seule projection (un seul nœud dans le plan Spark).
+
+    `feature_space` : seules les features dérivées nécessaires sont
+    calculées ; toutes si None.
+
+    Dataset → Dataset (ajout uniquement, aucune sélection)
     """
 
-    def add_features(self, dataset: SparkDataset) -> SparkDataset:
+    def __init__(self, feature_space: Sequence[str] | None = None):
+        self.resolution = resolve_feature_space(
+            feature_space if feature_space is not None else list(DERIVED_FEATURES)
+        )
+
+    def add_features(self, dataset: Dataset) -> Dataset:
+        if not isinstance(dataset, SparkDataset):
+            raise TypeError(
+                f"SparkFeatureEngineeringAdapter expects a SparkDataset, got {type(dataset)}"
+            )
+
+        app_logger.info("Démarrage du feature engineering (Spark)")
+
         df = dataset._df
 
-        # 🔧 Feature engineering
-        df = df.withColumn(
-            "PTS_PER_MIN",
-            col("PTS") / col("MIN")
+        # Expressions composées dans l'ordre des dépendances : une feature
+        # dérivée d'une autre réutilise l'expression, sans colonne intermédiaire
+        expressions = {col: F.col(col) for col in df.columns}
+        for feature in self.resolution.derived:
+            expressions[feature.name] = compute_derived(feature, expressions)
+
+        derived = [feature.name for feature in self.resolution.derived]
+        existing = [c for c in df.columns if c not in derived]
+        df = df.select(
+            *[F.col(c) for c in existing],
+            *[expressions[name].alias(name) for name in derived],
         )
 
-        # 🔒 Sélection explicite
-        df = df.select(*FEATURE_COLUMNS)
+        app_logger.debug(f"Features créées : {', '.join(derived)}")
 
         return SparkDataset(df)
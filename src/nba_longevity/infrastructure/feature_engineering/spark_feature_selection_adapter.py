@@ -0,0 +1,42 @@
+from nba_longevity.application.bootstrap import app_logger
+from nba_longevity.domain.dataset.dataset import Dataset
+from nba_longevity.domain.ports.feature_selection_port import FeatureSelectionPort
+from nba_longevity.infrastructure.dataset.spark_dataset import SparkDataset
+from nba_longevity.domain.features.feature_spaces import (
+    FEATURE_SPACE_EXTENDED,
+    TARGET_COLUMN
+)
+
+
+class SparkFeatureSelectionAdapter(FeatureSelectionPort):
+    """
+    Implémentation Spark de la sélection des features ML
+    (même contrat que PandasFeatureSelectionAdapter : projection
+    feature space + cible, aucune valeur modifiée).
+    """
+
+    def __init__(self, feature_space: list[str] | None = None):
+        self.feature_space = feature_space or FEATURE_SPACE_EXTENDED
+
+        app_logger.info(
+            f"FeatureSelection (Spark) initialisé avec "
+            f"{len(self.feature_space)} features"
+        )
+
+    def select_features(self, dataset: Dataset) -> Dataset:
+        if not isinstance(dataset, SparkDataset):
+            raise TypeError(
+                f"SparkFeatureSelectionAdapter expects a SparkDataset, got {type(dataset)}"
+            )
+
+        df = dataset._df
+        selected_cols = list(self.feature_space) + [TARGET_COLUMN]
+
+        missing_cols = set(selected_cols) - set(df.columns)
+        if missing_cols:
+            app_logger.error(
+                f"Colonnes manquantes lors de la sélection : {missing_cols}"
+            )
+            raise ValueError(f"Colonnes manquantes : {missing_cols}")
+
+        return SparkDataset(df.select(*selected_cols))
@@ -0,0 +1,377 @@
+"""
+PLAYER FEATURE STORE
+====================
+
+Responsibilities
+----------------
+- Materialize every player's engineered features once (union of the
+  feature spaces) into a float32 matrix on disk
+- Index matrix rows by player id (ID_COLUMN) with an open-addressing
+  hash table, itself stored as flat arrays
+- Serve feature vectors by id in O(1), from read-only memory maps and
+  without pandas: every scoring process mapping the same directory
+  shares one copy in the OS page cache
+
+Layout
+------
+<store_dir> -> .<store name>.versions/<version>   (symbolic link)
+<version>/
+    manifest.json     columns, feature spaces, medians, source fingerprint
+    features.npy      float32 (n_players, n_columns)
+    index_keys.npy    uint64 (n_slots,)  64-bit hash of each id
+    index_rows.npy    int64 (n_slots,)   matrix row, -1 = empty slot
+    id_offsets.npy    int64 (n_players + 1,)  bounds of each id in ids.bin
+    ids.bin           concatenated utf-8 ids (hash collision check)
+
+Rules
+-----
+- Duplicate ids: the last row wins (append-only raw data → latest stats)
+- Rows dropped by the preprocessing safety filter are not materialized
+- Build is atomic: each build writes a new version directory, then
+  the `<store_dir>` symbolic link is swapped with a rename; a reader
+  sees either the old or the new version, never a missing store
+- Readers resolve the link once when opening: every file comes from
+  the same version even if a build swaps it meanwhile
+- The previous version is kept (readers that resolved it but have not
+  mapped it yet); older ones are deleted
+- Readers never write: arrays are opened with mmap_mode="r"
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import uuid
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Mapping, Sequence
+
+import numpy as np
+
+from nba_longevity.application.bootstrap import app_logger
+from nba_longevity.domain.dataset.dataset import ColumnarDataset, Dataset
+from nba_longevity.domain.features.feature_spaces import (
+    FEATURE_SPACE_EXTENDED,
+    FEATURE_SPACE_MINIMAL,
+)
+from nba_longevity.domain.ports.feature_store_port import PlayerFeatureStorePort
+from nba_longevity.domain.preprocessing.preprocessing_rules import ID_COLUMN
+
+if TYPE_CHECKING:
+    from nba_longevity.infrastructure.dataset.dtype_plan import DtypePlan
+
+
+FORMAT_VERSION = 1
+
+MANIFEST_FILE_NAME = "manifest.json"
+FEATURES_FILE_NAME = "features.npy"
+INDEX_KEYS_FILE_NAME = "index_keys.npy"
+INDEX_ROWS_FILE_NAME = "index_rows.npy"
+ID_OFFSETS_FILE_NAME = "id_offsets.npy"
+IDS_FILE_NAME = "ids.bin"
+
+# Versions conservées après une construction (courante + précédente)
+KEEP_VERSIONS = 2
+
+DEFAULT_FEATURE_SPACES: dict[str, list[str]] = {
+    "minimal": FEATURE_SPACE_MINIMAL,
+    "extended": FEATURE_SPACE_EXTENDED,
+}
+
+_EMPTY_SLOT = -1
+
+
+class PlayerFeatureStore(PlayerFeatureStorePort):
+    """
+    Lecture seule d'un feature store joueur mappé en mémoire.
+
+    Aucune donnée n'est copiée à l'ouverture : les pages sont chargées
+    par l'OS à la demande et partagées entre processus.
+    """
+
+    def __init__(self, store_dir: Path | str):
+        # Lien résolu une fois : tous les fichiers viennent de la même version
+        self.store_dir = Path(store_dir).resolve()
+        self.manifest: dict[str, Any] = json.loads(
+            (self.store_dir / MANIFEST_FILE_NAME).read_text()
+        )
+        if self.manifest.get("format_version") != FORMAT_VERSION:
+            raise ValueError(
+                f"Unsupported feature store format: {self.manifest.get('format_version')}"
+            )
+
+        self._features = np.load(self.store_dir / FEATURES_FILE_NAME, mmap_mode="r")
+        self._keys = np.load(self.store_dir / INDEX_KEYS_FILE_NAME, mmap_mode="r")
+        self._rows = np.load(self.store_dir / INDEX_ROWS_FILE_NAME, mmap_mode="r")
+        self._offsets = np.load(self.store_dir / ID_OFFSETS_FILE_NAME, mmap_mode="r")
+        self._ids = np.memmap(self.store_dir / IDS_FILE_NAME, dtype=np.uint8, mode="r")
+
+        self._columns: list[str] = list(self.manifest["feature_columns"])
+        self._slot_mask = len(self._keys) - 1
+        self._column_indices: dict[tuple[str, ...], np.ndarray] = {}
+
+        if self._features.shape != (self.manifest["n_players"], len(self._columns)):
+            raise ValueError(
+                f"Feature store {self.store_dir} corrupted: matrix shape "
+                f"{self._features.shape} does not match the manifest"
+            )
+
+        app_logger.info(
+            f"🗂️ Player feature store opened | players={len(self)} | "
+            f"columns={len(self._columns)} | path={self.store_dir}"
+        )
+
+    # ------------------------------------------------------------------
+    # Métadonnées
+    # ------------------------------------------------------------------
+    @property
+    def feature_columns(self) -> list[str]:
+        return list(self._columns)
+
+    @property
+    def feature_spaces(self) -> dict[str, list[str]]:
+        return {name: list(cols) for name, cols in self.manifest["feature_spaces"].items()}
+
+    def __len__(self) -> int:
+        return int(self.manifest["n_players"])
+
+    def __contains__(self, player_id: object) -> bool:
+        return isinstance(player_id, str) and self.row_of(player_id) is not None
+
+    # ------------------------------------------------------------------
+    # Accès
+    # ------------------------------------------------------------------
+    def row_of(self, player_id: str) -> int | None:
+        """
+        Ligne de la matrice d'un joueur (None si inconnu) : sondage
+        linéaire dans la table, identifiant vérifié octet par octet.
+        """
+        encoded = player_id.encode("utf-8")
+        key = _id_hash(encoded)
+        slot = key & self._slot_mask
+
+        while True:
+            row = int(self._rows[slot])
+            if row == _EMPTY_SLOT:
+                return None
+            if int(self._keys[slot]) == key:
+                start, end = int(self._offsets[row]), int(self._offsets[row + 1])
+                if self._ids[start:end].tobytes() == encoded:
+                    return row
+            slot = (slot + 1) & self._slot_mask
+
+    def column_indices(self, feature_columns: Sequence[str]) -> np.ndarray:
+        """
+        Positions de `feature_columns` dans la matrice stockée.
+        """
+        key = tuple(feature_columns)
+        indices = self._column_indices.get(key)
+        if indices is None:
+            missing = [col for col in key if col not in self._columns]
+            if missing:
+                raise ValueError(f"Features not materialized in the store: {missing}")
+            indices = np.array([self._columns.index(col) for col in key], dtype=np.intp)
+            self._column_indices[key] = indices
+        return indices
+
+    def get(
+        self,
+        player_id: str,
+        feature_columns: Sequence[str] | None = None,
+    ) -> np.ndarray | None:
+        """
+        Vecteur float32 d'un joueur (copie), None si inconnu.
+        """
+        row = self.row_of(player_id)
+        if row is None:
+            return None
+        if feature_columns is None:
+            return np.array(self._features[row])
+        return self._features[row, self.column_indices(feature_columns)]
+
+    def get_many(
+        self,
+        player_ids: Sequence[str],
+        feature_columns: Sequence[str],
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Matrice float32 (joueurs × feature_columns) et masque des joueurs
+        trouvés ; les lignes des joueurs inconnus valent NaN.
+        """
+        indices = self.column_indices(feature_columns)
+        rows = np.array(
+            [_EMPTY_SLOT if (row := self.row_of(pid)) is None else row for pid in player_ids],
+            dtype=np.int64,
+        )
+        found = rows != _EMPTY_SLOT
+
+        X = np.full((len(rows), len(indices)), np.nan, dtype=np.float32)
+        if found.any():
+            X[found] = self._features[np.ix_(rows[found], indices)]
+        return X, found
+
+
+# -------------------------------------------------------------------------
+# Construction
+# -------------------------------------------------------------------------
+def build_player_feature_store(
+    dataset: Dataset,
+    store_dir: Path | str,
+    feature_spaces: Mapping[str, Sequence[str]] | None = None,
+    medians: Mapping[str, float] | None = None,
+    source: Mapping[str, Any] | None = None,
+    dtype_plan: "DtypePlan | None" = None,
+) -> Path:
+    """
+    Calcule les features de tous les joueurs d'un dataset brut et publie
+    une nouvelle version du store sous `store_dir` (lien symbolique
+    basculé atomiquement).
+
+    `medians` : médianes d'imputation (ex. preprocessing_stats d'un modèle,
+    pour des vecteurs identiques à ceux du scoring) ; calculées sur le
+    dataset si None.
+    `dtype_plan` : DtypePlan des calculs (celui de l'entraînement du
+    modèle servi) ; float64 historique si None.
+    `source` : métadonnées libres de provenance, recopiées dans le manifest.
+    """
+    # Import paresseux : la lecture du store n'a besoin ni de pandas ni du plan
+    from nba_longevity.infrastructure.dataset.pandas_dataset import to_pandas
+    from nba_longevity.infrastructure.feature_engineering.fused_feature_plan import (
+        FusedFeaturePlan,
+    )
+
+    feature_spaces = {
+        name: list(cols) for name, cols in (feature_spaces or DEFAULT_FEATURE_SPACES).items()
+    }
+    feature_columns = list(dict.fromkeys(col for cols in feature_spaces.values() for col in cols))
+
+    plan = FusedFeaturePlan(feature_columns, medians=medians, dtype_plan=dtype_plan)
+    X, _, keep = plan.execute_with_mask(dataset, target_column=None)
+
+    if isinstance(dataset, ColumnarDataset):
+        raw_ids = dataset.to_columns([ID_COLUMN])[ID_COLUMN]
+    else:
+        raw_ids = to_pandas(dataset)[ID_COLUMN].to_numpy()
+    raw_ids = np.asarray(raw_ids)[keep]
+
+    # Doublons : la dernière ligne l'emporte, ordre de première apparition
+    last_row = {str(pid): i for i, pid in enumerate(raw_ids)}
+    if not last_row:
+        raise ValueError("No player to materialize in the feature store")
+    player_ids = list(last_row)
+    X = np.ascontiguousarray(X[np.fromiter(last_row.values(), dtype=np.int64)])
+
+    encoded = [pid.encode("utf-8") for pid in player_ids]
+    offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+    np.cumsum([len(e) for e in encoded], out=offsets[1:])
+    keys, rows = _build_index(encoded)
+
+    manifest = {
+        "format_version": FORMAT_VERSION,
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "id_column": ID_COLUMN,
+        "n_players": len(player_ids),
+        "duplicate_ids": int(len(raw_ids) - len(player_ids)),
+        "feature_columns": feature_columns,
+        "feature_spaces": feature_spaces,
+        "medians": {col: float(v) for col, v in plan.medians.items()},
+        "dtype_plan": plan.dtype_plan.name,
+        "index_slots": int(len(keys)),
+        "source": dict(source or {}),
+    }
+
+    store_dir = Path(store_dir)
+    versions_dir = _versions_dir(store_dir)
+    versions_dir.mkdir(parents=True, exist_ok=True)
+    version = f"{datetime.now(timezone.utc):%Y%m%dT%H%M%S%fZ}-{uuid.uuid4().hex[:8]}"
+
+    tmp_dir = Path(tempfile.mkdtemp(dir=versions_dir, prefix=".tmp-"))
+    try:
+        # mkdtemp crée le répertoire en 0700 : lisible par les autres processus de scoring
+        tmp_dir.chmod(0o755)
+        np.save(tmp_dir / FEATURES_FILE_NAME, X)
+        np.save(tmp_dir / INDEX_KEYS_FILE_NAME, keys)
+        np.save(tmp_dir / INDEX_ROWS_FILE_NAME, rows)
+        np.save(tmp_dir / ID_OFFSETS_FILE_NAME, offsets)
+        (tmp_dir / IDS_FILE_NAME).write_bytes(b"".join(encoded))
+        (tmp_dir / MANIFEST_FILE_NAME).write_text(json.dumps(manifest, indent=2))
+        os.replace(tmp_dir, versions_dir / version)
+    except OSError:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        raise
+
+    _publish(store_dir, versions_dir / version)
+    _prune_versions(versions_dir, keep=KEEP_VERSIONS)
+
+    if manifest["duplicate_ids"]:
+        app_logger.warning(
+            f"{manifest['duplicate_ids']} duplicate {ID_COLUMN} rows: last occurrence kept"
+        )
+    app_logger.info(
+        f"🗂️ Player feature store built | players={len(player_ids)} | "
+        f"columns={len(feature_columns)} | size={X.nbytes} bytes | path={store_dir}"
+    )
+
+    return store_dir
+
+
+def _versions_dir(store_dir: Path) -> Path:
+    return store_dir.parent / f".{store_dir.name}.versions"
+
+
+def _publish(store_dir: Path, version_dir: Path) -> None:
+    """
+    Bascule atomique du lien `store_dir` vers `version_dir` (lien
+    temporaire puis rename, qui remplace l'ancien lien en une opération).
+    """
+    if store_dir.exists() and not store_dir.is_symlink():
+        # Ancien format (répertoire réel) : migré une fois en version
+        legacy = _versions_dir(store_dir) / f"legacy-{uuid.uuid4().hex[:8]}"
+        os.replace(store_dir, legacy)
+
+    tmp_link = store_dir.parent / f".tmp-link-{store_dir.name}-{uuid.uuid4().hex[:8]}"
+    os.symlink(os.path.relpath(version_dir, store_dir.parent), tmp_link)
+    try:
+        os.replace(tmp_link, store_dir)
+    except OSError:
+        tmp_link.unlink(missing_ok=True)
+        raise
+
+
+def _prune_versions(versions_dir: Path, keep: int) -> None:
+    """
+    Supprime les versions les plus anciennes au-delà des `keep` dernières.
+    Les lecteurs qui les ont déjà mappées ne sont pas affectés.
+    """
+    versions = sorted(
+        (path for path in versions_dir.iterdir() if path.is_dir() and not path.name.startswith(".")),
+        key=lambda path: path.stat().st_mtime,
+    )
+    for path in versions[:-keep]:
+        shutil.rmtree(path, ignore_errors=True)
+
+
+def _id_hash(encoded_id: bytes) -> int:
+    return int.from_bytes(hashlib.blake2b(encoded_id, digest_size=8).digest(), "little")
+
+
+def _build_index(encoded_ids: Sequence[bytes]) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Table à adressage ouvert (sondage linéaire), taux de remplissage <= 1/2.
+    """
+    n_slots = 1 << max(3, (2 * len(encoded_ids) - 1).bit_length())
+    mask = n_slots - 1
+
+    keys = np.zeros(n_slots, dtype=np.uint64)
+    rows = np.full(n_slots, _EMPTY_SLOT, dtype=np.int64)
+
+    for row, encoded in enumerate(encoded_ids):
+        key = _id_hash(encoded)
+        slot = key & mask
+        while rows[slot] != _EMPTY_SLOT:
+            slot = (slot + 1) & mask
+        keys[slot] = key
+        rows[slot] = row
+
+    return keys, rows
@@ -0,0 +1,171 @@
+from typing import Any, Callable, Iterable, Mapping, Sequence
+
+import numpy as np
+
+from nba_longevity.domain.dataset.dataset import ColumnarDataset
+
+
+DEFAULT_CHUNK_SIZE = 65_536
+
+# Colonne de probabilité des sorties de scoring batch
+DEFAULT_OUTPUT_COLUMN = "proba_5yrs"
+
+
+class BatchPredictionEngine:
+    """
+    Moteur de prédiction vectorisé, indépendant du modèle.
+
+    Responsabilités :
+    - figer une fois pour toutes l'ordre des colonnes du feature space
+    - convertir les entrées (lignes, colonnes, matrice) en float32 contigu
+    - scorer par blocs de taille fixe (mémoire bornée)
+    - offrir un chemin dédié pour un seul joueur
+
+    Le modèle est injecté sous forme d'une fonction
+    `matrice float32 (n, k) → probabilités (n,)`.
+
+    ⚠️ `predict_columns` n'est pas thread-safe (buffer de blocs partagé) :
+    une instance par thread de scoring.
+    """
+
+    def __init__(
+        self,
+        predict_fn: Callable[[np.ndarray], np.ndarray],
+        feature_columns: Sequence[str],
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ):
+        if not feature_columns:
+            raise ValueError("feature_columns ne peut pas être vide")
+        if chunk_size <= 0:
+            raise ValueError(f"chunk_size doit être > 0 : {chunk_size}")
+
+        self._predict_fn = predict_fn
+        self.feature_columns = list(feature_columns)
+        self.chunk_size = chunk_size
+
+        # Buffer de blocs réutilisé d'un appel à l'autre
+        self._chunk_buffer: np.ndarray | None = None
+
+    def check_feature_columns(self, feature_columns: Sequence[str] | None) -> None:
+        """
+        Vérifie que l'appelant demande bien l'espace de features compilé.
+        """
+        if feature_columns is not None and list(feature_columns) != self.feature_columns:
+            raise ValueError(
+                "Feature space incompatible avec le modèle : "
+                f"attendu={self.feature_columns}, reçu={list(feature_columns)}"
+            )
+
+    # ------------------------------------------------------------------
+    # Entrées
+    # ------------------------------------------------------------------
+    def predict_matrix(self, X: np.ndarray) -> np.ndarray:
+        """
+        Score une matrice (n, k) déjà ordonnée selon `feature_columns`.
+        """
+        X = np.ascontiguousarray(X, dtype=np.float32)
+        if X.ndim != 2 or X.shape[1] != len(self.feature_columns):
+            raise ValueError(
+                f"Matrice de forme {X.shape} incompatible avec "
+                f"{len(self.feature_columns)} features"
+            )
+
+        n_rows = X.shape[0]
+        if n_rows <= self.chunk_size:
+            return np.asarray(self._predict_fn(X), dtype=np.float32)
+
+        proba = np.empty(n_rows, dtype=np.float32)
+        for start in range(0, n_rows, self.chunk_size):
+            stop = min(start + self.chunk_size, n_rows)
+            proba[start:stop] = self._predict_fn(X[start:stop])
+        return proba
+
+    def predict_columns(self, columns: Mapping[str, Any]) -> np.ndarray:
+        """
+        Score des colonnes (NumPy / Arrow) sans matérialiser la matrice
+        complète : chaque bloc est recopié dans un buffer réutilisé.
+        """
+        missing = [col for col in self.feature_columns if col not in columns]
+        if missing:
+            raise ValueError(f"Colonnes manquantes : {missing}")
+
+        arrays = [np.asarray(columns[col]) for col in self.feature_columns]
+        n_rows = len(arrays[0])
+        proba = np.empty(n_rows, dtype=np.float32)
+
+        buffer = self._get_chunk_buffer(min(n_rows, self.chunk_size))
+        for start in range(0, n_rows, self.chunk_size):
+            stop = min(start + self.chunk_size, n_rows)
+            block = buffer[: stop - start]
+            for j, values in enumerate(arrays):
+                block[:, j] = values[start:stop]
+            proba[start:stop] = self._predict_fn(block)
+        return proba
+
+    def predict_rows(self, rows: Iterable[Mapping[str, Any]]) -> np.ndarray:
+        """
+        Score un Dataset ou une séquence de lignes.
+        """
+        if isinstance(rows, ColumnarDataset):
+            return self.predict_columns(rows.to_columns(self.feature_columns))
+
+        # pandas uniquement pour les lignes non colonnaires (import différé)
+        from nba_longevity.infrastructure.dataset.pandas_dataset import to_pandas
+
+        df = to_pandas(rows)
+        if df.empty:
+            return np.empty(0, dtype=np.float32)
+        return self.predict_columns(
+            {col: df[col].to_numpy(copy=False) for col in self.feature_columns if col in df}
+        )
+
+    def predict_one(self, row: Mapping[str, Any]) -> float:
+        """
+        Chemin rapide pour un seul joueur : pas de DataFrame, pas de
+        conversion de lignes, un seul vecteur (1, k) alloué.
+        """
+        x = np.fromiter(
+            (row[col] for col in self.feature_columns),
+            dtype=np.float32,
+            count=len(self.feature_columns),
+        ).reshape(1, -1)
+        return float(self._predict_fn(x)[0])
+
+    # ------------------------------------------------------------------
+    # Interne
+    # ------------------------------------------------------------------
+    def _get_chunk_buffer(self, n_rows: int) -> np.ndarray:
+        if self._chunk_buffer is None or self._chunk_buffer.shape[0] < n_rows:
+            self._chunk_buffer = np.empty(
+                (n_rows, len(self.feature_columns)), dtype=np.float32
+            )
+        return self._chunk_buffer
+
+
+def rows_to_matrix(
+    rows: Iterable[Mapping[str, Any]],
+    feature_columns: Sequence[str],
+) -> np.ndarray:
+    """
+    Matrice float32 (n, k) ordonnée selon `feature_columns`, depuis un
+    Dataset colonnaire ou une séquence de lignes.
+    """
+    if isinstance(rows, ColumnarDataset):
+        columns = rows.to_columns(feature_columns)
+    else:
+        from nba_longevity.infrastructure.dataset.pandas_dataset import to_pandas
+
+        df = to_pandas(rows)
+        if df.empty:
+            return np.empty((0, len(feature_columns)), dtype=np.float32)
+        columns = {col: df[col].to_numpy(copy=False) for col in feature_columns if col in df}
+
+    missing = [col for col in feature_columns if col not in columns]
+    if missing:
+        raise ValueError(f"Colonnes manquantes : {missing}")
+
+    n_rows = len(columns[feature_columns[0]])
+    X = np.empty((n_rows, len(feature_columns)), dtype=np.float32)
+    for j, col in enumerate(feature_columns):
+        X[:, j] = columns[col]
+    return X
@@ -1,27 +1,69 @@
-from typing import Sequence
-from pandas import DataFrame
-from catboost import CatBoostClassifier
+from __future__ import annotations
+
+import numpy as np
+from typing import TYPE_CHECKING, Any, Mapping, Sequence
 from nba_longevity.domain.ports.predictor_port import PredictorPort
-# Feature spaces (Domain)
-from nba_longevity.domain.features.feature_spaces import (
-    FEATURE_SPACE_MINIMAL,
-    FEATURE_SPACE_EXTENDED,
+from nba_longevity.infrastructure.inference.batch_prediction_engine import (
+    BatchPredictionEngine,
+    DEFAULT_CHUNK_SIZE,
 )
 
+if TYPE_CHECKING:
+    from catboost import CatBoostClassifier
 
 
 class CatBoostPredictor(PredictorPort):
-    def __init__(self, model: CatBoostClassifier):
+    """
+    Prédicteur CatBoost conforme au PredictorPort.
+
+    - ordre des colonnes figé à la construction (noms du modèle par défaut)
+    - matrices float32 passées directement au modèle (pas de DataFrame)
+    - scoring par blocs + chemin dédié pour un seul joueur
+    """
+
+    def __init__(
+        self,
+        model: CatBoostClassifier,
+        feature_columns: Sequence[str] | None = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        n_threads: int | None = None,
+    ):
         self.model = model
+        self.thread_count = n_threads if n_threads is not None else -1
+        self.engine = BatchPredictionEngine(
+            predict_fn=self._predict_matrix,
+            feature_columns=feature_columns or model.feature_names_,
+            chunk_size=chunk_size,
+        )
+
+    @property
+    def feature_columns(self) -> list[str]:
+        return self.engine.feature_columns
+
+    def predict_proba(
+        self,
+        rows: Sequence[Mapping[str, object]],
+        feature_columns: Sequence[str] | None = None,
+    ) -> Sequence[float]:
+        self.engine.check_feature_columns(feature_columns)
+        return self.engine.predict_rows(rows)
+
+    def predict_matrix(self, X: np.ndarray) -> np.ndarray:
+        return self.engine.predict_matrix(X)
 
-    def predict_proba(self, rows, feature_space: str = "minimal")->Sequence[float]:
-        df = DataFrame(list(rows))
+    def predict_one(self, row: Mapping[str, Any]) -> float:
+        return self.engine.predict_one(row)
 
-        # Choix de l'espace de features
-        if feature_space == "extended":
-            selected_features = FEATURE_SPACE_EXTENDED
-        else:
-            selected_features = FEATURE_SPACE_MINIMAL
+    def _predict_matrix(self, X: np.ndarray) -> np.ndarray:
+        # CatBoost n'expose pas de prédiction sans Pool côté Python :
+        # une matrice float32 contiguë est le chemin de conversion le plus court.
+        writeable = X.flags.writeable
+        proba = self.model.predict(
+            X, prediction_type="Probability", thread_count=self.thread_count
+        )[:, 1]
 
-        X = df[selected_features]
-        return self.model.predict_proba(X)[:, 1]
+        # CatBoost verrouille le tableau reçu en lecture seule :
+        # on le libère pour que le buffer de blocs reste réutilisable.
+        if writeable and not X.flags.writeable:
+            X.setflags(write=True)
+        return proba
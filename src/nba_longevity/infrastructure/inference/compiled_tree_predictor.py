@@ -0,0 +1,76 @@
+from typing import Any, Mapping, Sequence
+
+import numpy as np
+
+from nba_longevity.domain.ports.predictor_port import PredictorPort
+from nba_longevity.infrastructure.inference.batch_prediction_engine import (
+    BatchPredictionEngine,
+    DEFAULT_CHUNK_SIZE,
+)
+from nba_longevity.infrastructure.inference.compiled_trees import (
+    CompiledTreeEnsemble,
+    predict_proba,
+)
+
+
+# Lignes évaluées à la fois : l'évaluation matérialise des tableaux
+# (arbres × lignes) par niveau, qui doivent rester en cache
+DEFAULT_BLOCK_ROWS = 1_024
+
+
+class CompiledTreePredictor(PredictorPort):
+    """
+    Prédicteur NumPy pur sur un ensemble d'arbres compilé
+    (export XGBoost / CatBoost), conforme au PredictorPort.
+
+    - aucune librairie de modèle importée : démarrage et mémoire d'un
+      processus de scoring réduits à NumPy + les tableaux de l'ensemble
+    - chaque bloc du moteur est évalué par sous-blocs de `block_rows`
+    - mono-thread (NumPy) : paralléliser par processus
+    """
+
+    def __init__(
+        self,
+        ensemble: CompiledTreeEnsemble,
+        feature_columns: Sequence[str],
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        block_rows: int = DEFAULT_BLOCK_ROWS,
+    ):
+        if block_rows <= 0:
+            raise ValueError(f"block_rows doit être > 0 : {block_rows}")
+
+        self.ensemble = ensemble
+        self.block_rows = block_rows
+        self.engine = BatchPredictionEngine(
+            predict_fn=self._predict_matrix,
+            feature_columns=feature_columns,
+            chunk_size=chunk_size,
+        )
+
+    @property
+    def feature_columns(self) -> list[str]:
+        return self.engine.feature_columns
+
+    def predict_proba(
+        self,
+        rows: Sequence[Mapping[str, object]],
+        feature_columns: Sequence[str] | None = None,
+    ) -> Sequence[float]:
+        self.engine.check_feature_columns(feature_columns)
+        return self.engine.predict_rows(rows)
+
+    def predict_matrix(self, X: np.ndarray) -> np.ndarray:
+        return self.engine.predict_matrix(X)
+
+    def predict_one(self, row: Mapping[str, Any]) -> float:
+        return self.engine.predict_one(row)
+
+    def _predict_matrix(self, X: np.ndarray) -> np.ndarray:
+        if X.shape[0] <= self.block_rows:
+            return predict_proba(self.ensemble, X)
+
+        proba = np.empty(X.shape[0], dtype=np.float32)
+        for start in range(0, X.shape[0], self.block_rows):
+            stop = min(start + self.block_rows, X.shape[0])
+            proba[start:stop] = predict_proba(self.ensemble, X[start:stop])
+        return proba
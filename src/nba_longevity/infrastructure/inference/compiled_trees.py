@@ -0,0 +1,358 @@
+"""
+COMPILED TREE ENSEMBLES
+=======================
+
+Responsibilities
+----------------
+- Export a trained XGBoost booster or CatBoost model into flat NumPy
+  arrays (split feature, threshold, missing-value direction, leaf
+  values; XGBoost trees in heap layout, child offsets 2i+1 / 2i+2)
+- Evaluate whole batches level by level with vectorized NumPy, all
+  trees at once, without importing the model library
+- Save / load the arrays as a single `.npz` file
+
+Supported models
+----------------
+- XGBoost: `binary:logistic`, numerical splits (trees up to
+  `best_iteration` after early stopping, as the native predictor)
+- CatBoost: `Logloss` oblivious trees on float features
+
+Rules
+-----
+- Export reads the model through its JSON dump: no private API
+- Evaluation needs NumPy only
+"""
+
+from __future__ import annotations
+
+import json
+import tempfile
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, BinaryIO, ClassVar, Final
+
+import numpy as np
+
+
+NODE_TREES: Final[str] = "node_trees"
+OBLIVIOUS_TREES: Final[str] = "oblivious_trees"
+
+# Profondeur maximale des arbres XGBoost (tas de 2^depth feuilles par arbre)
+MAX_NODE_TREE_DEPTH: Final[int] = 12
+
+
+def _sigmoid(margin: np.ndarray) -> np.ndarray:
+    return 1.0 / (1.0 + np.exp(-margin))
+
+
+# -------------------------------------------------------------------------
+# Arbres binaires complets (XGBoost)
+# -------------------------------------------------------------------------
+@dataclass(frozen=True)
+class NodeTreeEnsemble:
+    """
+    Forêt d'arbres binaires, chaque arbre complété en arbre complet de
+    profondeur `depth` et rangé en tas : fils du nœud i = 2i + 1 (gauche)
+    et 2i + 2 (droit), feuille j = nœud 2^depth - 1 + j.
+
+    - à gauche si x < threshold ; valeur manquante → `default_left`
+    - une feuille moins profonde que `depth` est recopiée dans toutes
+      les feuilles de son sous-arbre (nœuds de complétion : threshold
+      = +inf, toujours à gauche)
+    - évaluation niveau par niveau, tous les arbres et toutes les lignes
+      à la fois : `depth` itérations vectorisées
+    """
+
+    feature: np.ndarray       # (n_trees, 2^depth - 1) int32
+    threshold: np.ndarray     # (n_trees, 2^depth - 1) float32
+    default_left: np.ndarray  # (n_trees, 2^depth - 1) bool
+    leaf_values: np.ndarray   # (n_trees, 2^depth) float64
+    base_margin: float
+
+    kind: ClassVar[str] = NODE_TREES
+
+    @property
+    def n_trees(self) -> int:
+        return self.leaf_values.shape[0]
+
+    @property
+    def depth(self) -> int:
+        return self.leaf_values.shape[1].bit_length() - 1
+
+    def predict_margin(self, X: np.ndarray) -> np.ndarray:
+        XT = _transpose(X)
+        n_rows = XT.shape[1]
+        n_internal = self.feature.shape[1]
+
+        if self.depth == 0:
+            return np.full(n_rows, self.leaf_values[:, 0].sum() + self.base_margin)
+
+        has_missing = bool(np.isnan(XT).any())
+
+        # Niveau 0 : une racine par arbre → copie de lignes de XT
+        x = XT[self.feature[:, 0]]
+        go_left = x < self.threshold[:, 0, None]
+        if has_missing:
+            go_left = np.where(np.isnan(x), self.default_left[:, 0, None], go_left)
+        node = np.where(go_left, 1, 2).astype(np.int32)
+
+        # Niveaux suivants : nœud courant de chaque (arbre, ligne)
+        tree_offset = (np.arange(self.n_trees, dtype=np.int32) * n_internal)[:, None]
+        columns = np.arange(n_rows, dtype=np.int32)[None, :]
+        feature, threshold = self.feature.ravel(), self.threshold.ravel()
+        values = XT.ravel()
+
+        for _ in range(1, self.depth):
+            flat = tree_offset + node
+            x = values.take(feature.take(flat) * n_rows + columns)
+            go_left = x < threshold.take(flat)
+            if has_missing:
+                go_left = np.where(np.isnan(x), self.default_left.ravel().take(flat), go_left)
+            node = 2 * node + 2 - go_left
+
+        leaf = node - n_internal + (np.arange(self.n_trees, dtype=np.int32) * (n_internal + 1))[:, None]
+        return self.leaf_values.ravel().take(leaf).sum(axis=0) + self.base_margin
+
+    def arrays(self) -> dict[str, np.ndarray]:
+        return {
+            "feature": self.feature,
+            "threshold": self.threshold,
+            "default_left": self.default_left,
+            "leaf_values": self.leaf_values,
+            "base_margin": np.array(self.base_margin),
+        }
+
+
+# -------------------------------------------------------------------------
+# Arbres symétriques (CatBoost)
+# -------------------------------------------------------------------------
+@dataclass(frozen=True)
+class ObliviousTreeEnsemble:
+    """
+    Arbres symétriques : une seule condition par niveau et par arbre.
+
+    L'indice de feuille est construit bit à bit, niveau par niveau :
+    bit d = (x[split_feature[t, d]] > border[t, d]). Les arbres moins
+    profonds sont complétés par des niveaux neutres (border = +inf).
+    """
+
+    split_feature: np.ndarray   # (n_trees, depth) int32
+    border: np.ndarray          # (n_trees, depth) float32
+    leaf_values: np.ndarray     # (n_trees, 2^depth) float64
+    nan_goes_right: np.ndarray  # (n_trees, depth) bool
+    scale: float
+    bias: float
+
+    kind: ClassVar[str] = OBLIVIOUS_TREES
+
+    @property
+    def n_trees(self) -> int:
+        return self.split_feature.shape[0]
+
+    def predict_margin(self, X: np.ndarray) -> np.ndarray:
+        XT = _transpose(X)
+        has_missing = bool(np.isnan(XT).any())
+
+        # Chaque niveau : une condition par arbre → copie de lignes de XT
+        leaf = np.zeros((self.n_trees, XT.shape[1]), dtype=np.int32)
+        for depth in range(self.split_feature.shape[1]):
+            x = XT[self.split_feature[:, depth]]
+            bit = x > self.border[:, depth, None]
+            if has_missing:
+                bit = np.where(np.isnan(x), self.nan_goes_right[:, depth, None], bit)
+            leaf |= bit.astype(np.int32) << depth
+
+        leaf += (np.arange(self.n_trees, dtype=np.int32) * self.leaf_values.shape[1])[:, None]
+        margin = self.leaf_values.ravel().take(leaf).sum(axis=0)
+        return margin * self.scale + self.bias
+
+    def arrays(self) -> dict[str, np.ndarray]:
+        return {
+            "split_feature": self.split_feature,
+            "border": self.border,
+            "leaf_values": self.leaf_values,
+            "nan_goes_right": self.nan_goes_right,
+            "scale": np.array(self.scale),
+            "bias": np.array(self.bias),
+        }
+
+
+def _transpose(X: np.ndarray) -> np.ndarray:
+    # Features × lignes : chaque feature est contiguë, les accès d'un
+    # même arbre à une même feature deviennent des copies de lignes
+    return np.ascontiguousarray(np.asarray(X, dtype=np.float32).T)
+
+
+CompiledTreeEnsemble = NodeTreeEnsemble | ObliviousTreeEnsemble
+
+
+def predict_proba(ensemble: CompiledTreeEnsemble, X: np.ndarray) -> np.ndarray:
+    """
+    Probabilité de la classe positive (sigmoïde de la marge).
+    """
+    return _sigmoid(ensemble.predict_margin(X)).astype(np.float32)
+
+
+# -------------------------------------------------------------------------
+# Export
+# -------------------------------------------------------------------------
+def compile_model(model: Any, model_type: str) -> CompiledTreeEnsemble:
+    """
+    Convertit un modèle entraîné en tableaux NumPy.
+    ValueError si le modèle utilise une fonctionnalité non supportée.
+    """
+    if model_type == "xgboost":
+        return compile_xgboost(json.loads(bytes(model.save_raw(raw_format="json"))))
+
+    if model_type == "catboost":
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "model.json"
+            model.save_model(str(path), format="json")
+            return compile_catboost(json.loads(path.read_text()))
+
+    raise ValueError(f"Unknown model_type: {model_type}")
+
+
+def compile_xgboost(dump: dict[str, Any]) -> NodeTreeEnsemble:
+    learner = dump["learner"]
+    objective = learner["objective"]["name"]
+    if objective != "binary:logistic":
+        raise ValueError(f"Unsupported XGBoost objective: {objective}")
+
+    booster = learner["gradient_booster"]
+    if booster.get("name", "gbtree") != "gbtree":
+        raise ValueError(f"Unsupported XGBoost booster: {booster.get('name')}")
+
+    trees = booster["model"]["trees"]
+    # Early stopping : arbres au-delà de best_iteration ignorés (comme le prédicteur natif)
+    best_iteration = learner.get("attributes", {}).get("best_iteration")
+    if best_iteration is not None:
+        trees_per_round = int(booster["model"]["gbtree_model_param"].get("num_parallel_tree", 1))
+        trees = trees[: (int(best_iteration) + 1) * trees_per_round]
+    if any(any(tree["split_type"]) for tree in trees):
+        raise ValueError("Categorical XGBoost splits are not supported")
+
+    # base_score : probabilité (scalaire ou "[x]" selon la version)
+    base_score = float(str(learner["learner_model_param"]["base_score"]).strip("[]"))
+    base_margin = float(np.log(base_score / (1.0 - base_score)))
+
+    depth = max(_tree_depth(tree) for tree in trees) if trees else 0
+    if depth > MAX_NODE_TREE_DEPTH:
+        raise ValueError(f"Tree depth {depth} > {MAX_NODE_TREE_DEPTH} is not supported")
+
+    n_internal = 2 ** depth - 1
+    feature = np.zeros((len(trees), n_internal), dtype=np.int32)
+    threshold = np.full((len(trees), n_internal), np.inf, dtype=np.float32)
+    default_left = np.ones((len(trees), n_internal), dtype=bool)
+    leaf_values = np.zeros((len(trees), n_internal + 1), dtype=np.float64)
+
+    for t, tree in enumerate(trees):
+        lefts, rights = tree["left_children"], tree["right_children"]
+        # Pour une feuille, split_conditions porte la valeur de la feuille
+        conditions = tree["split_conditions"]
+
+        # (nœud XGBoost, position dans le tas, niveau)
+        stack = [(0, 0, 0)]
+        while stack:
+            node, position, level = stack.pop()
+            if lefts[node] == -1:
+                # Feuille : recopiée dans toutes les feuilles de son sous-arbre
+                span = 2 ** (depth - level)
+                first = (position + 1) * span - 1 - n_internal
+                leaf_values[t, first: first + span] = conditions[node]
+                continue
+
+            feature[t, position] = tree["split_indices"][node]
+            threshold[t, position] = conditions[node]
+            default_left[t, position] = bool(tree["default_left"][node])
+            stack.append((lefts[node], 2 * position + 1, level + 1))
+            stack.append((rights[node], 2 * position + 2, level + 1))
+
+    return NodeTreeEnsemble(
+        feature=feature,
+        threshold=threshold,
+        default_left=default_left,
+        leaf_values=leaf_values,
+        base_margin=base_margin,
+    )
+
+
+def _tree_depth(tree: dict[str, Any]) -> int:
+    lefts, rights = tree["left_children"], tree["right_children"]
+    depth, level = 0, [0]
+    while True:
+        level = [child for n in level if lefts[n] != -1 for child in (lefts[n], rights[n])]
+        if not level:
+            return depth
+        depth += 1
+
+
+def compile_catboost(dump: dict[str, Any]) -> ObliviousTreeEnsemble:
+    if "oblivious_trees" not in dump:
+        raise ValueError("Only oblivious (symmetric) CatBoost trees are supported")
+
+    trees = dump["oblivious_trees"]
+    float_features = dump["features_info"].get("float_features", [])
+    if dump["features_info"].get("categorical_features"):
+        raise ValueError("Categorical CatBoost features are not supported")
+
+    # NaN : "AsTrue" → condition vraie ; "AsIs" / "AsFalse" → fausse
+    nan_true = {
+        f["flat_feature_index"]: f.get("nan_value_treatment") == "AsTrue"
+        for f in float_features
+    }
+
+    depth = max((len(tree["splits"]) for tree in trees), default=0)
+    split_feature = np.zeros((len(trees), depth), dtype=np.int32)
+    border = np.full((len(trees), depth), np.inf, dtype=np.float32)
+    nan_goes_right = np.zeros((len(trees), depth), dtype=bool)
+    leaf_values = np.zeros((len(trees), 2 ** depth), dtype=np.float64)
+
+    for t, tree in enumerate(trees):
+        for d, split in enumerate(tree["splits"]):
+            if split["split_type"] != "FloatFeature":
+                raise ValueError(f"Unsupported CatBoost split: {split['split_type']}")
+            split_feature[t, d] = split["float_feature_index"]
+            border[t, d] = split["border"]
+            nan_goes_right[t, d] = nan_true.get(split["float_feature_index"], False)
+
+        values = tree["leaf_values"]
+        if len(values) != 2 ** len(tree["splits"]):
+            raise ValueError("Multi-dimensional CatBoost leaves are not supported")
+        leaf_values[t, : len(values)] = values
+
+    scale, biases = dump.get("scale_and_bias", [1.0, [0.0]])
+    bias = biases[0] if isinstance(biases, list) else biases
+
+    return ObliviousTreeEnsemble(
+        split_feature=split_feature,
+        border=border,
+        leaf_values=leaf_values,
+        nan_goes_right=nan_goes_right,
+        scale=float(scale),
+        bias=float(bias),
+    )
+
+
+# -------------------------------------------------------------------------
+# Persistance
+# -------------------------------------------------------------------------
+def save_compiled(ensemble: CompiledTreeEnsemble, file: str | Path | BinaryIO) -> None:
+    np.savez(file, kind=np.array(ensemble.kind), **ensemble.arrays())
+
+
+def load_compiled(file: str | Path | BinaryIO) -> CompiledTreeEnsemble:
+    with np.load(file, allow_pickle=False) as data:
+        arrays = {key: data[key] for key in data.files}
+
+    kind = str(arrays.pop("kind"))
+    if kind == NODE_TREES:
+        return NodeTreeEnsemble(base_margin=float(arrays.pop("base_margin")), **arrays)
+    if kind == OBLIVIOUS_TREES:
+        return ObliviousTreeEnsemble(
+            scale=float(arrays.pop("scale")),
+            bias=float(arrays.pop("bias")),
+            **arrays,
+        )
+
+    raise ValueError(f"Unknown compiled tree format: {kind}")
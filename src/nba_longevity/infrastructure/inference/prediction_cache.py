@@ -0,0 +1,238 @@
+import hashlib
+import sys
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Mapping, Sequence
+
+import numpy as np
+
+from nba_longevity.application.bootstrap import app_logger
+from nba_longevity.domain.ports.predictor_port import PredictorPort
+from nba_longevity.infrastructure.inference.batch_prediction_engine import rows_to_matrix
+
+
+_DIGEST_SIZE = 16
+
+# Coût mémoire estimé d'une entrée : clé (bytes) + valeur (tuple de deux
+# floats) + nœud de l'OrderedDict (slot de table + liens LRU)
+_ENTRY_BYTES = (
+    sys.getsizeof(bytes(_DIGEST_SIZE))
+    + sys.getsizeof((0.0, 0.0))
+    + 2 * sys.getsizeof(0.0)
+    + 104
+)
+
+
+class PredictionCache:
+    """
+    Cache LRU de probabilités, borné en mémoire, avec durée de vie.
+
+    - clé : empreinte de (espace de noms du modèle, vecteur de features
+      projeté en float32) ; l'espace de noms (hash du modèle + feature
+      space, `cache_namespace`) appartient à chaque CachingPredictor :
+      un cache partagé ne sert jamais les probabilités d'un autre modèle
+    - éviction LRU dès que `max_bytes` (estimation) est dépassé
+    - entrées expirées après `ttl_s` secondes (None = jamais)
+    - `bind_model` avec un autre modèle vide le cache (mémoire libérée
+      pour le nouveau modèle chargé)
+
+    Thread-safe (verrou unique, opérations O(1) par entrée).
+    """
+
+    def __init__(self, max_bytes: int = 64 * 1024 ** 2, ttl_s: float | None = 900.0):
+        if max_bytes < _ENTRY_BYTES:
+            raise ValueError(f"max_bytes doit être >= {_ENTRY_BYTES} : {max_bytes}")
+        if ttl_s is not None and ttl_s <= 0:
+            raise ValueError(f"ttl_s doit être > 0 : {ttl_s}")
+
+        self.max_bytes = max_bytes
+        self.max_entries = max_bytes // _ENTRY_BYTES
+        self.ttl_s = ttl_s
+
+        self._entries: OrderedDict[bytes, tuple[float, float]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._bound_namespace: bytes | None = None
+        self.model_hash: str | None = None
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+
+    # ------------------------------------------------------------------
+    # Modèle courant
+    # ------------------------------------------------------------------
+    def bind_model(self, model_hash: str, feature_columns: Sequence[str]) -> None:
+        """
+        Rattache le cache au dernier modèle chargé ; vidé si le modèle ou
+        le feature space change. Les clés restent calculées avec l'espace
+        de noms de chaque prédicteur : un prédicteur encore actif sur
+        l'ancien modèle n'écrit que dans le sien.
+        """
+        namespace = cache_namespace(model_hash, feature_columns).digest()
+
+        with self._lock:
+            if self._bound_namespace == namespace:
+                return
+            if self._entries:
+                self.invalidations += 1
+                app_logger.info(
+                    f"🧹 Prediction cache invalidated | entries={len(self._entries)} | "
+                    f"new model={model_hash[:12]}"
+                )
+            self._entries.clear()
+            self._bound_namespace = namespace
+            self.model_hash = model_hash
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    # ------------------------------------------------------------------
+    # Accès
+    # ------------------------------------------------------------------
+    @staticmethod
+    def keys_for(namespace: hashlib.blake2b, X: np.ndarray) -> list[bytes]:
+        """
+        Empreintes des lignes d'une matrice float32 contiguë, dans
+        l'espace de noms d'un modèle (`cache_namespace`).
+        """
+        keys = []
+        for row in X:
+            digest = namespace.copy()
+            digest.update(row.data)
+            keys.append(digest.digest())
+        return keys
+
+    def get_many(self, keys: Sequence[bytes]) -> list[float | None]:
+        now = time.monotonic()
+        values: list[float | None] = []
+
+        with self._lock:
+            for key in keys:
+                entry = self._entries.get(key)
+                if entry is None:
+                    self.misses += 1
+                    values.append(None)
+                elif entry[1] < now:
+                    del self._entries[key]
+                    self.expirations += 1
+                    self.misses += 1
+                    values.append(None)
+                else:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    values.append(entry[0])
+
+        return values
+
+    def put_many(self, keys: Sequence[bytes], values: Sequence[float]) -> None:
+        expires_at = time.monotonic() + self.ttl_s if self.ttl_s is not None else float("inf")
+
+        with self._lock:
+            for key, value in zip(keys, values):
+                self._entries[key] = (float(value), expires_at)
+                self._entries.move_to_end(key)
+
+            overflow = len(self._entries) - self.max_entries
+            for _ in range(max(overflow, 0)):
+                self._entries.popitem(last=False)
+            self.evictions += max(overflow, 0)
+
+    # ------------------------------------------------------------------
+    # Métriques
+    # ------------------------------------------------------------------
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "model_hash": self.model_hash,
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "memory_bytes": len(self._entries) * _ENTRY_BYTES,
+                "max_bytes": self.max_bytes,
+                "ttl_s": self.ttl_s,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": self.hits / lookups if lookups else 0.0,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "invalidations": self.invalidations,
+            }
+
+
+def cache_namespace(model_hash: str, feature_columns: Sequence[str]) -> hashlib.blake2b:
+    """
+    Espace de noms des clés d'un modèle : hash du modèle + feature space.
+    """
+    namespace = hashlib.blake2b(digest_size=_DIGEST_SIZE)
+    namespace.update(model_hash.encode())
+    namespace.update("\x1f".join(feature_columns).encode())
+    return namespace
+
+
+class CachingPredictor(PredictorPort):
+    """
+    Enveloppe un prédicteur (PredictorPort) avec un PredictionCache.
+
+    Les lignes sont projetées sur le feature space du modèle (float32),
+    seules les lignes absentes du cache sont transmises au prédicteur,
+    en un seul appel.
+    """
+
+    def __init__(self, predictor: PredictorPort, model_hash: str, cache: PredictionCache):
+        self.predictor = predictor
+        self.model_hash = model_hash
+        self.cache = cache
+        self._namespace = cache_namespace(model_hash, self.feature_columns)
+        self.cache.bind_model(model_hash, self.feature_columns)
+
+    @property
+    def feature_columns(self) -> list[str]:
+        return list(self.predictor.feature_columns)
+
+    def predict_proba(
+        self,
+        rows: Sequence[Mapping[str, object]],
+        feature_columns: Sequence[str] | None = None,
+    ) -> Sequence[float]:
+        if feature_columns is not None and list(feature_columns) != self.feature_columns:
+            raise ValueError(
+                "Feature space incompatible avec le modèle : "
+                f"attendu={self.feature_columns}, reçu={list(feature_columns)}"
+            )
+        return self.predict_matrix(rows_to_matrix(rows, self.feature_columns))
+
+    def predict_matrix(self, X: np.ndarray) -> np.ndarray:
+        X = np.ascontiguousarray(X, dtype=np.float32)
+        if X.ndim != 2 or X.shape[1] != len(self.feature_columns):
+            raise ValueError(
+                f"Matrice de forme {X.shape} incompatible avec "
+                f"{len(self.feature_columns)} features"
+            )
+
+        keys = self.cache.keys_for(self._namespace, X)
+        cached = self.cache.get_many(keys)
+
+        proba = np.empty(len(keys), dtype=np.float32)
+        missing = [i for i, value in enumerate(cached) if value is None]
+        if len(missing) < len(keys):
+            hit_idx = np.array([i for i, value in enumerate(cached) if value is not None])
+            proba[hit_idx] = [cached[i] for i in hit_idx]
+
+        if missing:
+            computed = np.asarray(self.predictor.predict_matrix(X[missing]), dtype=np.float32)
+            proba[missing] = computed
+            self.cache.put_many([keys[i] for i in missing], computed)
+
+        return proba
+
+    def predict_one(self, row: Mapping[str, Any]) -> float:
+        x = np.fromiter(
+            (row[col] for col in self.feature_columns),
+            dtype=np.float32,
+            count=len(self.feature_columns),
+        ).reshape(1, -1)
+        return float(self.predict_matrix(x)[0])
@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from nba_longevity.domain.ports.predictor_port import PredictorPort
+from nba_longevity.infrastructure.inference.batch_prediction_engine import DEFAULT_CHUNK_SIZE
+
+if TYPE_CHECKING:
+    from nba_longevity.infrastructure.artifacts.model_artifact_store import ModelArtifact
+    from nba_longevity.infrastructure.inference.prediction_cache import PredictionCache
+
+
+def build_predictor(
+    artifact: ModelArtifact,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    n_threads: int | None = None,
+    cache: PredictionCache | None = None,
+) -> PredictorPort:
+    """
+    Construit le prédicteur adapté à un artefact chargé.
+
+    L'ordre des colonnes vient du manifest de l'artefact.
+    Seul le module du type de modèle concerné est importé ; artefact
+    chargé en backend "compiled" → prédicteur NumPy, sans librairie.
+    `n_threads` : threads de prédiction (None = défaut de la librairie).
+    `cache` : cache de prédictions (rattaché au hash de l'artefact).
+    """
+    predictor = _build_model_predictor(artifact, chunk_size, n_threads)
+    if cache is None:
+        return predictor
+
+    from nba_longevity.infrastructure.inference.prediction_cache import CachingPredictor
+
+    return CachingPredictor(predictor, artifact.content_hash, cache)
+
+
+def _build_model_predictor(
+    artifact: ModelArtifact,
+    chunk_size: int,
+    n_threads: int | None,
+) -> PredictorPort:
+    model_type = artifact.manifest.model_type
+    feature_columns = artifact.manifest.feature_columns
+
+    if artifact.backend == "compiled":
+        from nba_longevity.infrastructure.inference.compiled_tree_predictor import (
+            CompiledTreePredictor,
+        )
+
+        return CompiledTreePredictor(
+            artifact.model,
+            feature_columns=feature_columns,
+            chunk_size=chunk_size,
+        )
+
+    if model_type == "xgboost":
+        from nba_longevity.infrastructure.inference.xgboost_predictor import XGBoostPredictor
+
+        return XGBoostPredictor(
+            artifact.model,
+            feature_columns=feature_columns,
+            chunk_size=chunk_size,
+            n_threads=n_threads,
+        )
+
+    if model_type == "catboost":
+        from nba_longevity.infrastructure.inference.catboost_predictor import CatBoostPredictor
+
+        return CatBoostPredictor(
+            artifact.model,
+            feature_columns=feature_columns,
+            chunk_size=chunk_size,
+            n_threads=n_threads,
+        )
+
+    raise ValueError(f"Unknown model_type: {model_type}")
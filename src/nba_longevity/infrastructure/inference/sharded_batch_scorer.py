@@ -0,0 +1,244 @@
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, asdict
+from pathlib import Path
+from typing import Any, Sequence
+
+import numpy as np
+import pandas as pd
+
+from nba_longevity.application.bootstrap import app_logger
+from nba_longevity.infrastructure.dataset.dtype_plan import WIDE, DtypePlan
+from nba_longevity.infrastructure.dataset.prefetch import prefetch
+from nba_longevity.infrastructure.dataset.shard_reader import Shard, iter_shard_chunks
+from nba_longevity.infrastructure.feature_engineering.fused_feature_plan import FusedFeaturePlan
+from nba_longevity.infrastructure.inference.batch_prediction_engine import (
+    DEFAULT_CHUNK_SIZE,
+    DEFAULT_OUTPUT_COLUMN,
+)
+
+
+OUTPUT_FORMATS = ("csv", "parquet")
+
+
+@dataclass(frozen=True)
+class ShardResult:
+    shard_index: int
+    output_path: str
+    rows_in: int
+    rows_scored: int
+    chunks: int
+    wall_time_s: float
+    error: str | None = None
+
+    @property
+    def rows_per_s(self) -> float:
+        return self.rows_in / self.wall_time_s if self.wall_time_s > 0 else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        return {**asdict(self), "rows_per_s": self.rows_per_s}
+
+
+# État par processus worker (modèle chargé une fois par processus)
+_WORKER: dict[str, Any] = {}
+
+
+def _init_worker(
+    artifacts_dir: str,
+    model_hash: str,
+    threads_per_worker: int,
+    chunk_size: int,
+    backend: str,
+) -> None:
+    # Avant tout import de librairie modèle : borne les threads OpenMP
+    os.environ["OMP_NUM_THREADS"] = str(threads_per_worker)
+
+    from nba_longevity.infrastructure.artifacts.model_artifact_store import ModelArtifactStore
+    from nba_longevity.infrastructure.inference.predictor_factory import build_predictor
+
+    artifact = ModelArtifactStore(artifacts_dir).load(model_hash=model_hash, backend=backend)
+
+    _WORKER["predictor"] = build_predictor(
+        artifact, chunk_size=chunk_size, n_threads=threads_per_worker
+    )
+    # Plan de types de l'entraînement : vecteurs identiques à ceux vus par le modèle
+    _WORKER["plan"] = FusedFeaturePlan(
+        artifact.manifest.feature_columns,
+        medians=artifact.manifest.preprocessing_stats,
+        dtype_plan=DtypePlan.from_name(artifact.manifest.metadata.get("dtype_plan", WIDE)),
+    )
+
+
+def _score_shard(
+    shard: Shard,
+    output_dir: str,
+    output_format: str,
+    chunk_rows: int,
+    keep_columns: Sequence[str],
+    output_column: str,
+    prefetch_depth: int,
+) -> ShardResult:
+    predictor = _WORKER["predictor"]
+    plan: FusedFeaturePlan = _WORKER["plan"]
+
+    suffix = "csv" if output_format == "csv" else "parquet"
+    output_path = Path(output_dir) / f"part-{shard.index:05d}.{suffix}"
+    columns = list(dict.fromkeys([*keep_columns, *plan.raw_columns]))
+
+    start = time.perf_counter()
+    rows_in = rows_scored = chunks = 0
+    writer = _ChunkWriter(output_path, output_format)
+    try:
+        # Lecture / parsing du bloc suivant en tâche de fond
+        for chunk in prefetch(iter_shard_chunks(shard, chunk_rows, columns), prefetch_depth):
+            df = chunk._df
+            X, _, keep = plan.execute_with_mask(chunk, target_column=None)
+            proba = predictor.predict_matrix(X)
+
+            out = df.loc[keep, [c for c in keep_columns if c in df.columns]].reset_index(drop=True)
+            out[output_column] = proba.astype(np.float64)
+            writer.write(out)
+
+            rows_in += len(df)
+            rows_scored += len(out)
+            chunks += 1
+        error = None
+    except Exception as exc:
+        error = f"{type(exc).__name__}: {exc}"
+    finally:
+        writer.close()
+
+    return ShardResult(
+        shard_index=shard.index,
+        output_path=str(output_path),
+        rows_in=rows_in,
+        rows_scored=rows_scored,
+        chunks=chunks,
+        wall_time_s=time.perf_counter() - start,
+        error=error,
+    )
+
+
+class _ChunkWriter:
+    """
+    Écriture incrémentale d'un fichier de sortie (un bloc à la fois).
+    """
+
+    def __init__(self, path: Path, output_format: str):
+        self.path = path
+        self.output_format = output_format
+        self._parquet_writer = None
+        self._csv_file = None
+
+    def write(self, df: pd.DataFrame) -> None:
+        if self.output_format == "csv":
+            if self._csv_file is None:
+                self._csv_file = open(self.path, "w", newline="")
+                df.to_csv(self._csv_file, index=False)
+            else:
+                df.to_csv(self._csv_file, index=False, header=False)
+            return
+
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        if self._parquet_writer is None:
+            self._parquet_writer = pq.ParquetWriter(self.path, table.schema)
+        else:
+            # Les dtypes inférés peuvent varier d'un bloc à l'autre
+            table = table.cast(self._parquet_writer.schema)
+        self._parquet_writer.write_table(table)
+
+    def close(self) -> None:
+        if self._csv_file is not None:
+            self._csv_file.close()
+        if self._parquet_writer is not None:
+            self._parquet_writer.close()
+
+
+class ShardedBatchScorer:
+    """
+    Scoring batch en streaming, shardé sur un pool de processus.
+
+    - chaque shard est lue par blocs (mémoire bornée par
+      `chunk_rows × (prefetch_depth + 1)` par worker, quelle que soit la
+      taille des entrées)
+    - preprocessing + features par le plan fusionné (médianes de
+      l'artefact, seules les colonnes brutes utiles sont lues)
+    - les probabilités sont écrites bloc par bloc, un fichier
+      `part-<shard>.csv|parquet` par shard
+    - le modèle est chargé une fois par worker (store d'artefacts)
+
+    `n_workers=1` : exécution dans le processus courant, sans pool.
+    `backend="compiled"` : arbres NumPy, les workers n'importent pas la
+    librairie du modèle.
+    """
+
+    def __init__(
+        self,
+        artifacts_dir: str | Path,
+        model_hash: str,
+        output_dir: str | Path,
+        output_format: str = "parquet",
+        chunk_rows: int = 100_000,
+        keep_columns: Sequence[str] = (),
+        output_column: str = DEFAULT_OUTPUT_COLUMN,
+        n_workers: int | None = None,
+        threads_per_worker: int = 1,
+        prefetch_depth: int = 1,
+        backend: str = "native",
+    ):
+        if output_format not in OUTPUT_FORMATS:
+            raise ValueError(f"Unsupported output format: {output_format}")
+
+        self.artifacts_dir = str(artifacts_dir)
+        self.model_hash = model_hash
+        self.output_dir = Path(output_dir)
+        self.output_format = output_format
+        self.chunk_rows = chunk_rows
+        self.keep_columns = list(keep_columns)
+        self.output_column = output_column
+        self.n_workers = n_workers or max(1, (os.cpu_count() or 1) // threads_per_worker)
+        self.threads_per_worker = threads_per_worker
+        self.prefetch_depth = prefetch_depth
+        self.backend = backend
+
+    def run(self, shards: Sequence[Shard]) -> list[ShardResult]:
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+
+        init_args = (
+            self.artifacts_dir, self.model_hash, self.threads_per_worker, DEFAULT_CHUNK_SIZE,
+            self.backend,
+        )
+        task_args = (
+            str(self.output_dir), self.output_format, self.chunk_rows,
+            self.keep_columns, self.output_column, self.prefetch_depth,
+        )
+        n_workers = min(self.n_workers, len(shards)) or 1
+
+        app_logger.info(
+            f"🧮 Sharded batch scoring | shards={len(shards)} | workers={n_workers} | "
+            f"chunk_rows={self.chunk_rows} | format={self.output_format} | backend={self.backend}"
+        )
+
+        if n_workers == 1:
+            _init_worker(*init_args)
+            results = [_score_shard(shard, *task_args) for shard in shards]
+        else:
+            with ProcessPoolExecutor(
+                max_workers=n_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker,
+                initargs=init_args,
+            ) as pool:
+                futures = [pool.submit(_score_shard, shard, *task_args) for shard in shards]
+                results = [future.result() for future in futures]
+
+        for result in results:
+            if result.error is not None:
+                app_logger.error(f"Shard {result.shard_index} failed | {result.error}")
+
+        return results
@@ -0,0 +1,132 @@
+from typing import Any, Iterator
+
+import numpy as np
+
+from nba_longevity.application.bootstrap import app_logger
+from nba_longevity.domain.dataset.dataset import Dataset
+from nba_longevity.infrastructure.artifacts.model_artifact_store import (
+    ModelArtifact,
+    ModelManifest,
+    serialize_model,
+    deserialize_model,
+)
+from nba_longevity.infrastructure.dataset.spark_dataset import SparkDataset
+from nba_longevity.infrastructure.dataset.pandas_dataset import PandasDataset
+from nba_longevity.infrastructure.inference.batch_prediction_engine import (
+    DEFAULT_CHUNK_SIZE,
+    DEFAULT_OUTPUT_COLUMN,
+)
+
+# Prédicteurs désérialisés, par processus worker Python (clé = hash du modèle).
+# Les workers étant réutilisés (spark.python.worker.reuse), le modèle n'est
+# désérialisé qu'une fois par worker, pas une fois par partition.
+_WORKER_PREDICTORS: dict[str, Any] = {}
+
+
+class SparkBatchScorer:
+    """
+    Scoring distribué d'un SparkDataset.
+
+    - le modèle (binaire natif + manifest) est diffusé une seule fois
+      aux exécuteurs (broadcast)
+    - chaque partition est scorée par `mapInPandas` : lots Arrow →
+      pandas → prédiction vectorisée, sans passer par le driver
+    - la probabilité est ajoutée en colonne ; toutes les colonnes
+      d'entrée sont conservées
+
+    `threads_per_task` : threads de prédiction par tâche Spark (1 par
+    défaut : Spark parallélise déjà sur les cœurs des exécuteurs).
+    """
+
+    def __init__(
+        self,
+        spark,
+        artifact: ModelArtifact,
+        output_column: str = DEFAULT_OUTPUT_COLUMN,
+        threads_per_task: int = 1,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        max_records_per_batch: int | None = None,
+    ):
+        self.spark = spark
+        self.manifest = artifact.manifest
+        self.feature_columns = list(artifact.manifest.feature_columns)
+        self.output_column = output_column
+        self.threads_per_task = threads_per_task
+        self.chunk_size = chunk_size
+
+        if max_records_per_batch is not None:
+            # Taille des lots Arrow transmis au worker Python
+            spark.conf.set(
+                "spark.sql.execution.arrow.maxRecordsPerBatch", str(max_records_per_batch)
+            )
+
+        model_bytes = serialize_model(artifact.model, self.manifest.model_type)
+        self._broadcast = spark.sparkContext.broadcast(
+            (model_bytes, self.manifest.model_dump(mode="json"))
+        )
+
+        app_logger.info(
+            f"📡 Model broadcast | type={self.manifest.model_type} | "
+            f"hash={self.manifest.content_hash[:12]} | size={len(model_bytes)} bytes"
+        )
+
+    def score(self, dataset: Dataset) -> SparkDataset:
+        """
+        Ajoute la colonne de probabilité (transformation paresseuse).
+        """
+        from pyspark.sql.types import DoubleType, StructField, StructType
+
+        if not isinstance(dataset, SparkDataset):
+            raise TypeError(f"SparkBatchScorer expects a SparkDataset, got {type(dataset)}")
+
+        df = dataset._df
+
+        missing = [col for col in self.feature_columns if col not in df.columns]
+        if missing:
+            raise ValueError(f"Colonnes manquantes : {missing}")
+        if self.output_column in df.columns:
+            raise ValueError(f"Colonne de sortie déjà présente : {self.output_column}")
+
+        schema = StructType(
+            df.schema.fields + [StructField(self.output_column, DoubleType(), False)]
+        )
+
+        # Variables locales : la closure sérialisée ne doit pas embarquer
+        # `self` (session Spark non sérialisable)
+        broadcast = self._broadcast
+        output_column = self.output_column
+        threads_per_task = self.threads_per_task
+        chunk_size = self.chunk_size
+
+        def score_partition(batches: Iterator) -> Iterator:
+            predictor = _worker_predictor(broadcast.value, threads_per_task, chunk_size)
+            for pdf in batches:
+                proba = predictor.predict_proba(PandasDataset(pdf))
+                yield pdf.assign(**{output_column: np.asarray(proba, dtype=np.float64)})
+
+        return SparkDataset(df.mapInPandas(score_partition, schema=schema))
+
+    def unpersist(self) -> None:
+        """
+        Libère le modèle diffusé sur les exécuteurs.
+        """
+        self._broadcast.unpersist()
+
+
+def _worker_predictor(payload: tuple[bytes, dict], n_threads: int, chunk_size: int):
+    from nba_longevity.infrastructure.inference.predictor_factory import build_predictor
+
+    model_bytes, manifest_data = payload
+    model_hash = manifest_data["content_hash"]
+
+    predictor = _WORKER_PREDICTORS.get(model_hash)
+    if predictor is None:
+        manifest = ModelManifest.model_validate(manifest_data)
+        artifact = ModelArtifact(
+            model=deserialize_model(model_bytes, manifest.model_type),
+            manifest=manifest,
+        )
+        predictor = build_predictor(artifact, chunk_size=chunk_size, n_threads=n_threads)
+        _WORKER_PREDICTORS[model_hash] = predictor
+
+    return predictor
@@ -1,26 +1,67 @@
-import xgboost as xgb
-from pandas import DataFrame
-from typing import Sequence
+from __future__ import annotations
+
+import numpy as np
+from typing import TYPE_CHECKING, Any, Mapping, Sequence
 from nba_longevity.domain.ports.predictor_port import PredictorPort
-# Feature spaces (Domain)
-from nba_longevity.domain.features.feature_spaces import (
-    FEATURE_SPACE_MINIMAL,
-    FEATURE_SPACE_EXTENDED,
+from nba_longevity.infrastructure.inference.batch_prediction_engine import (
+    BatchPredictionEngine,
+    DEFAULT_CHUNK_SIZE,
 )
 
+if TYPE_CHECKING:
+    import xgboost as xgb
+
+
 class XGBoostPredictor(PredictorPort):
-    def __init__(self, model: xgb.Booster):
+    """
+    Prédicteur XGBoost conforme au PredictorPort.
+
+    - ordre des colonnes figé à la construction (noms du booster par défaut)
+    - prédiction in-place (`inplace_predict`) : aucune DMatrix construite
+    - scoring par blocs + chemin dédié pour un seul joueur
+    - booster issu d'un early stopping : seuls les arbres jusqu'à
+      `best_iteration` sont utilisés (modèle retenu par la validation)
+    """
+
+    def __init__(
+        self,
+        model: xgb.Booster,
+        feature_columns: Sequence[str] | None = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        n_threads: int | None = None,
+    ):
         self.model = model
+        if n_threads is not None:
+            # Exécuteurs Spark / workers : un thread par tâche évite la sursouscription
+            self.model.set_param({"nthread": n_threads})
+        best_iteration = model.attr("best_iteration")
+        self.iteration_range = (0, int(best_iteration) + 1) if best_iteration is not None else (0, 0)
+        self.engine = BatchPredictionEngine(
+            predict_fn=self._predict_matrix,
+            feature_columns=feature_columns or model.feature_names,
+            chunk_size=chunk_size,
+        )
+
+    @property
+    def feature_columns(self) -> list[str]:
+        return self.engine.feature_columns
+
+    def predict_proba(
+        self,
+        rows: Sequence[Mapping[str, object]],
+        feature_columns: Sequence[str] | None = None,
+    ) -> Sequence[float]:
+        self.engine.check_feature_columns(feature_columns)
+        return self.engine.predict_rows(rows)
 
-    def predict_proba(self, rows, feature_space: str = "minimal",)->Sequence[float]:
-        df = DataFrame(list(rows))
+    def predict_matrix(self, X: np.ndarray) -> np.ndarray:
+        return self.engine.predict_matrix(X)
 
-        # Choix de l'espace de features
-        if feature_space == "extended":
-            selected_features = FEATURE_SPACE_EXTENDED
-        else:
-            selected_features = FEATURE_SPACE_MINIMAL
+    def predict_one(self, row: Mapping[str, Any]) -> float:
+        return self.engine.predict_one(row)
 
-        X = df[selected_features]
-        dmatrix = xgb.DMatrix(X)
-        return self.model.predict(dmatrix)
+    def _predict_matrix(self, X: np.ndarray) -> np.ndarray:
+        # (0, 0) : tous les arbres ; sinon arrêt à best_iteration
+        return self.model.inplace_predict(
+            X, iteration_range=self.iteration_range, validate_features=False
+        )
@@ -0,0 +1,65 @@
+import os
+import resource
+import sys
+import threading
+
+
+def current_rss_bytes() -> int | None:
+    """
+    RSS courant du processus (Linux : /proc/self/statm) ; None si indisponible.
+    """
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+def max_rss_bytes() -> int:
+    """
+    Pic de RSS depuis le démarrage du processus (ru_maxrss : Ko sous Linux, octets sous macOS).
+    """
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+class RssSampler:
+    """
+    Échantillonne le RSS dans un thread de fond pendant un bloc de code.
+
+    - `start` : RSS à l'entrée du bloc
+    - `peak` : RSS maximal observé pendant le bloc
+    Sans /proc, retombe sur ru_maxrss (pic du processus).
+    """
+
+    def __init__(self, interval_s: float = 0.005):
+        self.interval_s = interval_s
+        self.start = current_rss_bytes() or 0
+        self.peak = self.start
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="rss-sampler", daemon=True)
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval_s):
+            rss = current_rss_bytes()
+            if rss is not None and rss > self.peak:
+                self.peak = rss
+
+    def __enter__(self) -> "RssSampler":
+        if current_rss_bytes() is not None:
+            self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        if self._thread.is_alive():
+            self._stop.set()
+            self._thread.join()
+        rss = current_rss_bytes()
+        if rss is None:
+            self.peak = max_rss_bytes()
+        else:
+            self.peak = max(self.peak, rss)
+
+    @property
+    def peak_delta(self) -> int:
+        return max(self.peak - self.start, 0)
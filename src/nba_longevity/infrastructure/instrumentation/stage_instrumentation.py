@@ -0,0 +1,248 @@
+import cProfile
+import io
+import json
+import pstats
+import time
+import tracemalloc
+from contextlib import contextmanager
+from dataclasses import dataclass, asdict, field
+from pathlib import Path
+from typing import Any, Callable, Iterator
+
+import numpy as np
+
+from nba_longevity.application.bootstrap import app_logger
+from nba_longevity.domain.dataset.dataset import ColumnarDataset
+from nba_longevity.infrastructure.instrumentation.rss_sampler import RssSampler
+
+
+@dataclass
+class StageRecord:
+    """
+    Mesures d'un stage du pipeline.
+    """
+
+    name: str
+    wall_time_s: float = 0.0
+    cpu_time_s: float = 0.0
+    rss_start_bytes: int = 0
+    peak_rss_bytes: int = 0
+    peak_rss_delta_bytes: int = 0
+    rows_in: int | None = None
+    rows_out: int | None = None
+    bytes_in: int | None = None
+    bytes_out: int | None = None
+    traced_peak_bytes: int | None = None
+    top_allocations: list[str] = field(default_factory=list)
+    profile_path: str | None = None
+    error: str | None = None
+
+
+class StageHandle:
+    """
+    Poignée d'un stage en cours : permet de déclarer entrées / sorties.
+    """
+
+    def __init__(self, record: StageRecord):
+        self.record = record
+
+    def inputs(self, obj: Any = None, rows: int | None = None, nbytes: int | None = None) -> None:
+        self.record.rows_in = rows if rows is not None else rows_of(obj)
+        self.record.bytes_in = nbytes if nbytes is not None else bytes_of(obj)
+
+    def outputs(self, obj: Any = None, rows: int | None = None, nbytes: int | None = None) -> None:
+        self.record.rows_out = rows if rows is not None else rows_of(obj)
+        self.record.bytes_out = nbytes if nbytes is not None else bytes_of(obj)
+
+
+class StageInstrumentation:
+    """
+    Instrumentation par stage des appels aux ports du pipeline.
+
+    Pour chaque stage : temps mural / CPU, RSS de départ, pic et delta
+    de pic, lignes et octets en entrée / sortie. En option (config) :
+    - cProfile : un fichier .prof + un résumé texte (top N cumulatif) par stage
+    - tracemalloc : pic d'allocations Python tracées + top des allocations
+
+    Désactivée (`enabled=False`), `instrument` appelle directement la
+    fonction : aucun coût pour le pipeline.
+    """
+
+    def __init__(
+        self,
+        output_dir: str | Path | None = None,
+        enabled: bool = True,
+        cprofile: bool = False,
+        trace_memory: bool = False,
+        profile_top_n: int = 25,
+    ):
+        self.output_dir = Path(output_dir) if output_dir is not None else None
+        self.enabled = enabled
+        self.cprofile = cprofile and self.output_dir is not None
+        self.trace_memory = trace_memory
+        self.profile_top_n = profile_top_n
+        self.records: list[StageRecord] = []
+        self._started = time.perf_counter()
+
+    @classmethod
+    def disabled(cls) -> "StageInstrumentation":
+        return cls(enabled=False)
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[StageHandle]:
+        record = StageRecord(name=name)
+        handle = StageHandle(record)
+
+        if not self.enabled:
+            yield handle
+            return
+
+        profiler = cProfile.Profile() if self.cprofile else None
+        # tracemalloc est global : un stage imbriqué ne l'arrête pas
+        own_tracing = self.trace_memory and not tracemalloc.is_tracing()
+        if own_tracing:
+            tracemalloc.start()
+
+        sampler = RssSampler()
+        try:
+            with sampler:
+                wall_start = time.perf_counter()
+                cpu_start = time.process_time()
+                if profiler is not None:
+                    profiler.enable()
+                try:
+                    yield handle
+                except BaseException as exc:
+                    record.error = f"{type(exc).__name__}: {exc}"
+                    raise
+                finally:
+                    if profiler is not None:
+                        profiler.disable()
+                    record.cpu_time_s = time.process_time() - cpu_start
+                    record.wall_time_s = time.perf_counter() - wall_start
+
+                    if own_tracing:
+                        record.traced_peak_bytes = tracemalloc.get_traced_memory()[1]
+                        record.top_allocations = _top_allocations(tracemalloc.take_snapshot())
+                        tracemalloc.stop()
+        finally:
+            record.rss_start_bytes = sampler.start
+            record.peak_rss_bytes = sampler.peak
+            record.peak_rss_delta_bytes = sampler.peak_delta
+
+            if profiler is not None:
+                record.profile_path = str(self._dump_profile(name, profiler))
+
+            self.records.append(record)
+
+            app_logger.debug(
+                f"⏱️ Stage {name} | wall={record.wall_time_s:.4f}s | cpu={record.cpu_time_s:.4f}s | "
+                f"peak_rss_delta={record.peak_rss_delta_bytes / 1024 ** 2:.1f} MiB | "
+                f"rows {record.rows_in} → {record.rows_out}"
+            )
+
+    def instrument(self, name: str, fn: Callable[..., Any], *args, **kwargs) -> Any:
+        """
+        Appelle `fn(*args, **kwargs)` dans un stage ; entrées mesurées sur
+        le premier argument, sorties sur le résultat.
+        """
+        if not self.enabled:
+            return fn(*args, **kwargs)
+
+        with self.stage(name) as handle:
+            if args:
+                handle.inputs(args[0])
+            result = fn(*args, **kwargs)
+            handle.outputs(result)
+        return result
+
+    def metrics(self) -> dict[str, float]:
+        """
+        Métriques à plat (stage.<nom>.<mesure>) pour le tracking d'expériences.
+        """
+        metrics = {}
+        for record in self.records:
+            prefix = f"stage.{record.name}"
+            metrics[f"{prefix}.wall_time_s"] = record.wall_time_s
+            metrics[f"{prefix}.cpu_time_s"] = record.cpu_time_s
+            metrics[f"{prefix}.peak_rss_delta_bytes"] = float(record.peak_rss_delta_bytes)
+            for key in ("rows_in", "rows_out", "bytes_in", "bytes_out", "traced_peak_bytes"):
+                value = getattr(record, key)
+                if value is not None:
+                    metrics[f"{prefix}.{key}"] = float(value)
+        metrics["run.wall_time_s"] = time.perf_counter() - self._started
+        return metrics
+
+    def write_report(self, report: dict[str, Any], filename: str = "run_report.json") -> Path | None:
+        """
+        Rapport de run lisible par machine : `report` + mesures par stage.
+        """
+        if not self.enabled or self.output_dir is None:
+            return None
+
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        path = self.output_dir / filename
+        payload = {
+            **report,
+            "wall_time_s": time.perf_counter() - self._started,
+            "stages": [asdict(record) for record in self.records],
+        }
+        path.write_text(json.dumps(payload, indent=2, default=str))
+
+        app_logger.info(f"Run report written | path={path}")
+
+        return path
+
+    def _dump_profile(self, name: str, profiler: cProfile.Profile) -> Path:
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        path = self.output_dir / f"{name}.prof"
+        profiler.dump_stats(path)
+
+        summary = io.StringIO()
+        pstats.Stats(profiler, stream=summary).sort_stats("cumulative").print_stats(self.profile_top_n)
+        path.with_suffix(".prof.txt").write_text(summary.getvalue())
+
+        return path
+
+
+def rows_of(obj: Any) -> int | None:
+    """
+    Nombre de lignes d'un Dataset, d'un tableau ou d'un tuple de tableaux.
+    """
+    if obj is None:
+        return None
+    if isinstance(obj, np.ndarray):
+        return int(obj.shape[0]) if obj.ndim else 1
+    if isinstance(obj, tuple):
+        rows = [r for r in (rows_of(item) for item in obj) if r is not None]
+        if not rows:
+            return None
+        # (X, y) : lignes alignées ; (train, valid) : partition des lignes
+        return rows[0] if len(set(rows)) == 1 else sum(rows)
+    if isinstance(obj, ColumnarDataset) and hasattr(obj, "__len__"):
+        return len(obj)
+    return None
+
+
+def bytes_of(obj: Any) -> int | None:
+    """
+    Taille en mémoire (buffers NumPy, colonnes d'un Dataset), sans parcours profond.
+    """
+    if obj is None:
+        return None
+    if isinstance(obj, np.ndarray):
+        return int(obj.nbytes)
+    if isinstance(obj, tuple):
+        sizes = [bytes_of(item) for item in obj]
+        return sum(s for s in sizes if s is not None) if any(s is not None for s in sizes) else None
+    if isinstance(obj, Path):
+        return obj.stat().st_size if obj.exists() else None
+    if isinstance(obj, ColumnarDataset) and hasattr(obj, "_df"):
+        memory_usage = getattr(obj._df, "memory_usage", None)
+        if memory_usage is not None:
+            return int(memory_usage(index=False, deep=False).sum())
+    return None
+
+
+def _top_allocations(snapshot: tracemalloc.Snapshot, limit: int = 10) -> list[str]:
+    return [str(stat) for stat in snapshot.statistics("lineno")[:limit]]
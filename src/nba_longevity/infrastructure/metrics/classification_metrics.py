@@ -1,9 +1,6 @@
 from typing import Sequence
-from sklearn.metrics import (
-    roc_auc_score,
-    f1_score,
-    confusion_matrix,
-)
+
+from nba_longevity.infrastructure.metrics.threshold_sweep import evaluate_predictions
 
 
 def compute_classification_metrics(
@@ -11,10 +8,10 @@ def compute_classification_metrics(
     y_proba: Sequence[float],
     threshold: float = 0.5,
 ) -> dict:
-    y_pred = [1 if p >= threshold else 0 for p in y_proba]
+    evaluation = evaluate_predictions(y_true, y_proba, threshold=threshold)
 
     return {
-        "auc": roc_auc_score(y_true, y_proba),
-        "f1": f1_score(y_true, y_pred),
-        "confusion_matrix": confusion_matrix(y_true, y_pred).tolist(),
+        "auc": evaluation["auc"],
+        "f1": evaluation["f1"],
+        "confusion_matrix": evaluation["confusion_matrix"],
     }
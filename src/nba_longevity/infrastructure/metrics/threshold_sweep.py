@@ -0,0 +1,291 @@
+from dataclasses import dataclass
+from typing import Any, Sequence
+
+import numpy as np
+
+
+DEFAULT_THRESHOLD = 0.5
+
+# Nombre maximal de cellules (groupes de scores) pour le bootstrap
+DEFAULT_BOOTSTRAP_CELLS = 1024
+
+# Taille maximale d'un lot de la matrice de rééchantillonnage (éléments)
+_MAX_BATCH_ELEMENTS = 1 << 23
+
+
+@dataclass(frozen=True)
+class ThresholdSweep:
+    """
+    Matrices de confusion pour tous les seuils candidats, en un seul tri.
+
+    Seuils = scores distincts, décroissants ; au seuil `thresholds[i]`,
+    une prédiction est positive si score >= thresholds[i].
+    `tp[i]` / `fp[i]` : vrais / faux positifs cumulés à ce seuil.
+    """
+
+    thresholds: np.ndarray
+    tp: np.ndarray
+    fp: np.ndarray
+    n_pos: int
+    n_neg: int
+
+    @classmethod
+    def from_scores(cls, y_true: Sequence[int], y_score: Sequence[float]) -> "ThresholdSweep":
+        y_true = np.asarray(y_true).ravel().astype(bool)
+        y_score = np.asarray(y_score, dtype=np.float64).ravel()
+
+        if len(y_true) != len(y_score):
+            raise ValueError(f"Length mismatch: {len(y_true)} labels vs {len(y_score)} scores")
+        if len(y_score) == 0:
+            raise ValueError("No predictions to evaluate")
+
+        order = np.argsort(y_score)[::-1]
+        scores = y_score[order]
+
+        # Fin de chaque groupe de scores égaux (ex-aequo = un seul seuil)
+        ends = np.r_[np.flatnonzero(scores[1:] != scores[:-1]), len(scores) - 1]
+        tp = np.cumsum(y_true[order], dtype=np.int64)[ends]
+        fp = ends + 1 - tp
+
+        return cls(
+            thresholds=scores[ends],
+            tp=tp,
+            fp=fp,
+            n_pos=int(tp[-1]),
+            n_neg=int(fp[-1]),
+        )
+
+    @property
+    def fn(self) -> np.ndarray:
+        return self.n_pos - self.tp
+
+    @property
+    def tn(self) -> np.ndarray:
+        return self.n_neg - self.fp
+
+    @property
+    def precision(self) -> np.ndarray:
+        return _safe_divide(self.tp, self.tp + self.fp)
+
+    @property
+    def recall(self) -> np.ndarray:
+        return _safe_divide(self.tp, np.full_like(self.tp, self.n_pos))
+
+    @property
+    def f1(self) -> np.ndarray:
+        return _safe_divide(2 * self.tp, 2 * self.tp + self.fp + self.fn)
+
+    def cell_counts(self) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Positifs / négatifs par groupe de scores égaux (ordre décroissant).
+        """
+        return np.diff(self.tp, prepend=0), np.diff(self.fp, prepend=0)
+
+    def auc(self) -> float:
+        """
+        ROC AUC (statistique de Mann-Whitney, ex-aequo comptés pour 1/2),
+        identique à `sklearn.metrics.roc_auc_score`.
+        """
+        if self.n_pos == 0 or self.n_neg == 0:
+            raise ValueError("ROC AUC is undefined with a single class in y_true")
+
+        pos, neg = self.cell_counts()
+        return float(_auc_from_cells(pos[None, :], neg[None, :])[0])
+
+    def index_at(self, threshold: float) -> int:
+        """
+        Nombre de groupes de scores >= threshold (0 : aucune prédiction positive).
+        """
+        return int(np.searchsorted(-self.thresholds, -threshold, side="right"))
+
+    def confusion_at(self, threshold: float) -> dict[str, int]:
+        k = self.index_at(threshold)
+        tp = int(self.tp[k - 1]) if k else 0
+        fp = int(self.fp[k - 1]) if k else 0
+        return {"tp": tp, "fp": fp, "fn": self.n_pos - tp, "tn": self.n_neg - fp}
+
+    def best_f1(self) -> tuple[float, float]:
+        """
+        (seuil, F1) maximisant le F1 sur tous les seuils candidats.
+        """
+        f1 = self.f1
+        i = int(np.argmax(f1))
+        return float(self.thresholds[i]), float(f1[i])
+
+
+def _safe_divide(num: np.ndarray, den: np.ndarray) -> np.ndarray:
+    # Division nulle → 0 (convention zero_division=0 de scikit-learn)
+    num = np.asarray(num, dtype=np.float64)
+    den = np.asarray(den, dtype=np.float64)
+    return np.divide(num, den, out=np.zeros(np.broadcast(num, den).shape), where=den > 0)
+
+
+def _auc_from_cells(pos: np.ndarray, neg: np.ndarray) -> np.ndarray:
+    """
+    AUC par ligne à partir de comptes (lignes × cellules, scores décroissants).
+    NaN pour une ligne sans positif ou sans négatif.
+    """
+    pos = pos.astype(np.float64, copy=False)
+    neg = neg.astype(np.float64, copy=False)
+
+    pos_above = np.cumsum(pos, axis=1) - pos
+    concordant = (neg * (pos_above + 0.5 * pos)).sum(axis=1)
+    pairs = pos.sum(axis=1) * neg.sum(axis=1)
+
+    return np.divide(concordant, pairs, out=np.full(len(pairs), np.nan), where=pairs > 0)
+
+
+def _threshold_metrics(pos: np.ndarray, neg: np.ndarray, k: int) -> dict[str, np.ndarray]:
+    """
+    Précision / rappel / F1 par ligne, prédiction positive = k premières cellules.
+    """
+    tp = pos[:, :k].sum(axis=1).astype(np.float64)
+    fp = neg[:, :k].sum(axis=1).astype(np.float64)
+    fn = pos.sum(axis=1) - tp
+
+    return {
+        "precision": _safe_divide(tp, tp + fp),
+        "recall": _safe_divide(tp, tp + fn),
+        "f1": _safe_divide(2 * tp, 2 * tp + fp + fn),
+    }
+
+
+def _merge_cells(
+    pos: np.ndarray,
+    neg: np.ndarray,
+    k: int,
+    max_cells: int,
+) -> tuple[np.ndarray, np.ndarray, int]:
+    """
+    Regroupe les cellules contiguës en ~max_cells groupes d'effectifs
+    comparables, en conservant une frontière au seuil évalué (cellule k).
+    """
+    if len(pos) <= max_cells:
+        return pos, neg, k
+
+    cumulative = np.cumsum(pos + neg)
+    quantiles = np.linspace(0, cumulative[-1], max_cells + 1)[1:-1]
+    starts = np.unique(np.r_[0, np.searchsorted(cumulative, quantiles, side="right"), k])
+    starts = starts[starts < len(pos)]
+
+    merged_k = int(np.searchsorted(starts, k))
+    return np.add.reduceat(pos, starts), np.add.reduceat(neg, starts), merged_k
+
+
+def bootstrap_confidence_intervals(
+    y_true: Sequence[int] | None = None,
+    y_score: Sequence[float] | None = None,
+    threshold: float = DEFAULT_THRESHOLD,
+    n_resamples: int = 1000,
+    confidence: float = 0.95,
+    seed: int = 42,
+    max_cells: int = DEFAULT_BOOTSTRAP_CELLS,
+    sweep: ThresholdSweep | None = None,
+) -> dict[str, dict[str, float]]:
+    """
+    Intervalles de confiance bootstrap (percentile) de l'AUC et de
+    précision / rappel / F1 au seuil donné.
+
+    Les métriques ne dépendent que des effectifs (positifs, négatifs)
+    par groupe de scores : un rééchantillonnage avec remise de n lignes
+    est un tirage multinomial de ces effectifs. Tous les rééchantillons
+    forment une seule matrice (rééchantillons × cellules), évaluée par
+    cumsum vectorisés, sans boucle Python par rééchantillon.
+
+    Au-delà de `max_cells` scores distincts, les cellules contiguës sont
+    regroupées (frontière conservée au seuil) ; le biais d'AUC dû aux
+    ex-aequo ainsi créés est retiré en centrant la distribution bootstrap
+    sur l'estimation exacte.
+    """
+    if sweep is None:
+        sweep = ThresholdSweep.from_scores(y_true, y_score)
+
+    exact_pos, exact_neg = sweep.cell_counts()
+    exact_k = sweep.index_at(threshold)
+    pos, neg, k = _merge_cells(exact_pos, exact_neg, exact_k, max_cells)
+
+    n_cells = len(pos)
+    n = sweep.n_pos + sweep.n_neg
+    pvals = np.r_[pos, neg] / n
+
+    # Estimations exactes, et AUC sur cellules regroupées (biais à retirer)
+    exact = {"auc": float(_auc_from_cells(exact_pos[None, :], exact_neg[None, :])[0])}
+    exact.update({
+        name: float(values[0])
+        for name, values in _threshold_metrics(exact_pos[None, :], exact_neg[None, :], exact_k).items()
+    })
+    binned_auc = float(_auc_from_cells(pos[None, :], neg[None, :])[0])
+
+    rng = np.random.default_rng(seed)
+    batch_size = max(1, _MAX_BATCH_ELEMENTS // (2 * n_cells))
+    replicates: dict[str, list[np.ndarray]] = {name: [] for name in exact}
+
+    for start in range(0, n_resamples, batch_size):
+        size = min(batch_size, n_resamples - start)
+        counts = rng.multinomial(n, pvals, size=size)
+        boot_pos, boot_neg = counts[:, :n_cells], counts[:, n_cells:]
+
+        replicates["auc"].append(_auc_from_cells(boot_pos, boot_neg) - binned_auc + exact["auc"])
+        for name, values in _threshold_metrics(boot_pos, boot_neg, k).items():
+            replicates[name].append(values)
+
+    alpha = (1.0 - confidence) / 2
+    intervals = {}
+    for name, values in replicates.items():
+        values = np.concatenate(values)
+        lower, upper = np.nanquantile(values, [alpha, 1.0 - alpha])
+        intervals[name] = {
+            "estimate": float(exact[name]),
+            "lower": float(lower),
+            "upper": float(upper),
+        }
+
+    return intervals
+
+
+def evaluate_predictions(
+    y_true: Sequence[int],
+    y_score: Sequence[float],
+    threshold: float = DEFAULT_THRESHOLD,
+    n_resamples: int = 0,
+    confidence: float = 0.95,
+    seed: int = 42,
+) -> dict[str, Any]:
+    """
+    Évaluation complète d'un jeu de prédictions, en un seul tri :
+
+    - AUC
+    - précision / rappel / F1 / matrice de confusion au seuil donné
+    - seuil maximisant le F1
+    - intervalles de confiance bootstrap si `n_resamples > 0`
+
+    `confusion_matrix` suit la convention scikit-learn [[tn, fp], [fn, tp]].
+    """
+    sweep = ThresholdSweep.from_scores(y_true, y_score)
+    confusion = sweep.confusion_at(threshold)
+    tp, fp, fn, tn = confusion["tp"], confusion["fp"], confusion["fn"], confusion["tn"]
+    best_threshold, best_f1 = sweep.best_f1()
+
+    evaluation: dict[str, Any] = {
+        "n_samples": sweep.n_pos + sweep.n_neg,
+        "n_positive": sweep.n_pos,
+        "auc": sweep.auc(),
+        "threshold": threshold,
+        "precision": tp / (tp + fp) if tp + fp else 0.0,
+        "recall": tp / (tp + fn) if tp + fn else 0.0,
+        "f1": 2 * tp / (2 * tp + fp + fn) if tp + fp + fn else 0.0,
+        "confusion_matrix": [[tn, fp], [fn, tp]],
+        "best_f1_threshold": best_threshold,
+        "best_f1": best_f1,
+    }
+
+    if n_resamples > 0:
+        evaluation["confidence_intervals"] = bootstrap_confidence_intervals(
+            threshold=threshold,
+            n_resamples=n_resamples,
+            confidence=confidence,
+            seed=seed,
+            sweep=sweep,
+        )
+
+    return evaluation
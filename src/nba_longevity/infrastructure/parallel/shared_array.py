@@ -0,0 +1,63 @@
+from dataclasses import dataclass
+from multiprocessing.shared_memory import SharedMemory
+
+import numpy as np
+
+
+@dataclass(frozen=True)
+class SharedArrayHandle:
+    """
+    Référence picklable vers un tableau NumPy en mémoire partagée.
+
+    Seuls le nom du segment, la forme et le dtype traversent la frontière
+    de processus : les données ne sont jamais sérialisées.
+    """
+
+    name: str
+    shape: tuple[int, ...]
+    dtype: str
+
+    def attach(self) -> tuple[SharedMemory, np.ndarray]:
+        """
+        Ouvre le segment dans le processus courant (vue zéro-copie, lecture seule).
+        Le SharedMemory retourné doit rester référencé tant que la vue est utilisée.
+        """
+        shm = SharedMemory(name=self.name)
+        array = np.ndarray(self.shape, dtype=np.dtype(self.dtype), buffer=shm.buf)
+        array.flags.writeable = False
+        return shm, array
+
+
+class SharedArray:
+    """
+    Copie unique d'un tableau NumPy dans un segment de mémoire partagée,
+    détenue par le processus parent (création / libération).
+    """
+
+    def __init__(self, array: np.ndarray):
+        array = np.ascontiguousarray(array)
+        # Un segment de taille nulle est refusé par l'OS
+        self._shm = SharedMemory(create=True, size=max(array.nbytes, 1))
+        self.array = np.ndarray(array.shape, dtype=array.dtype, buffer=self._shm.buf)
+        self.array[...] = array
+
+        self.handle = SharedArrayHandle(
+            name=self._shm.name,
+            shape=tuple(array.shape),
+            dtype=array.dtype.str,
+        )
+
+    def close(self) -> None:
+        if self._shm is None:
+            return
+        # La vue doit être libérée avant de fermer le buffer
+        del self.array
+        self._shm.close()
+        self._shm.unlink()
+        self._shm = None
+
+    def __enter__(self) -> "SharedArray":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
@@ -0,0 +1,179 @@
+import hashlib
+import queue
+import threading
+import time
+from typing import Any, Iterable
+
+import numpy as np
+
+from nba_longevity.application.bootstrap import app_logger
+from nba_longevity.domain.ports.prediction_log_port import PredictionLogPort, PredictionRecord
+
+
+def feature_vector_hash(vector: np.ndarray) -> str:
+    """
+    Empreinte d'un vecteur de features (float32, ordre du modèle).
+    """
+    data = np.ascontiguousarray(vector, dtype=np.float32).tobytes()
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+class BatchedPredictionLogger:
+    """
+    Journalisation asynchrone des prédictions, par lots.
+
+    - `log` dépose la trace dans une file bornée, sans jamais bloquer :
+      file pleine → trace abandonnée et comptée (`dropped`), le scoring
+      n'attend jamais le stockage
+    - un thread d'écriture vide la file par lots de `batch_size` traces
+      (ou après `flush_interval_ms`), une transaction par lot
+    - un lot en échec est compté (`failed`) puis abandonné : pas de
+      nouvelle tentative qui ferait grossir la file
+
+    `close` écrit les traces encore en file avant de fermer le stockage.
+    """
+
+    def __init__(
+        self,
+        store: PredictionLogPort,
+        max_queue_size: int = 10_000,
+        batch_size: int = 500,
+        flush_interval_ms: float = 200.0,
+    ):
+        if max_queue_size <= 0:
+            raise ValueError(f"max_queue_size doit être > 0 : {max_queue_size}")
+        if batch_size <= 0:
+            raise ValueError(f"batch_size doit être > 0 : {batch_size}")
+
+        self.store = store
+        self.max_queue_size = max_queue_size
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval_ms / 1000
+
+        self._queue: queue.Queue[PredictionRecord] = queue.Queue(maxsize=max_queue_size)
+        self._stopping = threading.Event()
+        self._thread: threading.Thread | None = None
+
+        self._lock = threading.Lock()
+        self._enqueued = 0
+        self._dropped = 0
+        self._written = 0
+        self._failed = 0
+        self._batches = 0
+        self._last_flush_ms = 0.0
+
+    # ------------------------------------------------------------------
+    # Cycle de vie
+    # ------------------------------------------------------------------
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._stopping.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="prediction-log-writer", daemon=True
+        )
+        self._thread.start()
+
+    def close(self, timeout: float = 10.0) -> None:
+        if self._thread is not None:
+            self._stopping.set()
+            self._thread.join(timeout)
+            if self._thread.is_alive():
+                app_logger.warning(
+                    f"Prediction log writer still running after {timeout}s | "
+                    f"pending={self._queue.qsize()}"
+                )
+            self._thread = None
+        self.store.close()
+
+        stats = self.stats()
+        app_logger.info(
+            f"🗃️ Prediction log closed | written={stats['written']} | "
+            f"dropped={stats['dropped']} | failed={stats['failed']}"
+        )
+
+    # ------------------------------------------------------------------
+    # Producteurs (chemin de scoring)
+    # ------------------------------------------------------------------
+    def log(self, record: PredictionRecord) -> bool:
+        """
+        Dépose une trace ; False si la file est pleine (trace abandonnée).
+        """
+        try:
+            self._queue.put_nowait(record)
+        except queue.Full:
+            with self._lock:
+                self._dropped += 1
+            return False
+
+        with self._lock:
+            self._enqueued += 1
+        return True
+
+    def log_many(self, records: Iterable[PredictionRecord]) -> int:
+        """
+        Dépose plusieurs traces ; retourne le nombre de traces acceptées.
+        """
+        return sum(self.log(record) for record in records)
+
+    # ------------------------------------------------------------------
+    # Thread d'écriture
+    # ------------------------------------------------------------------
+    def _run(self) -> None:
+        while True:
+            batch = self._next_batch()
+            if batch:
+                self._flush(batch)
+            elif self._stopping.is_set():
+                return
+
+    def _next_batch(self) -> list[PredictionRecord]:
+        try:
+            batch = [self._queue.get(timeout=self.flush_interval)]
+        except queue.Empty:
+            return []
+
+        # Complète le lot jusqu'à batch_size ou jusqu'à l'échéance
+        deadline = time.monotonic() + self.flush_interval
+        while len(batch) < self.batch_size:
+            remaining = 0.0 if self._stopping.is_set() else deadline - time.monotonic()
+            try:
+                if remaining > 0:
+                    batch.append(self._queue.get(timeout=remaining))
+                else:
+                    batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+
+        return batch
+
+    def _flush(self, batch: list[PredictionRecord]) -> None:
+        start = time.perf_counter()
+        try:
+            self.store.write_batch(batch)
+        except Exception as exc:
+            with self._lock:
+                self._failed += len(batch)
+            app_logger.warning(f"Prediction log batch failed | size={len(batch)} | {exc}")
+            return
+
+        with self._lock:
+            self._written += len(batch)
+            self._batches += 1
+            self._last_flush_ms = (time.perf_counter() - start) * 1000
+
+    # ------------------------------------------------------------------
+    # Métriques
+    # ------------------------------------------------------------------
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "enqueued": self._enqueued,
+                "written": self._written,
+                "dropped": self._dropped,
+                "failed": self._failed,
+                "batches": self._batches,
+                "queue_depth": self._queue.qsize(),
+                "queue_capacity": self.max_queue_size,
+                "last_flush_ms": self._last_flush_ms,
+            }
@@ -0,0 +1,48 @@
+from pathlib import Path
+
+from nba_longevity.application.bootstrap import app_logger
+from nba_longevity.domain.ports.prediction_log_port import PredictionLogPort
+from nba_longevity.infrastructure.config.settings import InfraConfig
+from nba_longevity.infrastructure.prediction_logging.batched_prediction_logger import (
+    BatchedPredictionLogger,
+)
+
+
+def build_prediction_log_store(config: InfraConfig) -> PredictionLogPort:
+    """
+    Stockage des traces de prédiction : SQLite local si
+    PREDICTION_LOG_DATABASE_URL n'est pas défini, ou URL `sqlite:///<chemin>`.
+    """
+    from nba_longevity.infrastructure.prediction_logging.sqlite_prediction_log import (
+        SQLitePredictionLog,
+    )
+
+    url = config.prediction_logging.database_url
+    if url is None:
+        path = config.paths.artifacts_dir / "prediction_logs" / "predictions.sqlite"
+        app_logger.debug(f"PREDICTION_LOG_DATABASE_URL not set: SQLite prediction log at {path}")
+        return SQLitePredictionLog(path)
+
+    if url.startswith("sqlite:///"):
+        return SQLitePredictionLog(Path(url.removeprefix("sqlite:///")))
+
+    raise ValueError(
+        f"Unsupported prediction log database: {url.split(':', 1)[0]} "
+        f"(available: sqlite:///<path>)"
+    )
+
+
+def build_prediction_logger(config: InfraConfig) -> BatchedPredictionLogger | None:
+    """
+    Logger asynchrone configuré (None si la journalisation est désactivée).
+    """
+    settings = config.prediction_logging
+    if not settings.enabled:
+        return None
+
+    return BatchedPredictionLogger(
+        build_prediction_log_store(config),
+        max_queue_size=settings.max_queue_size,
+        batch_size=settings.batch_size,
+        flush_interval_ms=settings.flush_interval_ms,
+    )
@@ -0,0 +1,65 @@
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Sequence
+
+from nba_longevity.domain.ports.prediction_log_port import PredictionLogPort, PredictionRecord
+
+
+# Même schéma que la table Postgres cible
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS prediction_log (
+    id           INTEGER PRIMARY KEY AUTOINCREMENT,
+    logged_at    REAL    NOT NULL,
+    player_id    TEXT,
+    feature_hash TEXT    NOT NULL,
+    model_hash   TEXT    NOT NULL,
+    probability  REAL    NOT NULL,
+    latency_ms   REAL    NOT NULL
+)
+"""
+
+_INSERT = """
+INSERT INTO prediction_log
+    (logged_at, player_id, feature_hash, model_hash, probability, latency_ms)
+VALUES (?, ?, ?, ?, ?, ?)
+"""
+
+
+class SQLitePredictionLog(PredictionLogPort):
+    """
+    Stockage SQLite des traces de prédiction (substitut local de Postgres).
+
+    - un lot = une transaction (`executemany`), pas un commit par ligne
+    - journal WAL : les lectures (analyse, dashboards) ne bloquent pas
+      l'écriture
+    """
+
+    def __init__(self, path: str | Path):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        # Connexion utilisée par le thread d'écriture, créée ici
+        self._connection = sqlite3.connect(self.path, check_same_thread=False)
+        self._lock = threading.Lock()
+
+        with self._lock, self._connection:
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute("PRAGMA synchronous=NORMAL")
+            self._connection.execute(_SCHEMA)
+
+    def write_batch(self, records: Sequence[PredictionRecord]) -> None:
+        rows = [
+            (r.logged_at, r.player_id, r.feature_hash, r.model_hash, r.probability, r.latency_ms)
+            for r in records
+        ]
+        with self._lock, self._connection:
+            self._connection.executemany(_INSERT, rows)
+
+    def count(self) -> int:
+        with self._lock:
+            return self._connection.execute("SELECT COUNT(*) FROM prediction_log").fetchone()[0]
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
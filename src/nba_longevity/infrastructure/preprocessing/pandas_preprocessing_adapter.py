@@ -1,36 +1,76 @@
-from pandas import DataFrame, to_numeric
+from typing import Mapping, Sequence
+from pandas import Series, to_numeric
 from nba_longevity.domain.ports.preprocessing_port import PreprocessingPort
 from nba_longevity.domain.dataset.dataset import Dataset
-from nba_longevity.infrastructure.dataset.pandas_dataset import PandasDataset
+from nba_longevity.infrastructure.dataset.dtype_plan import DtypePlan
+from nba_longevity.infrastructure.dataset.pandas_dataset import PandasDataset, to_pandas
 from nba_longevity.domain.preprocessing.preprocessing_rules import (
-    NUMERIC_COLUMNS, TARGET_COLUMN, ID_COLUMN
+    NUMERIC_COLUMNS, TARGET_COLUMN, ID_COLUMN, FILTER_COLUMN
 )
 
 
 class PandasPreprocessingAdapter(PreprocessingPort):
     """
     Nettoyage et préparation des données (Pandas).
+
+    Les médianes d'imputation sont calculées sur le dataset (entraînement)
+    ou injectées (scoring, à partir de l'artefact du modèle). Les valeurs
+    effectivement utilisées sont exposées dans `self.medians`.
+
+    `dtype_plan` : types conservés en sortie (float32, petits entiers...) ;
+    sans plan, types historiques (float64 / int64).
+
+    `raw_columns` : colonnes numériques à nettoyer quand seules les
+    colonnes utiles au feature space ont été chargées (voir
+    `resolve_feature_space`) ; toutes les NUMERIC_COLUMNS si None.
     """
 
+    def __init__(
+        self,
+        medians: Mapping[str, float] | None = None,
+        dtype_plan: DtypePlan | None = None,
+        raw_columns: Sequence[str] | None = None,
+    ):
+        self._fixed_medians = dict(medians) if medians is not None else None
+        self.medians: dict[str, float] | None = self._fixed_medians
+        self.dtype_plan = dtype_plan or DtypePlan.wide()
+        self.numeric_columns = [
+            col for col in NUMERIC_COLUMNS
+            if raw_columns is None or col in raw_columns
+        ]
+        if FILTER_COLUMN not in self.numeric_columns:
+            raise ValueError(f"La colonne du filtre {FILTER_COLUMN} doit être chargée")
+
     def preprocess(self, dataset: Dataset) -> Dataset:
-        df = DataFrame(list(dataset))
+        df = to_pandas(dataset)
 
         # 1. Cast explicite
-        for col in NUMERIC_COLUMNS:
+        for col in self.numeric_columns:
             df[col] = to_numeric(df[col], errors="coerce")
+        df = self.dtype_plan.cast_loaded(df)
 
-        df[TARGET_COLUMN] = df[TARGET_COLUMN].astype(int)
+        df[TARGET_COLUMN] = df[TARGET_COLUMN].astype(
+            self.dtype_plan.clean_dtypes.get(TARGET_COLUMN, int)
+        )
 
         # 2. Gestion des NaN
         # → médiane (robuste, dataset petit)
-        df[NUMERIC_COLUMNS] = df[NUMERIC_COLUMNS].fillna(
-            df[NUMERIC_COLUMNS].median()
+        if self._fixed_medians is None:
+            self.medians = self.dtype_plan.imputation_values(
+                df[self.numeric_columns].median().to_dict()
+            )
+
+        df[self.numeric_columns] = df[self.numeric_columns].fillna(
+            Series(self.dtype_plan.imputation_values(self.medians))
         )
 
         # 3. Drop lignes sans target
         df = df.dropna(subset=[TARGET_COLUMN])
 
         # 4. Sécurité : aucune minute négative / nulle
-        df = df[df["MinutesPerGame"] > 0]
+        df = df[df[FILTER_COLUMN] > 0]
+
+        # 5. Types définitifs (fillna élargit float32 → float64)
+        df = self.dtype_plan.cast_clean(df)
 
         return PandasDataset(df)
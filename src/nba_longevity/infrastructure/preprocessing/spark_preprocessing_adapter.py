@@ -1,24 +1,83 @@
-from domain.ports.preprocessing_port import PreprocessingPort
-from infrastructure.dataset.spark_dataset import SparkDataset
+from typing import Mapping
+
+from pyspark.sql import functions as F
+
+from nba_longevity.application.bootstrap import app_logger
+from nba_longevity.domain.dataset.dataset import Dataset
+from nba_longevity.domain.ports.preprocessing_port import PreprocessingPort
+from nba_longevity.infrastructure.dataset.spark_dataset import SparkDataset
+from nba_longevity.domain.preprocessing.preprocessing_rules import (
+    NUMERIC_COLUMNS, TARGET_COLUMN
+)
 
 
 class SparkPreprocessingAdapter(PreprocessingPort):
     """
-    Preprocessing distribué avec Spark.
+    Preprocessing distribué avec Spark (mêmes règles que PandasPreprocessingAdapter).
+
+    - cast explicite en double (valeur non numérique → null, comme
+      `to_numeric(errors="coerce")`), cible en int
+    - médianes d'imputation par quantiles approchés (`approxQuantile`,
+      une seule passe sur toutes les colonnes), ou injectées (scoring)
+    - suppression des lignes sans cible, filtre minutes > 0
+
+    `target_column=None` (scoring) : aucune cible attendue ; pas de cast
+    ni de filtre sur la cible, les lignes sans label sont conservées.
+
+    Avec `relative_error=0` les médianes sont exactes à l'interpolation
+    près (Spark retourne un élément observé, Pandas la moyenne des deux
+    valeurs centrales sur un effectif pair). Avec des médianes injectées,
+    la sortie est identique à celle du backend Pandas.
     """
 
-    def preprocess(self, dataset: SparkDataset) -> SparkDataset:
-        # Ici on sait que c'est SparkDataset
-        # 1. flux logique → Spark DataFrame (infra seulement)
-        df = dataset._df
+    def __init__(
+        self,
+        medians: Mapping[str, float] | None = None,
+        relative_error: float = 1e-4,
+        target_column: str | None = TARGET_COLUMN,
+    ):
+        self._fixed_medians = dict(medians) if medians is not None else None
+        self.medians: dict[str, float] | None = self._fixed_medians
+        self.relative_error = relative_error
+        self.target_column = target_column
 
-        # 2. règles métier (exemples)
-        df = df.dropna()
+    def preprocess(self, dataset: Dataset) -> Dataset:
+        if not isinstance(dataset, SparkDataset):
+            raise TypeError(f"SparkPreprocessingAdapter expects a SparkDataset, got {type(dataset)}")
 
-        df = (
-            df.withColumn("GP", df["GP"].cast("int"))
-              .withColumn("MIN", df["MIN"].cast("double"))
-              .withColumn("PTS", df["PTS"].cast("double"))
+        df = dataset._df
+
+        # 1. Cast explicite (NaN → null : traités comme valeurs manquantes)
+        casts = {}
+        for col in NUMERIC_COLUMNS:
+            value = F.col(col).cast("double")
+            casts[col] = F.when(F.isnan(value), F.lit(None)).otherwise(value)
+        df = df.select(
+            *[casts[c].alias(c) if c in casts else F.col(c) for c in df.columns]
         )
-        # 3. retour au flux logique
+        if self.target_column is not None:
+            df = df.withColumn(self.target_column, F.col(self.target_column).cast("int"))
+
+        # 2. Gestion des NaN → médiane (quantiles approchés, nulls ignorés)
+        if self._fixed_medians is None:
+            quantiles = df.approxQuantile(NUMERIC_COLUMNS, [0.5], self.relative_error)
+            self.medians = {
+                col: float(q[0]) if q else float("nan")
+                for col, q in zip(NUMERIC_COLUMNS, quantiles)
+            }
+            app_logger.debug(f"Médianes approchées (Spark) : {self.medians}")
+
+        fill_values = {
+            col: value for col, value in self.medians.items()
+            if value == value  # colonne entièrement vide : rien à imputer
+        }
+        df = df.fillna(fill_values)
+
+        # 3. Drop lignes sans target (entraînement uniquement)
+        if self.target_column is not None:
+            df = df.dropna(subset=[self.target_column])
+
+        # 4. Sécurité : aucune minute négative / nulle
+        df = df.filter(F.col("MinutesPerGame") > 0)
+
         return SparkDataset(df)
@@ -0,0 +1,169 @@
+"""
+STREAMING PREPROCESSING (CHUNKED, CONSTANT MEMORY)
+==================================================
+
+Two passes over a chunked source, for datasets that do not fit in RAM:
+
+1. Sketch pass : per-column t-digest sketches → approximate medians
+2. Transform pass : chunk by chunk, median imputation + filtering
+   (PandasPreprocessingAdapter with fixed medians) and feature engineering
+   (PandasFeatureEngineeringAdapter)
+
+Reading / parsing the next chunk is prefetched in a background thread
+and overlaps the computation on the current one. Memory is bounded by
+`chunksize × (prefetch + 1)` rows plus the sketches, independently of the
+total row count.
+
+Usage
+-----
+python -m nba_longevity.infrastructure.preprocessing.streaming_preprocessing \\
+    data/raw/nba_players.csv data/processed/features.parquet --feature-space extended
+"""
+
+import argparse
+from pathlib import Path
+from typing import Iterator, Sequence
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+from pandas import to_numeric
+
+from nba_longevity.application.bootstrap import app_logger
+from nba_longevity.domain.preprocessing.preprocessing_rules import NUMERIC_COLUMNS, TARGET_COLUMN
+from nba_longevity.domain.features.feature_spaces import (
+    FEATURE_SPACE_MINIMAL,
+    FEATURE_SPACE_EXTENDED,
+)
+from nba_longevity.infrastructure.dataset.csv_dataset_loader import CsvDatasetLoader
+from nba_longevity.infrastructure.dataset.pandas_dataset import PandasDataset, to_pandas
+from nba_longevity.infrastructure.dataset.prefetch import prefetch
+from nba_longevity.infrastructure.feature_engineering.pandas_feature_engineering_adapter import (
+    PandasFeatureEngineeringAdapter,
+)
+from nba_longevity.infrastructure.preprocessing.pandas_preprocessing_adapter import (
+    PandasPreprocessingAdapter,
+)
+from nba_longevity.infrastructure.preprocessing.quantile_sketch import TDigest
+
+
+class StreamingPreprocessor:
+    """
+    Preprocessing + feature engineering en streaming (backend Pandas).
+    """
+
+    def __init__(
+        self,
+        loader: CsvDatasetLoader,
+        chunksize: int = 100_000,
+        compression: float = 500.0,
+        prefetch_depth: int = 2,
+    ):
+        self.loader = loader
+        self.chunksize = chunksize
+        self.compression = compression
+        self.prefetch_depth = prefetch_depth
+        self.medians: dict[str, float] | None = None
+
+    def _chunks(self) -> Iterator[PandasDataset]:
+        return prefetch(self.loader.iter_chunks(self.chunksize), self.prefetch_depth)
+
+    def fit(self) -> dict[str, float]:
+        """
+        Passe 1 : sketches de quantiles par colonne → médianes approchées.
+        """
+        app_logger.info("🧮 Streaming pass 1/2 : quantile sketches")
+
+        sketches = {col: TDigest(self.compression) for col in NUMERIC_COLUMNS}
+        n_rows = 0
+        for chunk in self._chunks():
+            df = to_pandas(chunk)
+            n_rows += len(df)
+            for col in NUMERIC_COLUMNS:
+                sketches[col].update(to_numeric(df[col], errors="coerce").to_numpy())
+
+        self.medians = {col: sketch.median() for col, sketch in sketches.items()}
+
+        app_logger.info(f"Sketch pass done | rows={n_rows}")
+        app_logger.debug(f"Médianes approchées : {self.medians}")
+
+        return self.medians
+
+    def iter_processed(self) -> Iterator[PandasDataset]:
+        """
+        Passe 2 : imputation, filtrage et feature engineering chunk par chunk.
+        """
+        if self.medians is None:
+            self.fit()
+
+        app_logger.info("🧹 Streaming pass 2/2 : preprocessing + feature engineering")
+
+        preprocessor = PandasPreprocessingAdapter(medians=self.medians)
+        feature_engineer = PandasFeatureEngineeringAdapter()
+
+        for chunk in self._chunks():
+            yield feature_engineer.add_features(preprocessor.preprocess(chunk))
+
+    def write_features(
+        self,
+        output_path: str | Path,
+        feature_space: Sequence[str],
+        target_column: str = TARGET_COLUMN,
+    ) -> int:
+        """
+        Écrit la projection (features + cible) en Parquet, chunk par chunk.
+        Retourne le nombre de lignes écrites.
+        """
+        output_path = Path(output_path)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        columns = list(feature_space) + [target_column]
+
+        # Schéma explicite : les dtypes inférés varient d'un chunk à l'autre
+        # (ex. GamesPlayed entier, puis imputé par une médiane non entière)
+        schema = pa.schema(
+            [pa.field(col, pa.float64()) for col in feature_space]
+            + [pa.field(target_column, pa.int64())]
+        )
+
+        writer = None
+        n_rows = 0
+        try:
+            for chunk in self.iter_processed():
+                table = pa.Table.from_pandas(
+                    to_pandas(chunk)[columns], preserve_index=False
+                ).cast(schema)
+                if writer is None:
+                    writer = pq.ParquetWriter(output_path, schema)
+                writer.write_table(table)
+                n_rows += table.num_rows
+        finally:
+            if writer is not None:
+                writer.close()
+
+        app_logger.info(f"Features written | path={output_path} | rows={n_rows}")
+
+        return n_rows
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Streaming preprocessing + feature engineering")
+    parser.add_argument("csv_path")
+    parser.add_argument("output_path")
+    parser.add_argument("--feature-space", default="minimal", choices=["minimal", "extended"])
+    parser.add_argument("--chunksize", type=int, default=100_000)
+    parser.add_argument("--compression", type=float, default=500.0)
+    args = parser.parse_args()
+
+    feature_space = (
+        FEATURE_SPACE_EXTENDED if args.feature_space == "extended" else FEATURE_SPACE_MINIMAL
+    )
+
+    streaming = StreamingPreprocessor(
+        CsvDatasetLoader(args.csv_path),
+        chunksize=args.chunksize,
+        compression=args.compression,
+    )
+    streaming.write_features(args.output_path, feature_space)
+
+
+if __name__ == "__main__":
+    main()
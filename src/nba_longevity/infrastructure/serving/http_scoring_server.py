@@ -0,0 +1,452 @@
+"""
+LOCAL HTTP SCORING SERVICE
+==========================
+
+Responsibilities
+----------------
+- Serve predictions of a persisted model over HTTP (asyncio, stdlib only)
+- Coalesce concurrent single-player requests into micro-batches
+- Expose p50/p99 latency and batch-size histograms
+- Cache probabilities of players scored again (LRU, memory cap, TTL)
+- Log every prediction asynchronously (bounded queue, batched writes):
+  logging never blocks a scoring call
+- Optionally score players by id: features read from the memory-mapped
+  player feature store (no feature recomputation, no pandas); the
+  store must have been imputed with the served model's medians
+
+Endpoints
+---------
+POST /predict   body = {"<feature>": value, ...} ou liste de ces objets
+                (avec --feature-store : {"PlayerName": "..."} suffit)
+GET  /metrics   métriques de latence / batchs / cache / journal des prédictions
+GET  /health    état du service et hash du modèle
+
+Usage
+-----
+python -m nba_longevity.infrastructure.serving.http_scoring_server \\
+    --model-type xgboost --port 8000 --max-batch-size 64 --max-wait-ms 2
+python -m nba_longevity.infrastructure.serving.http_scoring_server \\
+    --model-type xgboost --backend compiled   # NumPy trees, no model library
+python -m nba_longevity.infrastructure.serving.http_scoring_server \\
+    --model-type xgboost --feature-store artifacts/feature_store
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import time
+from typing import Any
+
+import numpy as np
+
+from nba_longevity.application.bootstrap import app_logger, get_config
+from nba_longevity.application.serving.micro_batcher import MicroBatcher
+from nba_longevity.domain.features.feature_graph import required_raw_columns
+from nba_longevity.domain.ports.feature_store_port import PlayerFeatureStorePort
+from nba_longevity.domain.ports.prediction_log_port import PredictionRecord
+from nba_longevity.domain.preprocessing.preprocessing_rules import ID_COLUMN
+from nba_longevity.infrastructure.artifacts.model_artifact_store import ModelArtifactStore
+from nba_longevity.infrastructure.inference.predictor_factory import build_predictor
+from nba_longevity.infrastructure.inference.prediction_cache import CachingPredictor, PredictionCache
+from nba_longevity.infrastructure.prediction_logging.batched_prediction_logger import (
+    BatchedPredictionLogger,
+    feature_vector_hash,
+)
+from nba_longevity.infrastructure.serving.serving_metrics import ServingMetrics
+
+
+MAX_BODY_BYTES = 1_048_576
+
+REASONS = {
+    200: "OK",
+    400: "Bad Request",
+    404: "Not Found",
+    405: "Method Not Allowed",
+    413: "Payload Too Large",
+    500: "Internal Server Error",
+}
+
+
+class BadRequest(ValueError):
+    """
+    Requête client invalide (→ HTTP 400).
+    """
+
+
+class PlayerNotFound(LookupError):
+    """
+    Joueur absent du feature store (→ HTTP 404).
+    """
+
+
+class ScoringServer:
+    """
+    Service de scoring HTTP local au-dessus d'un prédicteur.
+    """
+
+    def __init__(
+        self,
+        predictor,
+        model_info: dict[str, Any] | None = None,
+        host: str = "127.0.0.1",
+        port: int = 8000,
+        max_batch_size: int = 64,
+        max_wait_ms: float = 2.0,
+        prediction_logger: BatchedPredictionLogger | None = None,
+        feature_store: PlayerFeatureStorePort | None = None,
+    ):
+        self.predictor = predictor
+        self.feature_columns = list(predictor.feature_columns)
+        self.model_info = dict(model_info or {})
+        self.host = host
+        self.port = port
+
+        self.metrics = ServingMetrics()
+        self.batcher = MicroBatcher(
+            predict_batch=predictor.predict_matrix,
+            max_batch_size=max_batch_size,
+            max_wait_ms=max_wait_ms,
+            on_batch=self.metrics.observe_batch,
+        )
+        self.prediction_logger = prediction_logger
+
+        if feature_store is not None:
+            missing = [col for col in self.feature_columns if col not in feature_store.feature_columns]
+            if missing:
+                raise ValueError(f"Feature store does not materialize model features: {missing}")
+        self.feature_store = feature_store
+        self._server: asyncio.AbstractServer | None = None
+
+    # ------------------------------------------------------------------
+    # Cycle de vie
+    # ------------------------------------------------------------------
+    async def start(self) -> None:
+        if self.prediction_logger is not None:
+            self.prediction_logger.start()
+        await self.batcher.start()
+        self._server = await asyncio.start_server(self._handle_connection, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+
+        app_logger.info(
+            f"🚀 Scoring service listening on http://{self.host}:{self.port} | "
+            f"max_batch_size={self.batcher.max_batch_size} | "
+            f"max_wait_ms={self.batcher.max_wait * 1000}"
+        )
+
+    async def stop(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+        await self.batcher.stop()
+        if self.prediction_logger is not None:
+            # Vidage de la file hors de la boucle asyncio
+            await asyncio.to_thread(self.prediction_logger.close)
+
+    async def serve_forever(self) -> None:
+        await self.start()
+        try:
+            await self._server.serve_forever()
+        finally:
+            await self.stop()
+
+    # ------------------------------------------------------------------
+    # HTTP
+    # ------------------------------------------------------------------
+    async def _handle_connection(
+        self,
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+    ) -> None:
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+
+                try:
+                    method, path, version = request_line.decode("latin-1").split()
+                except ValueError:
+                    await self._respond(writer, 400, {"error": "malformed request line"}, False)
+                    break
+
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+
+                keep_alive = (
+                    headers.get("connection", "").lower() != "close"
+                    and version == "HTTP/1.1"
+                )
+
+                try:
+                    length = int(headers.get("content-length", "0") or 0)
+                except ValueError:
+                    length = -1
+                if length < 0:
+                    await self._respond(writer, 400, {"error": "invalid content-length"}, False)
+                    break
+                if length > MAX_BODY_BYTES:
+                    await self._respond(writer, 413, {"error": "body too large"}, False)
+                    break
+                body = await reader.readexactly(length) if length else b""
+
+                status, payload = await self._dispatch(method, path, body)
+                await self._respond(writer, status, payload, keep_alive)
+                if not keep_alive:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    async def _respond(
+        self,
+        writer: asyncio.StreamWriter,
+        status: int,
+        payload: Any,
+        keep_alive: bool,
+    ) -> None:
+        body = json.dumps(payload).encode()
+        head = (
+            f"HTTP/1.1 {status} {REASONS.get(status, '')}\r\n"
+            f"Content-Type: application/json\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n"
+        )
+        writer.write(head.encode("latin-1") + body)
+        await writer.drain()
+
+    async def _dispatch(self, method: str, path: str, body: bytes) -> tuple[int, Any]:
+        if path == "/predict":
+            if method != "POST":
+                return 405, {"error": "use POST"}
+            return await self._predict(body)
+
+        if path == "/metrics" and method == "GET":
+            metrics = {**self.metrics.snapshot(), "model": self.model_info}
+            if isinstance(self.predictor, CachingPredictor):
+                metrics["prediction_cache"] = self.predictor.cache.stats()
+            if self.prediction_logger is not None:
+                metrics["prediction_log"] = self.prediction_logger.stats()
+            return 200, metrics
+
+        if path == "/health" and method == "GET":
+            return 200, {"status": "ok", "model": self.model_info}
+
+        return 404, {"error": f"unknown route {method} {path}"}
+
+    # ------------------------------------------------------------------
+    # Scoring
+    # ------------------------------------------------------------------
+    async def _predict(self, body: bytes) -> tuple[int, Any]:
+        start = time.perf_counter()
+        try:
+            payload = json.loads(body or b"null")
+            players = payload if isinstance(payload, list) else [payload]
+            vectors = [self._to_vector(player) for player in players]
+
+            proba = await asyncio.gather(*(self.batcher.submit(v) for v in vectors))
+        except (BadRequest, json.JSONDecodeError) as exc:
+            self.metrics.observe_error()
+            return 400, {"error": str(exc)}
+        except PlayerNotFound as exc:
+            self.metrics.observe_error()
+            return 404, {"error": str(exc)}
+        except Exception as exc:
+            self.metrics.observe_error()
+            app_logger.exception(f"Scoring failed: {exc}")
+            return 500, {"error": "scoring failed"}
+
+        latency = time.perf_counter() - start
+        self.metrics.observe_latency(latency)
+
+        if self.prediction_logger is not None:
+            self._log_predictions(players, vectors, proba, latency * 1000)
+
+        results = [{"proba_5yrs": p} for p in proba]
+        response = results if isinstance(payload, list) else results[0]
+        return 200, {"predictions": response, "model_hash": self.model_info.get("hash")}
+
+    def _log_predictions(
+        self,
+        players: list[dict],
+        vectors: list[np.ndarray],
+        proba: list[float],
+        latency_ms: float,
+    ) -> None:
+        model_hash = self.model_info.get("hash") or ""
+        self.prediction_logger.log_many(
+            PredictionRecord(
+                player_id=_player_id(player),
+                feature_hash=feature_vector_hash(vector),
+                model_hash=model_hash,
+                probability=float(p),
+                latency_ms=latency_ms,
+            )
+            for player, vector, p in zip(players, vectors, proba)
+        )
+
+    def _to_vector(self, player: Any) -> np.ndarray:
+        if not isinstance(player, dict):
+            raise BadRequest("each player must be a JSON object of features")
+
+        features = player.get("features", player)
+        if self.feature_store is not None and not any(col in features for col in self.feature_columns):
+            return self._stored_vector(player)
+
+        missing = [col for col in self.feature_columns if col not in features]
+        if missing:
+            raise BadRequest(f"missing features: {missing}")
+
+        try:
+            return np.array(
+                [features[col] for col in self.feature_columns],
+                dtype=np.float32,
+            )
+        except (TypeError, ValueError) as exc:
+            raise BadRequest(f"non-numeric feature value: {exc}") from exc
+
+    def _stored_vector(self, player: dict) -> np.ndarray:
+        player_id = _player_id(player)
+        if player_id is None:
+            raise BadRequest(f"provide either the features or {ID_COLUMN}")
+
+        X, found = self.feature_store.get_many([player_id], self.feature_columns)
+        if not found[0]:
+            raise PlayerNotFound(f"unknown {ID_COLUMN}: {player_id}")
+        return X[0]
+
+
+def _player_id(player: dict) -> str | None:
+    player_id = player.get(ID_COLUMN)
+    if player_id is None and isinstance(player.get("features"), dict):
+        player_id = player["features"].get(ID_COLUMN)
+    return None if player_id is None else str(player_id)
+
+
+def median_mismatches(
+    store_manifest: dict[str, Any],
+    feature_columns: list[str],
+    preprocessing_stats: dict[str, float],
+) -> dict[str, tuple[float | None, float | None]]:
+    """
+    Colonnes brutes du modèle dont la médiane d'imputation du store
+    diffère de celle du modèle : {colonne: (store, modèle)}.
+    """
+    store_medians = store_manifest.get("medians", {})
+    mismatches = {}
+    for col in required_raw_columns(feature_columns):
+        store_value, model_value = store_medians.get(col), preprocessing_stats.get(col)
+        if (
+            store_value is None
+            or model_value is None
+            or not np.isclose(store_value, model_value, rtol=1e-6, atol=0.0)
+        ):
+            mismatches[col] = (store_value, model_value)
+    return mismatches
+
+
+# -------------------------------------------------------------------------
+# Entry point
+# -------------------------------------------------------------------------
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Local NBA longevity scoring service")
+    parser.add_argument("--model-type", default="xgboost", choices=["xgboost", "catboost"])
+    parser.add_argument("--model-hash", default=None)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--max-batch-size", type=int, default=64)
+    parser.add_argument("--max-wait-ms", type=float, default=2.0)
+    parser.add_argument("--backend", default="native", choices=["native", "compiled"])
+    parser.add_argument("--cache-mb", type=float, default=64.0, help="0 disables the cache")
+    parser.add_argument("--cache-ttl-s", type=float, default=900.0)
+    parser.add_argument("--no-prediction-log", action="store_true")
+    parser.add_argument("--feature-store", default=None, help="player feature store directory")
+    parser.add_argument(
+        "--allow-median-mismatch",
+        action="store_true",
+        help="serve a feature store imputed with other medians than the model (warning only)",
+    )
+    args = parser.parse_args()
+
+    from nba_longevity.infrastructure.prediction_logging.prediction_log_factory import (
+        build_prediction_logger,
+    )
+
+    feature_store = None
+    if args.feature_store is not None:
+        from nba_longevity.infrastructure.feature_store.player_feature_store import (
+            PlayerFeatureStore,
+        )
+
+        feature_store = PlayerFeatureStore(args.feature_store)
+
+    config = get_config()
+    store = ModelArtifactStore(config.paths.artifacts_dir)
+    artifact = store.load(
+        model_hash=args.model_hash, model_type=args.model_type, backend=args.backend
+    )
+
+    if feature_store is not None:
+        source_model = feature_store.manifest.get("source", {}).get("medians_from_model")
+        mismatches: dict[str, Any] = median_mismatches(
+            feature_store.manifest,
+            artifact.manifest.feature_columns,
+            artifact.manifest.preprocessing_stats,
+        )
+        # Plan de types des calculs (float64 si absent : stores / modèles antérieurs)
+        store_plan = feature_store.manifest.get("dtype_plan", "float64")
+        model_plan = artifact.manifest.metadata.get("dtype_plan", "float64")
+        if store_plan != model_plan:
+            mismatches["dtype_plan"] = (store_plan, model_plan)
+        if mismatches:
+            message = (
+                f"Feature store imputation differs from model {artifact.content_hash[:12]} "
+                f"(store medians from {source_model or 'its own data'}): {mismatches}"
+            )
+            if not args.allow_median_mismatch:
+                raise SystemExit(f"{message}. Rebuild the store with --model-hash "
+                                 f"{artifact.content_hash} or pass --allow-median-mismatch")
+            app_logger.warning(f"⚠️ {message}")
+        elif source_model != artifact.content_hash:
+            app_logger.warning(
+                f"⚠️ Feature store built for model {str(source_model)[:12]}, serving "
+                f"{artifact.content_hash[:12]} (same imputation medians)"
+            )
+
+    server = ScoringServer(
+        predictor=build_predictor(
+            artifact,
+            cache=(
+                PredictionCache(max_bytes=int(args.cache_mb * 1024 ** 2), ttl_s=args.cache_ttl_s)
+                if args.cache_mb > 0 else None
+            ),
+        ),
+        model_info={
+            "type": artifact.manifest.model_type,
+            "backend": artifact.backend,
+            "hash": artifact.content_hash,
+            "feature_columns": artifact.manifest.feature_columns,
+        },
+        host=args.host,
+        port=args.port,
+        max_batch_size=args.max_batch_size,
+        max_wait_ms=args.max_wait_ms,
+        prediction_logger=None if args.no_prediction_log else build_prediction_logger(config),
+        feature_store=feature_store,
+    )
+
+    try:
+        asyncio.run(server.serve_forever())
+    except KeyboardInterrupt:
+        app_logger.info("Scoring service stopped")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+import threading
+from collections import deque
+from typing import Final, Sequence
+
+import numpy as np
+
+
+# Bornes supérieures des buckets (ms / nombre de joueurs par batch)
+LATENCY_BUCKETS_MS: Final[tuple[float, ...]] = (
+    0.5, 1.0, 2.0, 5.0, 10.0, 20.0, 50.0, 100.0, 250.0, 500.0, 1000.0,
+)
+BATCH_SIZE_BUCKETS: Final[tuple[int, ...]] = (1, 2, 4, 8, 16, 32, 64, 128, 256, 512)
+
+
+class Histogram:
+    """
+    Histogramme cumulable à buckets fixes (format type Prometheus : "le").
+    """
+
+    def __init__(self, buckets: Sequence[float]):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)  # dernier = +inf
+        self.count = 0
+        self.total = 0.0
+
+    def observe(self, value: float) -> None:
+        index = int(np.searchsorted(self.buckets, value, side="left"))
+        self.counts[index] += 1
+        self.count += 1
+        self.total += value
+
+    def snapshot(self) -> dict:
+        labels = [str(b) for b in self.buckets] + ["+inf"]
+        return {
+            "buckets": dict(zip(labels, self.counts)),
+            "count": self.count,
+            "mean": self.total / self.count if self.count else 0.0,
+        }
+
+
+class ServingMetrics:
+    """
+    Métriques du service de scoring.
+
+    - latence par requête : histogramme + p50 / p99 sur une fenêtre
+      glissante des dernières requêtes
+    - taille des micro-batchs : histogramme
+    """
+
+    def __init__(self, window: int = 10_000):
+        self._lock = threading.Lock()
+        self._recent_latencies_ms: deque[float] = deque(maxlen=window)
+        self.latency_ms = Histogram(LATENCY_BUCKETS_MS)
+        self.batch_size = Histogram(BATCH_SIZE_BUCKETS)
+        self.errors = 0
+
+    def observe_latency(self, seconds: float) -> None:
+        ms = seconds * 1000
+        with self._lock:
+            self._recent_latencies_ms.append(ms)
+            self.latency_ms.observe(ms)
+
+    def observe_batch(self, size: int) -> None:
+        with self._lock:
+            self.batch_size.observe(size)
+
+    def observe_error(self) -> None:
+        with self._lock:
+            self.errors += 1
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            recent = np.fromiter(self._recent_latencies_ms, dtype=np.float64)
+            latency = self.latency_ms.snapshot()
+            batch_size = self.batch_size.snapshot()
+            errors = self.errors
+
+        if recent.size:
+            p50, p99 = np.percentile(recent, [50, 99])
+        else:
+            p50 = p99 = 0.0
+
+        return {
+            "requests": latency["count"],
+            "errors": errors,
+            "latency_ms": {
+                "p50": float(p50),
+                "p99": float(p99),
+                "histogram": latency,
+            },
+            "batch_size": batch_size,
+        }
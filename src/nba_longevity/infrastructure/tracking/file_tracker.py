@@ -0,0 +1,80 @@
+import json
+import shutil
+import time
+import uuid
+from pathlib import Path
+from typing import Any, Mapping
+
+from nba_longevity.domain.ports.experiment_tracker_port import ExperimentTrackerPort
+
+
+class FileTracker(ExperimentTrackerPort):
+    """
+    Suivi d'expériences local, même organisation qu'un file store MLflow :
+
+    root/<experiment>/<run_id>/
+        meta.json
+        params/<clé>          (valeur)
+        metrics/<clé>         (lignes « timestamp_ms valeur step »)
+        artifacts/<fichier>
+
+    Utilisé quand mlflow n'est pas installé.
+    """
+
+    def __init__(self, root: str | Path, experiment_name: str):
+        self.experiment_dir = Path(root) / experiment_name
+        self.run_dir: Path | None = None
+        self._meta: dict[str, Any] = {}
+
+    def start_run(self, run_name: str) -> str:
+        run_id = uuid.uuid4().hex
+        self.run_dir = self.experiment_dir / run_id
+        for sub in ("params", "metrics", "artifacts"):
+            (self.run_dir / sub).mkdir(parents=True, exist_ok=True)
+
+        self._meta = {
+            "run_id": run_id,
+            "run_name": run_name,
+            "experiment": self.experiment_dir.name,
+            "start_time": _now_ms(),
+            "end_time": None,
+            "status": "RUNNING",
+        }
+        self._write_meta()
+        return run_id
+
+    def log_params(self, params: Mapping[str, Any]) -> None:
+        for key, value in params.items():
+            (self._run_dir() / "params" / _safe_key(key)).write_text(str(value))
+
+    def log_metrics(self, metrics: Mapping[str, float], step: int | None = None) -> None:
+        timestamp = _now_ms()
+        for key, value in metrics.items():
+            with open(self._run_dir() / "metrics" / _safe_key(key), "a") as f:
+                f.write(f"{timestamp} {float(value)} {step or 0}\n")
+
+    def log_artifact(self, path: str) -> None:
+        shutil.copy2(path, self._run_dir() / "artifacts" / Path(path).name)
+
+    def end_run(self, status: str = "FINISHED") -> None:
+        if self.run_dir is None:
+            return
+        self._meta.update(end_time=_now_ms(), status=status)
+        self._write_meta()
+        self.run_dir = None
+
+    def _run_dir(self) -> Path:
+        if self.run_dir is None:
+            raise RuntimeError("No active run: call start_run() first")
+        return self.run_dir
+
+    def _write_meta(self) -> None:
+        (self._run_dir() / "meta.json").write_text(json.dumps(self._meta, indent=2))
+
+
+def _safe_key(key: str) -> str:
+    return str(key).replace("/", "_")
+
+
+def _now_ms() -> int:
+    return int(time.time() * 1000)
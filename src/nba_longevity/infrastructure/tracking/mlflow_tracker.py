@@ -0,0 +1,32 @@
+from typing import Any, Mapping
+
+from nba_longevity.domain.ports.experiment_tracker_port import ExperimentTrackerPort
+
+
+class MlflowTracker(ExperimentTrackerPort):
+    """
+    Suivi d'expériences MLflow (tracking_uri / experiment_name de infra.yaml).
+    mlflow n'est importé qu'à la construction.
+    """
+
+    def __init__(self, tracking_uri: str, experiment_name: str):
+        import mlflow
+
+        self._mlflow = mlflow
+        mlflow.set_tracking_uri(tracking_uri)
+        mlflow.set_experiment(experiment_name)
+
+    def start_run(self, run_name: str) -> str:
+        return self._mlflow.start_run(run_name=run_name).info.run_id
+
+    def log_params(self, params: Mapping[str, Any]) -> None:
+        self._mlflow.log_params(dict(params))
+
+    def log_metrics(self, metrics: Mapping[str, float], step: int | None = None) -> None:
+        self._mlflow.log_metrics(dict(metrics), step=step)
+
+    def log_artifact(self, path: str) -> None:
+        self._mlflow.log_artifact(str(path))
+
+    def end_run(self, status: str = "FINISHED") -> None:
+        self._mlflow.end_run(status=status)
@@ -0,0 +1,29 @@
+from nba_longevity.application.bootstrap import app_logger
+from nba_longevity.domain.ports.experiment_tracker_port import ExperimentTrackerPort
+from nba_longevity.infrastructure.config.settings import InfraConfig
+
+
+def build_tracker(config: InfraConfig) -> ExperimentTrackerPort:
+    """
+    Tracker MLflow si mlflow est installé et MLFLOW_TRACKING_URI défini,
+    sinon file store local (artifacts_dir/tracking) de même organisation.
+    """
+    if config.mlflow.tracking_uri is None:
+        from nba_longevity.infrastructure.tracking.file_tracker import FileTracker
+
+        root = config.paths.artifacts_dir / "tracking"
+        app_logger.debug(f"MLFLOW_TRACKING_URI not set: local tracking store at {root}")
+
+        return FileTracker(root, config.mlflow.experiment_name)
+
+    try:
+        from nba_longevity.infrastructure.tracking.mlflow_tracker import MlflowTracker
+
+        return MlflowTracker(config.mlflow.tracking_uri, config.mlflow.experiment_name)
+    except ImportError:
+        from nba_longevity.infrastructure.tracking.file_tracker import FileTracker
+
+        root = config.paths.artifacts_dir / "tracking"
+        app_logger.debug(f"mlflow not installed: local tracking store at {root}")
+
+        return FileTracker(root, config.mlflow.experiment_name)
@@ -1,10 +1,15 @@
-from typing import Any, Sequence, Mapping
+from __future__ import annotations
 
-from pandas import DataFrame
-from catboost import CatBoostClassifier, Pool
+from typing import TYPE_CHECKING, Any, Sequence, Mapping
+
+import numpy as np
 
 from nba_longevity.application.bootstrap import app_logger
 from nba_longevity.domain.ports.trainer_port import TrainerPort
+from nba_longevity.infrastructure.dataset.pandas_dataset import to_feature_matrix
+
+if TYPE_CHECKING:
+    from catboost import Pool
 
 
 class CatBoostTrainer(TrainerPort):
@@ -12,9 +17,10 @@ class CatBoostTrainer(TrainerPort):
     Entraîneur CatBoost conforme au TrainerPort.
 
     Responsabilités :
-    - préparer les données (Pandas → Pool)
+    - préparer les données (matrice float32 → Pool)
     - lancer l'entraînement CatBoost
     - gérer la validation et le best model
+    - poursuivre un modèle existant (warm start, `init_model`)
     - retourner le modèle entraîné
     """
 
@@ -31,54 +37,101 @@ class CatBoostTrainer(TrainerPort):
         # =========================
         # 1. Chargement des données
         # =========================
-        train_df = DataFrame(list(train_rows))
-        valid_df = DataFrame(list(valid_rows))
+        X_train, y_train = to_feature_matrix(train_rows, feature_columns, target_column)
+        X_valid, y_valid = to_feature_matrix(valid_rows, feature_columns, target_column)
 
-        app_logger.debug(
-            f"Train shape: {train_df.shape} | "
-            f"Valid shape: {valid_df.shape}"
-        )
+        return self._fit(X_train, y_train, X_valid, y_valid, feature_columns, params)
+
+    def train_matrix(
+        self,
+        X: np.ndarray,
+        y: np.ndarray,
+        train_idx: np.ndarray,
+        valid_idx: np.ndarray,
+        feature_columns: Sequence[str],
+        params: dict[str, object],
+        init_model: Any = None,
+    ) -> Any:
+        app_logger.info("Démarrage de l'entraînement CatBoost (matrice partagée)")
 
         # =========================
-        # 2. Séparation X / y
+        # 1. Sous-ensembles de la matrice partagée
         # =========================
-        X_train = train_df[feature_columns]
-        y_train = train_df[target_column]
-        X_valid = valid_df[feature_columns]
-        y_valid = valid_df[target_column]
+        return self._fit(
+            X[train_idx], y[train_idx],
+            X[valid_idx], y[valid_idx],
+            feature_columns, params,
+            init_model=init_model,
+        )
+
+    def _fit(
+        self,
+        X_train: np.ndarray,
+        y_train: np.ndarray,
+        X_valid: np.ndarray,
+        y_valid: np.ndarray,
+        feature_columns: Sequence[str],
+        params: dict[str, object],
+        init_model: Any = None,
+    ) -> Any:
+        app_logger.debug(
+            f"Train shape: {X_train.shape} | "
+            f"Valid shape: {X_valid.shape}"
+        )
 
         app_logger.debug(
             f"Nombre de features utilisées: {len(feature_columns)}"
         )
 
         # =========================
-        # 3. Création des Pools CatBoost
+        # 2. Création des Pools CatBoost
         # =========================
-        train_pool = Pool(X_train, y_train)
-        valid_pool = Pool(X_valid, y_valid)
+        from catboost import Pool
+
+        train_pool = Pool(X_train, y_train, feature_names=list(feature_columns))
+        valid_pool = Pool(X_valid, y_valid, feature_names=list(feature_columns))
 
         app_logger.info("Pools CatBoost créés")
 
+        return self.train_pool(train_pool, valid_pool, params, init_model=init_model)
+
+    def train_pool(
+        self,
+        train_pool: Pool,
+        valid_pool: Pool,
+        params: dict[str, object],
+        init_model: Any = None,
+    ) -> Any:
+        """
+        Entraîne sur des Pools déjà construits (ex. tranches d'un Pool
+        quantifié une seule fois).
+
+        init_model : modèle existant (warm start) ; `iterations` arbres
+        sont ajoutés aux siens (le modèle d'origine n'est pas modifié).
+        """
         # =========================
-        # 4. Paramètres du modèle
+        # 3. Paramètres du modèle
         # =========================
         app_logger.info("Initialisation du CatBoostClassifier")
         app_logger.debug(f"Paramètres CatBoost : {params}")
 
+        from catboost import CatBoostClassifier
+
         model = CatBoostClassifier(**params)
 
         # =========================
-        # 5. Entraînement
+        # 4. Entraînement
         # =========================
         model.fit(
             train_pool,
             eval_set=valid_pool,
             use_best_model=True,
             verbose=False,
+            init_model=init_model,
         )
 
         # =========================
-        # 6. Résumé entraînement
+        # 5. Résumé entraînement
         # =========================
         best_iteration = model.get_best_iteration()
         best_score = model.get_best_score()
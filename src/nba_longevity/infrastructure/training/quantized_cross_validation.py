@@ -0,0 +1,191 @@
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Sequence, Tuple
+
+import numpy as np
+from sklearn.metrics import roc_auc_score
+
+from nba_longevity.application.bootstrap import app_logger
+from nba_longevity.infrastructure.tuning.parallel_trial_runner import THREAD_PARAMS
+
+
+@dataclass(frozen=True)
+class FoldResult:
+    fold: int
+    train_size: int
+    valid_size: int
+    auc: float
+    best_iteration: int
+    wall_time_s: float
+
+
+@dataclass(frozen=True)
+class CrossValidationResult:
+    folds: list[FoldResult]
+    oof_predictions: np.ndarray
+    oof_auc: float
+
+    @property
+    def mean_auc(self) -> float:
+        return float(np.mean([f.auc for f in self.folds]))
+
+    @property
+    def std_auc(self) -> float:
+        return float(np.std([f.auc for f in self.folds]))
+
+
+class QuantizedCrossValidator:
+    """
+    Validation croisée k-fold sur une matrice quantifiée une seule fois.
+
+    - XGBoost : QuantileDMatrix de référence sur toutes les lignes ; les
+      matrices de chaque fold réutilisent ses seuils (`ref=`), le sketch
+      de quantiles n'est calculé qu'une fois
+    - CatBoost : Pool quantifié une fois, chaque fold en est une tranche
+    - les folds sont entraînés en parallèle dans des threads (les
+      bibliothèques relâchent le GIL) ; les threads natifs sont répartis
+      entre folds pour ne pas sur-souscrire les cœurs
+    - retourne les métriques par fold et les prédictions out-of-fold
+    """
+
+    def __init__(
+        self,
+        model_type: str,
+        parallel_folds: int | None = None,
+        threads_per_fold: int | None = None,
+    ):
+        if model_type not in THREAD_PARAMS:
+            raise ValueError(f"Unknown model_type: {model_type}")
+
+        self.model_type = model_type
+        self.parallel_folds = parallel_folds
+        self.threads_per_fold = threads_per_fold
+
+    def run(
+        self,
+        X: np.ndarray,
+        y: np.ndarray,
+        folds: Sequence[Tuple[np.ndarray, np.ndarray]],
+        feature_columns: Sequence[str],
+        params: dict[str, Any],
+    ) -> CrossValidationResult:
+        n_cpus = os.cpu_count() or 1
+        parallel_folds = self.parallel_folds or min(len(folds), n_cpus)
+        threads_per_fold = self.threads_per_fold or max(1, n_cpus // parallel_folds)
+
+        params = dict(params)
+        params[THREAD_PARAMS[self.model_type]] = threads_per_fold
+
+        app_logger.info(
+            f"🔁 Cross-validation | model={self.model_type} | folds={len(folds)} | "
+            f"parallel_folds={parallel_folds} | threads_per_fold={threads_per_fold}"
+        )
+
+        # Quantification unique, puis matrices de chaque fold (thread principal)
+        start = time.perf_counter()
+        if self.model_type == "xgboost":
+            fold_data = self._xgboost_folds(X, y, folds, feature_columns, params)
+        else:
+            fold_data = self._catboost_folds(X, y, folds, feature_columns, params)
+        app_logger.info(f"Quantized fold matrices built in {time.perf_counter() - start:.3f}s")
+
+        with ThreadPoolExecutor(max_workers=parallel_folds, thread_name_prefix="cv-fold") as pool:
+            futures = [
+                pool.submit(self._train_fold, fold, train_data, valid_data, params)
+                for fold, (train_data, valid_data) in enumerate(fold_data)
+            ]
+            fitted = [future.result() for future in futures]
+
+        # Prédictions out-of-fold (chaque ligne prédite par le modèle qui ne l'a pas vue)
+        predictor_cls = self._predictor_cls()
+        oof_predictions = np.full(len(y), np.nan, dtype=np.float64)
+        fold_results = []
+        for fold, ((train_idx, valid_idx), (model, best_iteration, wall_time_s)) in enumerate(
+            zip(folds, fitted)
+        ):
+            predictor = predictor_cls(model, feature_columns=feature_columns)
+            oof_predictions[valid_idx] = predictor.predict_matrix(X[valid_idx])
+
+            fold_results.append(FoldResult(
+                fold=fold,
+                train_size=len(train_idx),
+                valid_size=len(valid_idx),
+                auc=float(roc_auc_score(y[valid_idx], oof_predictions[valid_idx])),
+                best_iteration=best_iteration,
+                wall_time_s=wall_time_s,
+            ))
+
+        covered = ~np.isnan(oof_predictions)
+        result = CrossValidationResult(
+            folds=fold_results,
+            oof_predictions=oof_predictions,
+            oof_auc=float(roc_auc_score(y[covered], oof_predictions[covered])),
+        )
+
+        app_logger.info(
+            f"Cross-validation done | mean_auc={result.mean_auc:.5f} ± {result.std_auc:.5f} | "
+            f"oof_auc={result.oof_auc:.5f}"
+        )
+
+        return result
+
+    def _xgboost_folds(self, X, y, folds, feature_columns, params):
+        from xgboost import QuantileDMatrix
+
+        max_bin = int(params.get("max_bin", 256))
+        feature_names = list(feature_columns)
+        reference = QuantileDMatrix(X, label=y, max_bin=max_bin, feature_names=feature_names)
+
+        fold_data = []
+        for train_idx, valid_idx in folds:
+            dtrain = QuantileDMatrix(
+                X[train_idx], label=y[train_idx],
+                ref=reference, max_bin=max_bin, feature_names=feature_names,
+            )
+            # L'évaluation doit référencer la matrice d'entraînement (mêmes seuils)
+            dvalid = QuantileDMatrix(
+                X[valid_idx], label=y[valid_idx],
+                ref=dtrain, max_bin=max_bin, feature_names=feature_names,
+            )
+            fold_data.append((dtrain, dvalid))
+
+        return fold_data
+
+    def _catboost_folds(self, X, y, folds, feature_columns, params):
+        from catboost import Pool
+
+        pool = Pool(X, y, feature_names=list(feature_columns))
+        pool.quantize(border_count=int(params.get("border_count", 254)))
+
+        return [
+            (pool.slice(train_idx.tolist()), pool.slice(valid_idx.tolist()))
+            for train_idx, valid_idx in folds
+        ]
+
+    def _train_fold(self, fold: int, train_data, valid_data, params) -> tuple[Any, int, float]:
+        start = time.perf_counter()
+
+        if self.model_type == "xgboost":
+            from nba_longevity.infrastructure.training.xgboost_trainer import XGBoostTrainer
+
+            model = XGBoostTrainer().train_dmatrix(train_data, valid_data, params)
+            best_iteration = int(model.best_iteration)
+        else:
+            from nba_longevity.infrastructure.training.catboost_trainer import CatBoostTrainer
+
+            model = CatBoostTrainer().train_pool(train_data, valid_data, params)
+            best_iteration = int(model.get_best_iteration())
+
+        return model, best_iteration, time.perf_counter() - start
+
+    def _predictor_cls(self):
+        if self.model_type == "xgboost":
+            from nba_longevity.infrastructure.inference.xgboost_predictor import XGBoostPredictor
+
+            return XGBoostPredictor
+
+        from nba_longevity.infrastructure.inference.catboost_predictor import CatBoostPredictor
+
+        return CatBoostPredictor
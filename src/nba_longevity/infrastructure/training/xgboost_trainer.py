@@ -1,10 +1,15 @@
-from typing import Any, Sequence, Mapping
+from __future__ import annotations
 
-from pandas import DataFrame
-from xgboost import DMatrix, train
+from typing import TYPE_CHECKING, Any, Sequence, Mapping
+
+import numpy as np
 
 from nba_longevity.application.bootstrap import app_logger
 from nba_longevity.domain.ports.trainer_port import TrainerPort
+from nba_longevity.infrastructure.dataset.pandas_dataset import to_feature_matrix
+
+if TYPE_CHECKING:
+    from xgboost import DMatrix
 
 
 class XGBoostTrainer(TrainerPort):
@@ -12,9 +17,10 @@ class XGBoostTrainer(TrainerPort):
     Entraîneur XGBoost conforme au TrainerPort.
 
     Responsabilités :
-    - préparer les données (Pandas → DMatrix)
+    - préparer les données (matrice float32 → DMatrix)
     - lancer l'entraînement XGBoost
     - gérer l'early stopping
+    - poursuivre un booster existant (warm start, `init_model`)
     - retourner le booster entraîné
     """
 
@@ -31,37 +37,84 @@ class XGBoostTrainer(TrainerPort):
         # =========================
         # 1. Chargement des données
         # =========================
-        train_df = DataFrame(list(train_rows))
-        valid_df = DataFrame(list(valid_rows))
+        X_train, y_train = to_feature_matrix(train_rows, feature_columns, target_column)
+        X_valid, y_valid = to_feature_matrix(valid_rows, feature_columns, target_column)
 
-        app_logger.debug(
-            f"Train shape: {train_df.shape} | "
-            f"Valid shape: {valid_df.shape}"
-        )
+        return self._fit(X_train, y_train, X_valid, y_valid, feature_columns, params)
+
+    def train_matrix(
+        self,
+        X: np.ndarray,
+        y: np.ndarray,
+        train_idx: np.ndarray,
+        valid_idx: np.ndarray,
+        feature_columns: Sequence[str],
+        params: dict[str, object],
+        init_model: Any = None,
+    ) -> Any:
+        app_logger.info("Démarrage de l'entraînement XGBoost (matrice partagée)")
 
         # =========================
-        # 2. Séparation X / y
+        # 1. Sous-ensembles de la matrice partagée
         # =========================
-        X_train = train_df[feature_columns]
-        y_train = train_df[target_column]
-        X_valid = valid_df[feature_columns]
-        y_valid = valid_df[target_column]
+        return self._fit(
+            X[train_idx], y[train_idx],
+            X[valid_idx], y[valid_idx],
+            feature_columns, params,
+            init_model=init_model,
+        )
+
+    def _fit(
+        self,
+        X_train: np.ndarray,
+        y_train: np.ndarray,
+        X_valid: np.ndarray,
+        y_valid: np.ndarray,
+        feature_columns: Sequence[str],
+        params: dict[str, object],
+        init_model: Any = None,
+    ) -> Any:
+        app_logger.debug(
+            f"Train shape: {X_train.shape} | "
+            f"Valid shape: {X_valid.shape}"
+        )
 
         app_logger.debug(
             f"Nombre de features utilisées: {len(feature_columns)}"
         )
 
         # =========================
-        # 3. Création des DMatrix
+        # 2. Création des DMatrix
         # =========================
-        dtrain = DMatrix(X_train, label=y_train)
-        dvalid = DMatrix(X_valid, label=y_valid)
+        from xgboost import DMatrix
+
+        dtrain = DMatrix(X_train, label=y_train, feature_names=list(feature_columns))
+        dvalid = DMatrix(X_valid, label=y_valid, feature_names=list(feature_columns))
 
         app_logger.info("DMatrix XGBoost créées")
 
+        return self.train_dmatrix(dtrain, dvalid, params, init_model=init_model)
+
+    def train_dmatrix(
+        self,
+        dtrain: DMatrix,
+        dvalid: DMatrix,
+        params: dict[str, object],
+        init_model: Any = None,
+    ) -> Any:
+        """
+        Entraîne sur des DMatrix déjà construites (ex. QuantileDMatrix
+        partageant les seuils de quantification d'une matrice de référence).
+
+        init_model : booster existant (warm start) ; `num_boost_round`
+        rounds sont ajoutés à ses arbres retenus par l'early stopping
+        (jusqu'à `best_iteration`, comme le prédicteur servi) ; le booster
+        d'origine n'est pas modifié.
+        """
         # =========================
-        # 4. Paramètres d'entraînement
+        # 3. Paramètres d'entraînement
         # =========================
+        params = dict(params)
         num_boost_round = int(params.pop("num_boost_round", 500))
         early_stopping_rounds = int(params.pop("early_stopping_rounds", 50))
 
@@ -74,8 +127,17 @@ class XGBoostTrainer(TrainerPort):
         app_logger.debug(f"Paramètres XGBoost complets : {params}")
 
         # =========================
-        # 5. Entraînement
+        # 4. Entraînement
         # =========================
+        from xgboost import train
+
+        if init_model is not None:
+            # Les arbres au-delà de best_iteration ne sont pas servis :
+            # on repart du modèle servi, pas du booster complet
+            best_iteration = init_model.attr("best_iteration")
+            if best_iteration is not None:
+                init_model = init_model[: int(best_iteration) + 1]
+
         booster = train(
             params=params,
             dtrain=dtrain,
@@ -83,10 +145,11 @@ class XGBoostTrainer(TrainerPort):
             evals=[(dtrain, "train"), (dvalid, "valid")],
             early_stopping_rounds=early_stopping_rounds,
             verbose_eval=False,
+            xgb_model=init_model,
         )
 
         # =========================
-        # 6. Résumé entraînement
+        # 5. Résumé entraînement
         # =========================
         app_logger.info(
             f"Entraînement terminé | "
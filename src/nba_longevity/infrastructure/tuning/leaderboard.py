@@ -0,0 +1,63 @@
+import json
+from pathlib import Path
+from typing import Any, Sequence
+
+import pandas as pd
+
+from nba_longevity.application.bootstrap import app_logger
+from nba_longevity.application.tuning.successive_halving import TrialResult, rank_trials
+
+
+def build_leaderboard(results: Sequence[TrialResult]) -> pd.DataFrame:
+    """
+    Un essai par ligne, dans l'ordre de `rank_trials` (score décroissant,
+    plus petit budget à égalité, essais en échec en dernier).
+    """
+    records = [
+        {
+            "trial_id": r.spec.trial_id,
+            "config_id": r.spec.config_id,
+            "bracket": r.spec.bracket,
+            "rung": r.spec.rung,
+            "resource": r.spec.resource,
+            "score": r.score,
+            "best_iteration": r.best_iteration,
+            "wall_time_s": round(r.wall_time_s, 4),
+            "error": r.error,
+            "params": json.dumps(r.spec.params, sort_keys=True),
+        }
+        for r in rank_trials(results)
+    ]
+
+    leaderboard = pd.DataFrame.from_records(records)
+    if leaderboard.empty:
+        return leaderboard
+
+    leaderboard.insert(0, "rank", range(1, len(leaderboard) + 1))
+
+    return leaderboard
+
+
+def write_leaderboard(
+    results: Sequence[TrialResult],
+    output_dir: str | Path,
+    summary: dict[str, Any],
+) -> Path:
+    """
+    Écrit leaderboard.csv (tous les essais) et summary.json
+    (meilleure configuration, temps total, paramètres de la recherche).
+    """
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    leaderboard = build_leaderboard(results)
+    leaderboard_path = output_dir / "leaderboard.csv"
+    leaderboard.to_csv(leaderboard_path, index=False)
+
+    (output_dir / "summary.json").write_text(
+        json.dumps(summary, indent=2, sort_keys=True, default=str)
+    )
+
+    app_logger.info(f"Leaderboard written | path={leaderboard_path} | trials={len(leaderboard)}")
+
+    return leaderboard_path
@@ -0,0 +1,211 @@
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Sequence
+
+import numpy as np
+
+from nba_longevity.application.bootstrap import app_logger
+from nba_longevity.application.tuning.successive_halving import TrialSpec, TrialResult
+from nba_longevity.infrastructure.parallel.shared_array import SharedArray, SharedArrayHandle
+
+
+# Paramètre « nombre de threads » propre à chaque bibliothèque
+THREAD_PARAMS = {
+    "xgboost": "nthread",
+    "catboost": "thread_count",
+}
+
+# Variables lues par les runtimes OpenMP / BLAS au chargement
+_THREAD_ENV_VARS = (
+    "OMP_NUM_THREADS",
+    "OPENBLAS_NUM_THREADS",
+    "MKL_NUM_THREADS",
+)
+
+# État du worker (un seul contexte d'essais par processus)
+_WORKER: dict[str, Any] = {}
+
+
+class ParallelTrialRunner:
+    """
+    Exécute des essais d'entraînement dans un pool de processus.
+
+    - la matrice de features, la cible et les indices train / validation
+      sont placés une seule fois en mémoire partagée ; les workers s'y
+      attachent sans recopie ni sérialisation
+    - chaque essai est limité à `threads_per_trial` threads et le pool
+      compte `cpu_count // threads_per_trial` workers : pas de
+      sur-souscription des cœurs
+    - démarrage « spawn » : aucun runtime OpenMP hérité par fork
+    - score : AUC de validation du modèle entraîné (early stopping inclus)
+    """
+
+    def __init__(
+        self,
+        model_type: str,
+        X: np.ndarray,
+        y: np.ndarray,
+        train_idx: np.ndarray,
+        valid_idx: np.ndarray,
+        feature_columns: Sequence[str],
+        base_params: dict[str, Any],
+        resource_param: str,
+        n_workers: int | None = None,
+        threads_per_trial: int = 1,
+    ):
+        if model_type not in THREAD_PARAMS:
+            raise ValueError(f"Unknown model_type: {model_type}")
+        if threads_per_trial < 1:
+            raise ValueError(f"threads_per_trial doit être >= 1 : {threads_per_trial}")
+
+        self.model_type = model_type
+        self.feature_columns = list(feature_columns)
+        self.base_params = dict(base_params)
+        self.resource_param = resource_param
+        self.threads_per_trial = threads_per_trial
+        self.n_workers = n_workers or max(1, (os.cpu_count() or 1) // threads_per_trial)
+
+        self._arrays = {
+            "X": X,
+            "y": y,
+            "train_idx": train_idx,
+            "valid_idx": valid_idx,
+        }
+        self._shared: dict[str, SharedArray] = {}
+        self._pool: ProcessPoolExecutor | None = None
+
+    def start(self) -> None:
+        if self._pool is not None:
+            return
+
+        self._shared = {name: SharedArray(array) for name, array in self._arrays.items()}
+        handles = {name: shared.handle for name, shared in self._shared.items()}
+        shared_bytes = sum(shared.array.nbytes for shared in self._shared.values())
+
+        self._pool = ProcessPoolExecutor(
+            max_workers=self.n_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(handles, self.model_type, self.feature_columns, self.threads_per_trial),
+        )
+
+        app_logger.info(
+            f"Trial pool started | workers={self.n_workers} | "
+            f"threads_per_trial={self.threads_per_trial} | shared={shared_bytes} bytes"
+        )
+
+    def close(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown(wait=True, cancel_futures=True)
+            self._pool = None
+        for shared in self._shared.values():
+            shared.close()
+        self._shared = {}
+
+    def __enter__(self) -> "ParallelTrialRunner":
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def run(self, specs: Sequence[TrialSpec]) -> list[TrialResult]:
+        """
+        Évalue une vague d'essais en parallèle (résultats dans l'ordre des specs).
+        """
+        self.start()
+
+        futures = [
+            self._pool.submit(_run_trial, spec, self.trial_params(spec))
+            for spec in specs
+        ]
+        results = [future.result() for future in futures]
+
+        for result in results:
+            if result.error is not None:
+                app_logger.warning(
+                    f"Trial {result.spec.trial_id} failed | {result.error}"
+                )
+
+        return results
+
+    def trial_params(self, spec: TrialSpec) -> dict[str, Any]:
+        """
+        Paramètres complets d'un essai : base + configuration + budget + threads.
+        """
+        params = {**self.base_params, **spec.params}
+        params[self.resource_param] = spec.resource
+        params[THREAD_PARAMS[self.model_type]] = self.threads_per_trial
+        return params
+
+
+def _init_worker(
+    handles: dict[str, SharedArrayHandle],
+    model_type: str,
+    feature_columns: list[str],
+    threads_per_trial: int,
+) -> None:
+    # Avant tout import de xgboost / catboost dans le worker
+    for var in _THREAD_ENV_VARS:
+        os.environ[var] = str(threads_per_trial)
+
+    for name, handle in handles.items():
+        shm, array = handle.attach()
+        _WORKER[f"{name}_shm"] = shm
+        _WORKER[name] = array
+
+    _WORKER["model_type"] = model_type
+    _WORKER["feature_columns"] = feature_columns
+
+
+def _run_trial(spec: TrialSpec, params: dict[str, Any]) -> TrialResult:
+    start = time.perf_counter()
+    try:
+        score, best_iteration = _fit_and_score(params)
+    except Exception as exc:  # un essai en échec ne doit pas arrêter la recherche
+        return TrialResult(
+            spec=spec,
+            score=float("nan"),
+            best_iteration=None,
+            wall_time_s=time.perf_counter() - start,
+            error=f"{type(exc).__name__}: {exc}",
+        )
+
+    return TrialResult(
+        spec=spec,
+        score=score,
+        best_iteration=best_iteration,
+        wall_time_s=time.perf_counter() - start,
+    )
+
+
+def _fit_and_score(params: dict[str, Any]) -> tuple[float, int]:
+    from sklearn.metrics import roc_auc_score
+
+    X, y = _WORKER["X"], _WORKER["y"]
+    train_idx, valid_idx = _WORKER["train_idx"], _WORKER["valid_idx"]
+    feature_columns = _WORKER["feature_columns"]
+
+    if _WORKER["model_type"] == "xgboost":
+        from nba_longevity.infrastructure.training.xgboost_trainer import XGBoostTrainer
+        from nba_longevity.infrastructure.inference.xgboost_predictor import XGBoostPredictor
+
+        model = XGBoostTrainer().train_matrix(
+            X, y, train_idx, valid_idx, feature_columns, params
+        )
+        predictor = XGBoostPredictor(model, feature_columns=feature_columns)
+        best_iteration = int(model.best_iteration)
+    else:
+        from nba_longevity.infrastructure.training.catboost_trainer import CatBoostTrainer
+        from nba_longevity.infrastructure.inference.catboost_predictor import CatBoostPredictor
+
+        model = CatBoostTrainer().train_matrix(
+            X, y, train_idx, valid_idx, feature_columns, params
+        )
+        predictor = CatBoostPredictor(model, feature_columns=feature_columns)
+        best_iteration = int(model.get_best_iteration())
+
+    proba = predictor.predict_matrix(X[valid_idx])
+    return float(roc_auc_score(y[valid_idx], proba)), best_iteration
@@ -0,0 +1,73 @@
+"""
+Parité des backends Pandas / Spark, Spark en mode local.
+
+Ignoré si pyspark ou une JVM ne sont pas disponibles.
+"""
+
+import os
+import shutil
+
+import pytest
+
+pytest.importorskip("pyspark")
+if shutil.which("java") is None and not os.getenv("JAVA_HOME"):
+    pytest.skip("Spark local mode needs a JVM", allow_module_level=True)
+
+from nba_longevity.application.bootstrap import get_config
+from nba_longevity.application.training.run_spark_feature_preparation import build_spark_session
+from nba_longevity.domain.features.feature_spaces import FEATURE_SPACE_MINIMAL
+from nba_longevity.infrastructure.benchmarks.backend_parity import check_backend_parity
+from nba_longevity.infrastructure.benchmarks.synthetic_players import write_synthetic_csv
+
+
+@pytest.fixture(scope="module")
+def spark():
+    session = build_spark_session("nba-longevity-parity-test", master="local[2]")
+    yield session
+    session.stop()
+
+
+def test_parity_on_raw_dataset(spark):
+    report = check_backend_parity(get_config().paths.raw_data, spark=spark)
+
+    assert report.ok, report.failures
+    assert report.rows_spark == report.rows_pandas > 0
+
+
+def test_parity_on_synthetic_dataset_minimal_space(spark, tmp_path):
+    csv_path = write_synthetic_csv(tmp_path / "players.csv", n_rows=5_000, seed=7)
+
+    report = check_backend_parity(csv_path, feature_columns=FEATURE_SPACE_MINIMAL, spark=spark)
+
+    assert report.ok, report.failures
+    assert report.rows_spark == report.rows_pandas > 0
+
+
+def test_scoring_preprocessing_keeps_unlabelled_rows(spark, tmp_path):
+    import pandas as pd
+
+    from nba_longevity.domain.preprocessing.preprocessing_rules import NUMERIC_COLUMNS, TARGET_COLUMN
+    from nba_longevity.infrastructure.dataset.spark_dataset_loader import SparkDatasetLoader
+    from nba_longevity.infrastructure.preprocessing.spark_preprocessing_adapter import (
+        SparkPreprocessingAdapter,
+    )
+
+    csv_path = write_synthetic_csv(tmp_path / "players.csv", n_rows=500, seed=11)
+    frame = pd.read_csv(csv_path)
+    numeric = frame[NUMERIC_COLUMNS].apply(pd.to_numeric, errors="coerce")
+    medians = numeric.median().to_dict()
+    expected_rows = int((numeric["MinutesPerGame"].fillna(medians["MinutesPerGame"]) > 0).sum())
+
+    preprocessor = SparkPreprocessingAdapter(medians=medians, target_column=None)
+
+    # Fichier sans colonne cible : pas d'AnalysisException
+    unlabelled_path = tmp_path / "unlabelled.csv"
+    frame.drop(columns=[TARGET_COLUMN]).to_csv(unlabelled_path, index=False)
+    unlabelled = SparkDatasetLoader(spark, str(unlabelled_path), fmt="csv").load()
+    assert preprocessor.preprocess(unlabelled)._df.count() == expected_rows
+
+    # Labels nuls : les lignes sont scorées, pas écartées
+    null_labels_path = tmp_path / "null_labels.csv"
+    frame.assign(**{TARGET_COLUMN: None}).to_csv(null_labels_path, index=False)
+    null_labels = SparkDatasetLoader(spark, str(null_labels_path), fmt="csv").load()
+    assert preprocessor.preprocess(null_labels)._df.count() == expected_rows
@@ -0,0 +1,62 @@
+"""
+Warm start XGBoost : la mise à jour incrémentale repart du modèle servi.
+
+Ignoré si xgboost n'est pas disponible.
+"""
+
+import numpy as np
+import pytest
+
+pytest.importorskip("xgboost")
+
+from nba_longevity.application.training.warm_start import validation_proba
+from nba_longevity.infrastructure.training.xgboost_trainer import XGBoostTrainer
+
+FEATURES = [f"f{i}" for i in range(6)]
+PARAMS = {
+    "objective": "binary:logistic",
+    "eval_metric": "auc",
+    "max_depth": 3,
+    "eta": 0.3,
+    "seed": 0,
+    "num_boost_round": 200,
+    "early_stopping_rounds": 5,
+}
+
+
+def _noisy_dataset(n_rows: int, seed: int) -> tuple[np.ndarray, np.ndarray]:
+    rng = np.random.default_rng(seed)
+    X = rng.normal(size=(n_rows, len(FEATURES))).astype(np.float32)
+    # Signal faible + bruit fort : l'early stopping s'arrête bien avant la fin
+    logits = 0.8 * X[:, 0] - 0.5 * X[:, 1] + rng.normal(scale=2.0, size=n_rows)
+    return X, (logits > 0).astype(np.float32)
+
+
+def test_incremental_update_continues_from_served_trees():
+    X, y = _noisy_dataset(3_000, seed=1)
+    trainer = XGBoostTrainer()
+    idx = np.arange(len(y))
+    parent_train, valid, new_rows = idx[:1_500], idx[1_500:2_000], idx[2_000:]
+
+    parent = trainer.train_matrix(X, y, parent_train, valid, FEATURES, dict(PARAMS))
+    best_iteration = int(parent.attr("best_iteration"))
+    assert parent.num_boosted_rounds() > best_iteration + 1
+
+    child = trainer.train_matrix(
+        X, y, new_rows, valid, FEATURES,
+        {**PARAMS, "num_boost_round": 10, "early_stopping_rounds": 10},
+        init_model=parent,
+    )
+
+    # Prédictions servies du parent (iteration_range jusqu'à best_iteration)
+    served = validation_proba(parent, "xgboost", X, valid, FEATURES)
+
+    from xgboost import DMatrix
+
+    first_trees = child.predict(
+        DMatrix(X[valid], feature_names=FEATURES),
+        iteration_range=(0, best_iteration + 1),
+    )
+    np.testing.assert_allclose(first_trees, served, rtol=1e-6)
+    # Arbres écartés par l'early stopping du parent : absents de l'enfant
+    assert child.num_boosted_rounds() == best_iteration + 1 + 10